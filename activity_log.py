@@ -0,0 +1,193 @@
+"""
+ActivityLog: Satır başına bir JSON kaydı tutan, yalnızca sona ekleyen aktivite logu (JSONL).
+- log(): kayıt belleğe eklenir, buffer_size dolunca ya da flush_interval sonunda tek
+  seferde diske yazılır (O(1), dosyanın tamamı okunmaz / yeniden yazılmaz)
+- Yazma O_APPEND ile tek write çağrısıdır; oturumlar (thread'ler) ve süreçler arası satırlar karışmaz.
+  Kısmi yazmada kalan baytlar yeniden yazılır; yazma hatasında kayıtlar tamponda kalır ve yeniden denenir
+- Boyut sınırı aşılınca dosya döndürülür: activity_log.jsonl → .1 → .2 ... (backup_count kadar)
+- query(): tür, kullanıcı ve zaman aralığına göre sorgu (döndürülmüş dosyalar dahil)
+- Eski activity_log.json varsa ilk kullanımda JSONL'e aktarılır
+"""
+import atexit
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+DEFAULT_LOG_FILE = "activity_log.jsonl"
+LEGACY_LOG_FILE = "activity_log.json"
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+DEFAULT_BUFFER_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+def _as_iso(value) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+class ActivityLog:
+    """Tamponlu, döndürülen JSONL aktivite logu"""
+
+    def __init__(self, path: str = DEFAULT_LOG_FILE, max_bytes: int = DEFAULT_MAX_BYTES,
+                 backup_count: int = DEFAULT_BACKUP_COUNT, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, legacy_path: Optional[str] = LEGACY_LOG_FILE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+        if legacy_path and os.path.exists(legacy_path) and not os.path.exists(path):
+            self._migrate(legacy_path)
+
+    def _migrate(self, legacy_path: str):
+        """Eski JSON dizisi biçimindeki logu JSONL'e aktar (eski dosya .bak olarak kalır)"""
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            lines = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+            os.replace(legacy_path, legacy_path + ".bak")
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def log(self, activity_type: str, description: str, user_id: Optional[str] = None, **extra) -> bool:
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "type": activity_type,
+            "description": description,
+            "user_id": user_id or "system"
+        }
+        if extra:
+            entry.update(extra)
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) < self.buffer_size:
+                self._schedule_flush()
+                return True
+        return self.flush()
+
+    def _schedule_flush(self):
+        if self._timer is None and self.flush_interval > 0:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Tampondaki kayıtları tek yazmada dosyaya ekle"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer:
+                return True
+            entries = self._buffer
+            payload = memoryview("".join(entries).encode("utf-8"))
+            self._buffer = []
+
+            written = 0
+            try:
+                self._rotate_if_needed()
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    while written < len(payload):  # Kısmi yazmada kalan baytlar yeniden yazılır
+                        written += os.write(fd, payload[written:])
+                finally:
+                    os.close(fd)
+                return True
+            except OSError:
+                # Yazılamayan kayıtlar tamponun başına döner; sonraki flush yeniden dener
+                if written:
+                    entries = [bytes(payload[written:]).decode("utf-8", "replace")]
+                self._buffer[:0] = entries
+                self._schedule_flush()
+                return False
+
+    def _rotate_if_needed(self):
+        try:
+            if os.path.getsize(self.path) < self.max_bytes:
+                return
+        except OSError:
+            return
+
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _files(self) -> List[str]:
+        """Eskiden yeniye log dosyaları"""
+        files = [f"{self.path}.{index}" for index in range(self.backup_count, 0, -1)]
+        files.append(self.path)
+        return [path for path in files if os.path.exists(path)]
+
+    def iter_entries(self) -> Iterator[dict]:
+        """Tüm kayıtlar, eskiden yeniye (bozuk / yarım satırlar atlanır)"""
+        self.flush()
+        for path in self._files():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+            except OSError:
+                continue
+
+    def query(self, activity_type: Optional[str] = None, user_id: Optional[str] = None,
+              start=None, end=None, limit: Optional[int] = None) -> List[dict]:
+        """Filtrelere uyan kayıtlar, en yenisi başta (start / end: datetime ya da ISO metin)"""
+        start_iso, end_iso = _as_iso(start), _as_iso(end)
+        matches = []
+        for entry in self.iter_entries():
+            timestamp = entry.get("timestamp", "")
+            if activity_type is not None and entry.get("type") != activity_type:
+                continue
+            if user_id is not None and entry.get("user_id") != user_id:
+                continue
+            if start_iso is not None and timestamp < start_iso:
+                continue
+            if end_iso is not None and timestamp > end_iso:
+                continue
+            matches.append(entry)
+        matches.reverse()
+        return matches[:limit] if limit is not None else matches
+
+
+_default_log: Optional[ActivityLog] = None
+_default_lock = threading.Lock()
+
+
+def default_log() -> ActivityLog:
+    """Süreç genelinde paylaşılan log (tüm Streamlit oturumları aynı tamponu kullanır)"""
+    global _default_log
+    with _default_lock:
+        if _default_log is None:
+            _default_log = ActivityLog(os.environ.get("BTAG_ACTIVITY_LOG", DEFAULT_LOG_FILE))
+            atexit.register(_default_log.flush)
+        return _default_log
+
+
+def log_activity(activity_type: str, description: str, user_id: Optional[str] = None, **extra) -> bool:
+    return default_log().log(activity_type, description, user_id, **extra)
+
+
+def query_activity(**filters) -> List[dict]:
+    return default_log().query(**filters)
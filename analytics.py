@@ -0,0 +1,287 @@
+"""
+Analytics: BTag sayfalarının Streamlit'ten bağımsız hesaplamaları.
+- dashboard_summary: bu ayın toplamları, pasif üyeler, son 7 günün istatistikleri
+- build_report / member_report_rows: tarih aralığı raporu ve üye bazında özet
+- member_statistics / daily_summary / top_members: İstatistik sayfası
+- filter_members / sort_members: Üye listesinde arama, durum filtresi ve sıralama
+Sayfalar ve benchmarks/ paketi aynı fonksiyonları kullanır.
+"""
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+import leaderboard
+import perf
+from text_normalize import fold
+
+PASSIVE_DAYS = 7  # Bu kadar günden fazla yatırım yapmayan üye pasif sayılır
+
+
+def parse_day(date_str: str) -> date:
+    """'YYYY-MM-DD' anahtarını tarihe çevir"""
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
+def sorted_dates(daily_data: dict) -> List[str]:
+    """daily_data tarih anahtarlarını kronolojik sırala"""
+    return sorted(daily_data.keys(), key=parse_day)
+
+
+def _dates_in_range(daily_data: dict, start_date: date, end_date: date):
+    for date_str in daily_data:
+        if start_date <= parse_day(date_str) <= end_date:
+            yield date_str
+
+
+@perf.timed("aggregation.dashboard_summary")
+def dashboard_summary(daily_data: dict, members: List[dict], month: Optional[str] = None,
+                      recent_days: int = 7) -> dict:
+    """Ana sayfa metrikleri (sadece verilen - aktif - üyelerin kayıtları sayılır)"""
+    month = month or datetime.now().strftime("%Y-%m")
+    active_member_ids = {str(m['member_id']) for m in members}
+
+    total_deposits = 0
+    total_withdrawals = 0
+    for date_str, btag_data in daily_data.items():
+        if date_str.startswith(month):
+            for records in btag_data.values():
+                for record in records:
+                    if str(record.get('member_id', '')) in active_member_ids:
+                        total_deposits += record.get('total_deposits', 0)
+                        total_withdrawals += record.get('total_withdrawals', 0)
+
+    passive_list = [m for m in members if m.get('days_without_deposit', 0) > PASSIVE_DAYS]
+
+    daily_stats = []
+    for date_str in sorted_dates(daily_data)[-recent_days:]:
+        date_deposits = 0
+        date_withdrawals = 0
+        date_deposit_count = 0
+        date_withdrawal_count = 0
+
+        for records in daily_data[date_str].values():
+            for record in records:
+                if str(record.get('member_id', '')) in active_member_ids:
+                    date_deposits += record.get('total_deposits', 0)
+                    date_withdrawals += record.get('total_withdrawals', 0)
+                    date_deposit_count += record.get('deposit_count', 0)
+                    date_withdrawal_count += record.get('withdrawal_count', 0)
+
+        daily_stats.append({
+            'Tarih': date_str,
+            'Yatırım Adedi': date_deposit_count,
+            'Yatırım Miktarı': date_deposits,
+            'Çekim Adedi': date_withdrawal_count,
+            'Çekim Miktarı': date_withdrawals,
+            'Net': date_deposits - date_withdrawals
+        })
+
+    return {
+        'total_members': len(members),
+        'passive_members': len(passive_list),
+        'active_members': len(members) - len(passive_list),
+        'passive_list': passive_list,
+        'total_deposits': total_deposits,
+        'total_withdrawals': total_withdrawals,
+        'total_net': total_deposits - total_withdrawals,
+        'daily_stats': daily_stats
+    }
+
+
+@perf.timed("aggregation.build_report")
+def build_report(daily_data: dict, start_date: date, end_date: date) -> dict:
+    """Tarih aralığındaki detay satırları, üye bazında özet ve toplamlar"""
+    filtered_data = []
+    member_summary = {}
+    total_deposits = 0
+    total_withdrawals = 0
+
+    for date_str in _dates_in_range(daily_data, start_date, end_date):
+        for btag, records in daily_data[date_str].items():
+            for record in records:
+                member_id = str(record.get('member_id', ''))
+                deposits = record.get('total_deposits', 0)
+                withdrawals = record.get('total_withdrawals', 0)
+                deposit_count = record.get('deposit_count', 0)
+                withdrawal_count = record.get('withdrawal_count', 0)
+
+                filtered_data.append({
+                    'Tarih': date_str,
+                    'BTag': btag,
+                    'Üye ID': member_id,
+                    'Kullanıcı Adı': record.get('username', ''),
+                    'Müşteri Adı': record.get('customer_name', ''),
+                    'Yatırım Adedi': deposit_count,
+                    'Yatırım': deposits,
+                    'Çekim Adedi': withdrawal_count,
+                    'Çekim': withdrawals,
+                    'Net': deposits - withdrawals
+                })
+
+                total_deposits += deposits
+                total_withdrawals += withdrawals
+
+                summary = member_summary.get(member_id)
+                if summary is None:
+                    summary = member_summary[member_id] = {
+                        'username': record.get('username', ''),
+                        'customer_name': record.get('customer_name', ''),
+                        'deposits': 0,
+                        'withdrawals': 0,
+                        'deposit_count': 0,
+                        'withdrawal_count': 0
+                    }
+                summary['deposits'] += deposits
+                summary['withdrawals'] += withdrawals
+                summary['deposit_count'] += deposit_count
+                summary['withdrawal_count'] += withdrawal_count
+
+    return {
+        'rows': filtered_data,
+        'member_summary': member_summary,
+        'total_days': (end_date - start_date).days + 1,
+        'total_deposits': total_deposits,
+        'total_withdrawals': total_withdrawals,
+        'total_net': total_deposits - total_withdrawals
+    }
+
+
+def member_report_rows(member_summary: Dict[str, dict]) -> List[dict]:
+    """Üye bazında özet tablosu satırları (Net'e göre azalan)"""
+    member_report = []
+    for member_id, data in member_summary.items():
+        member_report.append({
+            'Üye ID': member_id,
+            'Kullanıcı Adı': data['username'],
+            'Müşteri Adı': data['customer_name'],
+            'Yatırım Adedi': data['deposit_count'],
+            'Yatırım Miktarı': data['deposits'],
+            'Çekim Adedi': data['withdrawal_count'],
+            'Çekim Miktarı': data['withdrawals'],
+            'Net': data['deposits'] - data['withdrawals']
+        })
+    member_report.sort(key=lambda row: row['Net'], reverse=True)
+    return member_report
+
+
+@perf.timed("aggregation.member_statistics")
+def member_statistics(daily_data: dict, start_date: date, end_date: date) -> Tuple[Dict[str, dict], dict]:
+    """Üye bazında istatistikler ve genel toplamlar"""
+    member_stats = {}
+    totals = {
+        'total_deposits': 0,
+        'total_withdrawals': 0,
+        'total_deposit_count': 0,
+        'total_withdrawal_count': 0
+    }
+
+    for date_str in _dates_in_range(daily_data, start_date, end_date):
+        for records in daily_data[date_str].values():
+            for record in records:
+                member_id = str(record.get('member_id', ''))
+                deposit_count = record.get('deposit_count', 0)
+                deposit_amount = record.get('total_deposits', 0)
+                withdrawal_count = record.get('withdrawal_count', 0)
+                withdrawal_amount = record.get('total_withdrawals', 0)
+
+                stats = member_stats.get(member_id)
+                if stats is None:
+                    stats = member_stats[member_id] = {
+                        'username': record.get('username', ''),
+                        'customer_name': record.get('customer_name', ''),
+                        'total_deposits': 0,
+                        'total_withdrawals': 0,
+                        'deposit_count': 0,
+                        'withdrawal_count': 0,
+                        'net_amount': 0,
+                        'days_active': 0
+                    }
+
+                stats['total_deposits'] += deposit_amount
+                stats['total_withdrawals'] += withdrawal_amount
+                stats['deposit_count'] += deposit_count
+                stats['withdrawal_count'] += withdrawal_count
+                stats['days_active'] += 1
+
+                totals['total_deposits'] += deposit_amount
+                totals['total_withdrawals'] += withdrawal_amount
+                totals['total_deposit_count'] += deposit_count
+                totals['total_withdrawal_count'] += withdrawal_count
+
+    for stats in member_stats.values():
+        stats['net_amount'] = stats['total_deposits'] - stats['total_withdrawals']
+
+    return member_stats, totals
+
+
+def top_members(member_stats: Dict[str, dict], key: str, n: int = 10) -> List[Tuple[str, dict]]:
+    """member_stats içinden key alanına göre en yüksek n üye (yığınla; tam sıralama yapılmaz)"""
+    return leaderboard.top_n(member_stats.items(), n, key=lambda item: item[1][key])
+
+
+@perf.timed("aggregation.daily_summary")
+def daily_summary(daily_data: dict, start_date: date, end_date: date) -> Dict[str, dict]:
+    """Tarih aralığında gün bazında yatırım/çekim toplamları"""
+    summary = {}
+    for date_str in _dates_in_range(daily_data, start_date, end_date):
+        daily_deposits = 0
+        daily_withdrawals = 0
+        daily_dep_count = 0
+        daily_with_count = 0
+
+        for records in daily_data[date_str].values():
+            for record in records:
+                daily_deposits += record.get('total_deposits', 0)
+                daily_withdrawals += record.get('total_withdrawals', 0)
+                daily_dep_count += record.get('deposit_count', 0)
+                daily_with_count += record.get('withdrawal_count', 0)
+
+        summary[date_str] = {
+            'Yatırım Miktarı': daily_deposits,
+            'Çekim Miktarı': daily_withdrawals,
+            'Yatırım Adedi': daily_dep_count,
+            'Çekim Adedi': daily_with_count
+        }
+    return summary
+
+
+@perf.timed("aggregation.filter_members")
+def filter_members(members: List[dict], search_term: str = "", status_filter: str = "Tümü") -> List[dict]:
+    """Üye listesini arama metni (isim, kullanıcı adı, ID) ve duruma göre filtrele"""
+    filtered_members = members
+
+    if search_term:
+        term = fold(search_term)
+        filtered_members = [
+            m for m in filtered_members
+            if (term in fold(m.get('full_name', '')) or
+                term in fold(m.get('username', '')) or
+                search_term in str(m.get('member_id', '')))
+        ]
+
+    if status_filter == "Aktif":
+        filtered_members = [m for m in filtered_members if m.get('is_active', True)]
+    elif status_filter == "Pasif":
+        filtered_members = [m for m in filtered_members if not m.get('is_active', True)]
+
+    return filtered_members
+
+
+def _last_deposit_key(member: dict) -> datetime:
+    last_deposit = member.get('last_deposit_date') or ''
+    if 'T' in last_deposit:
+        return datetime.strptime(last_deposit.split('T')[0], '%Y-%m-%d')
+    return datetime.min
+
+
+@perf.timed("aggregation.sort_members")
+def sort_members(members: List[dict], sort_by: str = "ID") -> List[dict]:
+    """Üye listesini yerinde sırala ("ID", "İsim", "Son Yatırım", "Toplam Yatırım")"""
+    if sort_by == "ID":
+        members.sort(key=lambda x: int(x.get('member_id', 0)))
+    elif sort_by == "İsim":
+        members.sort(key=lambda x: x.get('full_name', '').lower())
+    elif sort_by == "Son Yatırım":
+        members.sort(key=_last_deposit_key, reverse=True)
+    elif sort_by == "Toplam Yatırım":
+        members.sort(key=lambda x: float(x.get('total_deposits', 0)), reverse=True)
+    return members
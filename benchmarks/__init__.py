@@ -0,0 +1,12 @@
+"""
+Benchmarks: Veri büyüdükçe sistemin davranışını ölçen senaryolar.
+- generator: members.json, daily_data.json, CashBack.json ve örnek Excel
+  dosyalarını bugünkü boyutun katları (1×, 10×, 100×, 1000×) olarak deterministik üretir
+- scenarios: dashboard, rapor, istatistik, Excel içe/dışa aktarım, üye arama,
+  kaydetme senaryoları
+- run: senaryoları çalıştırıp sonuçları sürümler arası karşılaştırılabilir JSON'a yazar
+
+Kullanım:
+    python -m benchmarks.run --scales 1,10 -o bench_results.json
+    python -m benchmarks.run --compare eski.json yeni.json
+"""
@@ -0,0 +1,135 @@
+"""
+Bench GitHub: GitHub senkronizasyonunun maliyetini sahte GitHub API'sine karşı ölçer.
+- GitHubSync.sync_all_files: btag.py + daily_data.json + members.json + token.json
+- GitHubManager.update_json / get_json: members.json
+Her dosya boyutu için istek sayısı (rota bazında), gelen / giden bayt ve süre raporlanır.
+PyGithub kurulu değilse sync_all_files adımı atlanır.
+
+Kullanım:
+    python -m benchmarks.bench_github --sizes 10k,100k,1m,5m --latency 0.05 -o github.json
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import List
+
+from benchmarks.generator import DEFAULT_SEED, generate_members
+from benchmarks.mock_github import MockGitHub
+from events import CollectingReporter
+from github_manager import GitHubManager
+from github_sync import GITHUB_AVAILABLE, SYNC_FILES, GitHubSync
+
+BENCH_TOKEN = "bench-github-token"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _parse_size(value: str) -> int:
+    value = value.strip().lower()
+    units = {"k": 1024, "m": 1024 * 1024}
+    if value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def _members_of_size(rng: random.Random, size: int) -> List[dict]:
+    """Yaklaşık size bayt tutan members.json listesi"""
+    sample = generate_members(rng, 20, ["bench"])
+    per_member = len(json.dumps(sample, ensure_ascii=False, indent=2)) / len(sample)
+    return generate_members(rng, max(1, int(size / per_member)), ["bench"])
+
+
+def _write_json(path: str, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _measure(server: MockGitHub, name: str, size: int, func) -> dict:
+    server.reset_stats()
+    start = time.perf_counter()
+    ok = func()
+    elapsed = time.perf_counter() - start
+    return dict({"step": name, "size": size, "seconds": elapsed, "ok": ok}, **server.snapshot())
+
+
+def run_bench(sizes: List[int], latency: float, seed: int, log=print) -> dict:
+    rng = random.Random(seed)
+    work_dir = tempfile.mkdtemp(prefix="bench_github_")
+    results = []
+    try:
+        for size in sizes:
+            members = _members_of_size(rng, size)
+            daily_data = {"2025-09-20": {"bench": members}}
+
+            local_files = []
+            for local_name, github_name, file_type in SYNC_FILES:
+                local_path = os.path.join(work_dir, local_name)
+                if local_name == "btag.py":
+                    shutil.copyfile(os.path.join(REPO_ROOT, "btag_affiliate_system.py"), local_path)
+                elif local_name == "members.json":
+                    _write_json(local_path, members)
+                elif local_name == "daily_data.json":
+                    _write_json(local_path, daily_data)
+                else:
+                    _write_json(local_path, {"token": BENCH_TOKEN, "api_url": ""})
+                local_files.append((local_path, github_name, file_type))
+
+            with MockGitHub(latency=latency, tokens=[BENCH_TOKEN]) as server:
+                # Güncelleme yolunu ölçmek için dosyalar repoda önceden bulunsun
+                for local_path, github_name, _ in local_files:
+                    with open(local_path, "rb") as f:
+                        server.seed_file(github_name, f.read())
+
+                if GITHUB_AVAILABLE:
+                    reporter = CollectingReporter()
+                    sync = GitHubSync(token=BENCH_TOKEN, reporter=reporter, api_base=server.base_url)
+                    results.append(_measure(server, "sync_all_files", size,
+                                            lambda: sync.sync_all_files(local_files)))
+                    log(_format(results[-1]))
+                else:
+                    log("sync_all_files: PyGithub kurulu değil, atlandı")
+
+                manager = GitHubManager("Saxblue", "newsoldier", token=BENCH_TOKEN, api_base=server.base_url)
+                results.append(_measure(server, "update_json", size,
+                                        lambda: bool(manager.update_json("members.json", members))))
+                log(_format(results[-1]))
+
+                # 1 MB üzeri dosyalarda contents API içerik döndürmez; get_json boş sözlük verir
+                results.append(_measure(server, "get_json", size,
+                                        lambda: len(manager.get_json("members.json")) == len(members)))
+                log(_format(results[-1]))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {"latency": latency, "pygithub": GITHUB_AVAILABLE, "results": results}
+
+
+def _format(result: dict) -> str:
+    routes = ", ".join(f"{route}: {count}" for route, count in result["by_route"].items())
+    return (f"{result['step']:<15} {result['size'] / 1024:9.0f} KB  {result['seconds']:7.3f}s  "
+            f"{result['calls']:3d} istek  ↑{result['bytes_in'] / 1024:9.0f} KB  ↓{result['bytes_out'] / 1024:9.0f} KB  "
+            f"{'ok' if result['ok'] else 'BAŞARISIZ'}  [{routes}]")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="GitHub senkronizasyon maliyeti (sahte API'ye karşı)")
+    parser.add_argument("--sizes", default="10k,100k,1m,5m", help="members.json / daily_data.json boyutları")
+    parser.add_argument("--latency", type=float, default=0.0, help="İstek başına gecikme (saniye)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("-o", "--output", help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+
+    result = run_bench([_parse_size(part) for part in args.sizes.split(",") if part.strip()],
+                       args.latency, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar yazıldı: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
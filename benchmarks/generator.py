@@ -0,0 +1,343 @@
+"""
+Generator: Gerçekçi, deterministik sentetik veri üretir.
+- Ölçek 1 bugünkü veriye denk: ~198 üye, 50 gün / 2230 günlük kayıt, 50 CashBack günü / ~8.2k kayıt
+- Ölçek büyüdükçe BTag sayısı ve gün sayısı √ölçek ile artar, toplam kayıt ölçekle doğrusal büyür
+- Aynı (ölçek, seed) her zaman aynı dosyaları üretir; tarihler sabit ANCHOR_DATE'e göre hesaplanır
+- JSON dosyaları akış halinde yazılır; 1000× ölçekte bile bellek gün başına sınırlı kalır
+
+Komut satırı:
+    python -m benchmarks.generator --scale 10 -o .bench_data/x10
+"""
+import argparse
+import json
+import math
+import os
+import random
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+ANCHOR_DATE = date(2025, 9, 20)
+DEFAULT_SEED = 42
+
+BASE_MEMBERS = 198
+BASE_DAYS = 50
+BASE_RECORDS_PER_DAY = 45
+BASE_CASHBACK_DAYS = 50
+BASE_CASHBACK_RECORDS_PER_DAY = 165
+BASE_CASHBACK_CUSTOMERS = 1440
+
+FIRST_NAMES = [
+    "Ahmet", "Mehmet", "Mustafa", "Ali", "Hüseyin", "Hasan", "İbrahim", "İsmail", "Osman", "Yusuf",
+    "Murat", "Ömer", "Ramazan", "Halil", "Süleyman", "Abdullah", "Emre", "Burak", "Serkan", "Sinan",
+    "Ayşe", "Fatma", "Emine", "Hatice", "Zeynep", "Elif", "Meryem", "Şerife", "Özlem", "Meral",
+    "Gülşen", "Çiğdem", "Işıl", "İpek", "Ebru", "Derya", "Sibel", "Tuğba", "Büşra", "Ümran"
+]
+LAST_NAMES = [
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir",
+    "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek",
+    "Polat", "Akdağ", "Çiftçi", "Güneş", "Erdoğan", "Aksoy", "Keskin", "Ünal", "Işık", "Bulut"
+]
+PARTNERS = ["Salamisbahis-18756287", "Salamisbahis-18756290", "Salamisbahis-18756301"]
+
+
+def scale_shape(scale: float) -> Dict[str, int]:
+    """Ölçeğe göre üye, BTag, gün ve kayıt sayıları"""
+    root = math.sqrt(scale)
+    btags = max(1, round(root))
+    return {
+        "members": max(1, round(BASE_MEMBERS * scale)),
+        "btags": btags,
+        "days": max(1, round(BASE_DAYS * scale / btags)),
+        "records_per_day": BASE_RECORDS_PER_DAY,
+        "cashback_days": max(1, round(BASE_CASHBACK_DAYS * root)),
+        "cashback_records_per_day": max(1, round(BASE_CASHBACK_RECORDS_PER_DAY * root)),
+        "cashback_customers": max(1, round(BASE_CASHBACK_CUSTOMERS * scale)),
+    }
+
+
+def _name(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat(timespec="milliseconds")
+
+
+def _amount(rng: random.Random, median: float = 1200) -> float:
+    # Yatırım miktarları sağa çarpık dağılır (log-normal)
+    return float(round(rng.lognormvariate(math.log(median), 1.0) / 5) * 5)
+
+
+def generate_members(rng: random.Random, count: int, btags: List[str]) -> List[dict]:
+    """members.json biçiminde üye listesi (api_data + kpi_data tekrarlarıyla birlikte)"""
+    members = []
+    member_ids = rng.sample(range(100_000_000, 400_000_000), count)
+    for index, member_id in enumerate(member_ids):
+        full_name = _name(rng)
+        first, last = full_name.split(" ", 1)
+        username = f"{first}{rng.randint(10, 9999)}"
+        btag = btags[index % len(btags)]
+        registration = datetime.combine(ANCHOR_DATE, datetime.min.time()) - timedelta(days=rng.randint(1, 900),
+                                                                                       seconds=rng.randint(0, 86399))
+        days_without = rng.choice([0, 0, 0, 1, 2, 3, 5, 8, 14, 30, 52])
+        last_deposit = datetime.combine(ANCHOR_DATE, datetime.min.time()) - timedelta(days=days_without,
+                                                                                       seconds=rng.randint(0, 86399))
+        deposit_count = rng.randint(0, 60)
+        total_deposits = sum(_amount(rng) for _ in range(min(deposit_count, 20))) * max(1, deposit_count / 20)
+        withdrawal_count = rng.randint(0, deposit_count // 2 + 1)
+        total_withdrawals = round(total_deposits * rng.uniform(0, 0.9), 2) if withdrawal_count else 0.0
+        email = f"{username.lower()}@gmail.com"
+        phone = f"90055{rng.randint(10_000_000, 99_999_999)}"
+        balance = round(rng.uniform(0, 500), 2)
+
+        api_data = {
+            "username": username,
+            "full_name": full_name,
+            "email": email,
+            "phone": phone,
+            "status": 1,
+            "registration_date": _iso(registration),
+            "last_login_date": _iso(last_deposit + timedelta(minutes=rng.randint(1, 600))),
+            "balance": balance,
+            "currency": "TRY",
+            "partner_name": rng.choice(PARTNERS),
+            "birth_date": f"{rng.randint(1960, 2004)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00",
+            "last_deposit_date": _iso(last_deposit),
+            "last_casino_bet": _iso(last_deposit + timedelta(minutes=rng.randint(1, 300))),
+            "total_deposits": 0,
+            "total_withdrawals": 0,
+            "deposit_count": 0,
+            "withdrawal_count": 0,
+            "days_without_deposit": days_without
+        }
+        kpi_data = {
+            "Id": rng.randint(100_000_000, 300_000_000),
+            "ClientId": member_id,
+            "Name": f"{last}  {first}",
+            "Login": username,
+            "TotalCasinoStakes": round(total_deposits * rng.uniform(1, 5), 2),
+            "TotalCasinoWinnings": round(total_deposits * rng.uniform(0.8, 4.5), 2),
+            "TotalDeposit": total_deposits,
+            "TotalWithdrawal": total_withdrawals,
+            "DepositAmount": total_deposits,
+            "DepositCount": deposit_count,
+            "WithdrawalCount": withdrawal_count,
+            "WithdrawalAmount": total_withdrawals,
+            "LastDepositTimeLocal": _iso(last_deposit),
+            "CurrencyId": "TRY",
+            "BTag": btag,
+            "IsTest": False,
+            "IsVerified": False
+        }
+        members.append({
+            "member_id": str(member_id),
+            "username": username,
+            "full_name": full_name,
+            "is_active": rng.random() > 0.1,
+            "created_at": _iso(registration + timedelta(days=1)),
+            "last_deposit_date": _iso(last_deposit),
+            "days_without_deposit": days_without,
+            "api_data": api_data,
+            "last_api_update": _iso(datetime.combine(ANCHOR_DATE, datetime.min.time())),
+            "email": email,
+            "phone": phone,
+            "balance": balance,
+            "currency": "TRY",
+            "total_deposits": total_deposits,
+            "total_withdrawals": total_withdrawals,
+            "last_casino_bet": api_data["last_casino_bet"],
+            "registration_date": api_data["registration_date"],
+            "last_login_date": api_data["last_login_date"],
+            "partner_name": api_data["partner_name"],
+            "birth_date": api_data["birth_date"],
+            "kpi_data": kpi_data,
+            "last_kpi_update": _iso(datetime.combine(ANCHOR_DATE, datetime.min.time())),
+            "deposit_count": deposit_count,
+            "withdrawal_count": withdrawal_count
+        })
+    return members
+
+
+def _daily_record(rng: random.Random, member: dict) -> dict:
+    deposit_count = rng.choice([0, 1, 1, 1, 2, 2, 3, 4])
+    withdrawal_count = rng.choice([0, 0, 0, 0, 1, 1, 2])
+    first, last = member["full_name"].split(" ", 1)
+    return {
+        "member_id": member["member_id"],
+        "username": member["username"],
+        "customer_name": f"{last} {first}",
+        "deposit_count": deposit_count,
+        "total_deposits": sum(_amount(rng) for _ in range(deposit_count)),
+        "withdrawal_count": withdrawal_count,
+        "total_withdrawals": sum(_amount(rng, 2500) for _ in range(withdrawal_count))
+    }
+
+
+def iter_daily_days(rng: random.Random, members: List[dict], shape: Dict[str, int]):
+    """(tarih, {btag: [kayıt...]}) çiftlerini eskiden yeniye üret"""
+    pools: Dict[str, List[dict]] = {}
+    for member in members:
+        pools.setdefault(member["kpi_data"]["BTag"], []).append(member)
+
+    start = ANCHOR_DATE - timedelta(days=shape["days"] - 1)
+    for offset in range(shape["days"]):
+        day = start + timedelta(days=offset)
+        btag_data = {}
+        for btag, pool in pools.items():
+            size = min(len(pool), max(1, round(rng.gauss(shape["records_per_day"], 5))))
+            btag_data[btag] = [_daily_record(rng, member) for member in rng.sample(pool, size)]
+        yield day.strftime("%Y-%m-%d"), btag_data
+
+
+def iter_cashback_entries(rng: random.Random, shape: Dict[str, int]):
+    """CashBack.json girdilerini (en yeni en üstte) üret"""
+    customers = []
+    customer_ids = rng.sample(range(100_000_000, 400_000_000), shape["cashback_customers"])
+    for customer_id in customer_ids:
+        name = _name(rng)
+        # Gerçek veride olduğu gibi bazı isimlerde çift / sondaki boşluk
+        if rng.random() < 0.15:
+            name = name.replace(" ", "  ") + " "
+        customers.append((customer_id, name))
+
+    for offset in range(shape["cashback_days"]):
+        day = ANCHOR_DATE - timedelta(days=offset)
+        size = min(len(customers), max(1, round(rng.gauss(shape["cashback_records_per_day"], 10))))
+        records = []
+        for customer_id, name in rng.sample(customers, size):
+            count = rng.choice([1, 1, 1, 2, 2, 3, 4])
+            records.append({
+                "Müşteri_Kimliği": customer_id,
+                "Müşteri_Adı": name,
+                "Adet": count,
+                "Toplam_Miktar": sum(round(_amount(rng, 1500) / 100) * 100 for _ in range(count))
+            })
+        records.sort(key=lambda r: r["Toplam_Miktar"], reverse=True)
+        saved_at = datetime.combine(day, datetime.min.time()) + timedelta(hours=23, minutes=rng.randint(0, 59))
+        yield {
+            "date": f"{day.strftime('%Y-%m-%d')}_{saved_at.strftime('%H:%M:%S')}",
+            "timestamp": saved_at.isoformat(),
+            "data": records
+        }
+
+
+def _write_json_object_stream(path: str, items, indent: int = 2):
+    """(anahtar, değer) akışını uygulamanın kullandığı biçimde JSON nesnesi olarak yaz"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for index, (key, value) in enumerate(items):
+            f.write("," if index else "")
+            body = json.dumps(value, ensure_ascii=False, indent=indent)
+            f.write(f"\n  {json.dumps(key)}: " + body.replace("\n", "\n  "))
+        f.write("\n}")
+
+
+def _write_json_array_stream(path: str, items, indent: int):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for index, item in enumerate(items):
+            f.write("," if index else "")
+            body = json.dumps(item, ensure_ascii=False, indent=indent)
+            f.write("\n" + " " * indent + body.replace("\n", "\n" + " " * indent))
+        f.write("\n]")
+
+
+def _write_players_report(path: str, day_records: Dict[str, List[dict]]):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Players")
+    sheet.append(['ID', 'Kullanıcı Adı', 'Müşteri Adı', 'Para Yatırma Sayısı', 'Yatırımlar',
+                  'Para Çekme Sayısı', 'Para Çekme Miktarı', 'BTag'])
+    for btag, records in day_records.items():
+        for r in records:
+            sheet.append([int(r["member_id"]), r["username"], r["customer_name"], r["deposit_count"],
+                          r["total_deposits"], r["withdrawal_count"], r["total_withdrawals"], int(btag)])
+    workbook.save(path)
+
+
+def _write_cashback_excel(rng: random.Random, path: str, entry: dict):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Bonuslar")
+    sheet.append(['Tarih', 'Müşteri Kimliği', 'Kullanıcı Adı', 'Bonus Türü', 'Para Birimi Miktarı'])
+    for record in entry["data"]:
+        remaining = record["Toplam_Miktar"]
+        for i in range(record["Adet"]):
+            amount = remaining if i == record["Adet"] - 1 else round(remaining * rng.uniform(0.2, 0.6))
+            remaining -= amount
+            sheet.append([entry["date"].split("_")[0], record["Müşteri_Kimliği"], record["Müşteri_Adı"],
+                          "CashBack Düzeltmesi", amount])
+    workbook.save(path)
+
+
+def generate_dataset(scale: float, out_dir: str, seed: int = DEFAULT_SEED, with_excel: bool = True) -> dict:
+    """Ölçeğe göre tüm veri dosyalarını out_dir içine üret, üretim özetini döndür"""
+    os.makedirs(out_dir, exist_ok=True)
+    shape = scale_shape(scale)
+    rng = random.Random(f"{seed}:{scale}")
+
+    btags = [str(2424878 + i * 37) for i in range(shape["btags"])]
+    members = generate_members(rng, shape["members"], btags)
+    _write_json_array_stream(os.path.join(out_dir, "members.json"), members, indent=2)
+
+    daily_records = 0
+    last_day = None
+
+    def daily_items():
+        nonlocal daily_records, last_day
+        for day, btag_data in iter_daily_days(rng, members, shape):
+            daily_records += sum(len(records) for records in btag_data.values())
+            last_day = btag_data
+            yield day, btag_data
+
+    _write_json_object_stream(os.path.join(out_dir, "daily_data.json"), daily_items())
+
+    cashback_records = 0
+    first_entry = None
+
+    def cashback_items():
+        nonlocal cashback_records, first_entry
+        for entry in iter_cashback_entries(rng, shape):
+            cashback_records += len(entry["data"])
+            first_entry = first_entry or entry
+            yield entry
+
+    _write_json_array_stream(os.path.join(out_dir, "CashBack.json"), cashback_items(), indent=4)
+
+    if with_excel:
+        _write_players_report(os.path.join(out_dir, "players-report.xlsx"), last_day)
+        _write_cashback_excel(rng, os.path.join(out_dir, "cashback.xlsx"), first_entry)
+
+    manifest = dict(shape, scale=scale, seed=seed, anchor_date=ANCHOR_DATE.isoformat(),
+                    btag_list=btags, daily_records=daily_records, cashback_records=cashback_records)
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def ensure_dataset(scale: float, base_dir: str, seed: int = DEFAULT_SEED) -> str:
+    """Veri seti yoksa üret (varsa yeniden kullan), klasör yolunu döndür"""
+    out_dir = os.path.join(base_dir, f"x{scale:g}_seed{seed}")
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    if not os.path.exists(manifest_path):
+        generate_dataset(scale, out_dir, seed)
+    return out_dir
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark için sentetik veri üret")
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--no-excel", action="store_true")
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+
+    manifest = generate_dataset(args.scale, args.output, args.seed, with_excel=not args.no_excel)
+    print(json.dumps(manifest, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
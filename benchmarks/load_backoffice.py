@@ -0,0 +1,142 @@
+"""
+Load Backoffice: MemberService'in API yollarını sahte backoffice'e karşı yükler.
+- fetch_member_api_data: üye bilgisi + KPI (örnek üyeler üzerinde)
+- update_member_kpis: tek üye KPI güncellemesi (örnek üyeler üzerinde)
+- update_all_members_kpis: tüm üyeler, bekleme süresi ayarlanabilir
+Her adım için süre, saniye başına üye, başarılı / başarısız sayısı, sunucunun
+gördüğü durum kodları ve reporter'a düşen uyarı / hata sayısı raporlanır.
+
+Kullanım:
+    python -m benchmarks.load_backoffice --members 2000 --latency 0.02 --error-rate 0.02
+    python -m benchmarks.load_backoffice --members 5000 --rate-limit 50 --unauthorized-rate 0.001 -o load.json
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import List
+
+import btag_core
+from benchmarks.generator import DEFAULT_SEED, generate_members
+from benchmarks.mock_backoffice import MockBackoffice
+from btag_core import DailyDataStore, MemberService, TokenStore
+from events import CollectingReporter
+
+BENCH_TOKEN = "bench-token-0123456789"
+
+
+def _make_service(work_dir: str, members: List[dict], reporter: CollectingReporter) -> MemberService:
+    members_file = os.path.join(work_dir, "members.json")
+    with open(members_file, "w", encoding="utf-8") as f:
+        json.dump(members, f, ensure_ascii=False, indent=2)
+
+    token_store = TokenStore(token_file=os.path.join(work_dir, "token.json"), reporter=reporter)
+    token_store.save_token(BENCH_TOKEN, f"{btag_core.BACKOFFICE_API_BASE}/Client/GetClientKpis")
+    data_store = DailyDataStore(daily_data_file=os.path.join(work_dir, "daily_data.json"),
+                                members_file=members_file, reporter=reporter)
+    return MemberService(members_file=members_file, token_manager=token_store,
+                         data_processor=data_store, reporter=reporter)
+
+
+def _step(name: str, server: MockBackoffice, reporter: CollectingReporter, count: int, func) -> dict:
+    server.reset_stats()
+    reporter.events.clear()
+    start = time.perf_counter()
+    succeeded = func()
+    elapsed = time.perf_counter() - start
+    return {
+        "step": name,
+        "members": count,
+        "seconds": elapsed,
+        "members_per_second": count / elapsed if elapsed else None,
+        "succeeded": succeeded,
+        "failed": count - succeeded,
+        "server": server.snapshot(),
+        "warnings": len(reporter.messages("warning")),
+        "errors": len(reporter.messages("error")),
+    }
+
+
+def run_load(member_count: int, sample: int, delay: float, seed: int, server_options: dict, log=print) -> dict:
+    rng = random.Random(seed)
+    members = generate_members(rng, member_count, ["bench"])
+    sample_ids = [m['member_id'] for m in rng.sample(members, min(sample, member_count))]
+
+    work_dir = tempfile.mkdtemp(prefix="bench_backoffice_")
+    previous_base = btag_core.BACKOFFICE_API_BASE
+    reporter = CollectingReporter()
+    steps = []
+    try:
+        with MockBackoffice(valid_tokens=[BENCH_TOKEN], seed=seed, **server_options) as server:
+            btag_core.BACKOFFICE_API_BASE = server.base_url
+            service = _make_service(work_dir, members, reporter)
+
+            steps.append(_step("fetch_member_api_data", server, reporter, len(sample_ids),
+                               lambda: sum(service.fetch_member_api_data(mid) is not None for mid in sample_ids)))
+            log(_format(steps[-1]))
+
+            # 401 alan güncelleme token'ı temizler; her adım taze token ile başlasın
+            service.token_manager.save_token(BENCH_TOKEN, "")
+            steps.append(_step("update_member_kpis", server, reporter, len(sample_ids),
+                               lambda: sum(bool(service.update_member_kpis(mid)) for mid in sample_ids)))
+            log(_format(steps[-1]))
+
+            service.token_manager.save_token(BENCH_TOKEN, "")
+
+            def update_all():
+                result = service.update_all_members_kpis(delay=delay)
+                return result["updated"] if result else 0
+
+            steps.append(_step("update_all_members_kpis", server, reporter, member_count, update_all))
+            log(_format(steps[-1]))
+    finally:
+        btag_core.BACKOFFICE_API_BASE = previous_base
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {"members": member_count, "sample": len(sample_ids), "delay": delay,
+            "server_options": server_options, "steps": steps}
+
+
+def _format(step: dict) -> str:
+    statuses = ", ".join(f"{key}: {value}" for key, value in step["server"].items())
+    return (f"{step['step']:<26} {step['members']:>6} üye  {step['seconds']:8.2f}s  "
+            f"{step['members_per_second'] or 0:8.1f} üye/s  başarılı {step['succeeded']}  "
+            f"başarısız {step['failed']}  [{statuses}]")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sahte backoffice'e karşı üye / KPI yük testi")
+    parser.add_argument("--members", type=int, default=2000)
+    parser.add_argument("--sample", type=int, default=200, help="Tek tek çağrılan adımlar için üye sayısı")
+    parser.add_argument("--delay", type=float, default=0.0, help="update_all_members_kpis bekleme süresi")
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0)
+    parser.add_argument("--unknown-rate", type=float, default=0.0, help="Boş Data döndürülen üye oranı")
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("-o", "--output", help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+
+    server_options = {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "unauthorized_rate": args.unauthorized_rate,
+        "unknown_rate": args.unknown_rate,
+        "rate_limit": args.rate_limit,
+    }
+    result = run_load(args.members, args.sample, args.delay, args.seed, server_options)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar yazıldı: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,285 @@
+"""
+Mock Backoffice: BetConstruct backoffice API'sinin yerel taklidi.
+- GET  {base}/Client/GetClientById?id=...  → üye bilgileri (Data: {...})
+- POST {base}/Client/GetClientKpis         → KPI verisi (Data: [{...}])
+- Ayarlanabilir gecikme, 500 hata oranı, 401 oranı / geçerli token listesi
+- Saniye başına istek sınırı aşıldığında 429 + Retry-After / X-RateLimit-* başlıkları
+- Uç nokta ve durum kodu bazında istek sayaçları (stats)
+
+Yanıtlar üye ID'sinden deterministik üretilir; aynı ID her zaman aynı veriyi döndürür.
+
+Kullanım:
+    with MockBackoffice(latency=0.02, error_rate=0.01) as server:
+        btag_core.BACKOFFICE_API_BASE = server.base_url
+        ...
+    python -m benchmarks.mock_backoffice --port 8765 --latency 0.05
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.generator import ANCHOR_DATE, FIRST_NAMES, LAST_NAMES, PARTNERS
+
+API_PREFIX = "/api/tr"
+CLIENT_PATH = API_PREFIX + "/Client/GetClientById"
+KPI_PATH = API_PREFIX + "/Client/GetClientKpis"
+
+
+def client_payload(member_id: int) -> dict:
+    """GetClientById yanıtının Data kısmı"""
+    rng = random.Random(member_id)
+    anchor = datetime.combine(ANCHOR_DATE, datetime.min.time())
+    last_deposit = anchor - timedelta(days=rng.choice([0, 0, 1, 2, 3, 5, 8, 14, 30]),
+                                      seconds=rng.randint(0, 86399))
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "Id": member_id,
+        "Login": f"{first}{rng.randint(10, 9999)}",
+        "FirstName": first,
+        "LastName": last,
+        "Email": f"{first.lower()}{member_id % 1000}@gmail.com",
+        "Phone": f"90055{rng.randint(10_000_000, 99_999_999)}",
+        "Balance": round(rng.uniform(0, 500), 2),
+        "Currency": "TRY",
+        "RegistrationDate": (anchor - timedelta(days=rng.randint(30, 900))).strftime('%Y-%m-%dT%H:%M:%S'),
+        "LastLoginDate": (last_deposit + timedelta(minutes=rng.randint(1, 600))).strftime('%Y-%m-%dT%H:%M:%S.%f'),
+        "IsBlocked": rng.random() < 0.02,
+        "PartnerName": rng.choice(PARTNERS),
+        "BirthDate": f"{rng.randint(1960, 2004)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00",
+        "LastDepositDate": last_deposit.strftime('%Y-%m-%dT%H:%M:%S.%f'),
+        "LastCasinoBet": (last_deposit + timedelta(minutes=rng.randint(1, 300))).strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def kpi_payload(member_id: int) -> dict:
+    """GetClientKpis yanıtının Data[0] kısmı"""
+    rng = random.Random(member_id * 7 + 1)
+    deposit_count = rng.randint(0, 60)
+    total_deposit = round(sum(rng.uniform(100, 3000) for _ in range(min(deposit_count, 20))), 2)
+    withdrawal_count = rng.randint(0, deposit_count // 2 + 1)
+    return {
+        "ClientId": member_id,
+        "TotalDeposit": total_deposit,
+        "TotalWithdrawal": round(total_deposit * rng.uniform(0, 0.9), 2) if withdrawal_count else 0.0,
+        "DepositCount": deposit_count,
+        "WithdrawalCount": withdrawal_count,
+        "TotalCasinoStakes": round(total_deposit * rng.uniform(1, 5), 2),
+        "CurrencyId": "TRY",
+    }
+
+
+class _RateLimiter:
+    """Sabit pencereli (1 saniye) istek sayacı"""
+
+    def __init__(self, per_second: Optional[float]):
+        self.per_second = per_second
+        self.window_start = time.monotonic()
+        self.count = 0
+
+    def check(self):
+        """(izin_var_mı, kalan, pencere_sonuna_saniye)"""
+        if not self.per_second:
+            return True, None, 0.0
+        now = time.monotonic()
+        if now - self.window_start >= 1.0:
+            self.window_start = now
+            self.count = 0
+        reset_in = max(0.0, 1.0 - (now - self.window_start))
+        if self.count >= self.per_second:
+            return False, 0, reset_in
+        self.count += 1
+        return True, int(self.per_second - self.count), reset_in
+
+
+class MockBackoffice:
+    """Arka planda çalışan ThreadingHTTPServer tabanlı sahte backoffice"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, unauthorized_rate: float = 0.0, rate_limit: Optional[float] = None,
+                 valid_tokens: Optional[Iterable[str]] = None, unknown_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.unauthorized_rate = unauthorized_rate
+        self.unknown_rate = unknown_rate
+        self.valid_tokens = set(valid_tokens) if valid_tokens is not None else None
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._limiter = _RateLimiter(rate_limit)
+        self.stats = Counter()
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    def snapshot(self) -> dict:
+        """Sayaçları "uç nokta durum" → adet sözlüğü olarak döndür"""
+        with self._lock:
+            return {f"{endpoint} {status}": count for (endpoint, status), count in sorted(self.stats.items())}
+
+    # --- istek işleme ---------------------------------------------------------
+
+    def _decide(self, token: str):
+        """Gecikme ve hata enjeksiyonu; (durum, ek_başlıklar) ya da (None, başlıklar)"""
+        with self._lock:
+            allowed, remaining, reset_in = self._limiter.check()
+            roll = self._rng.random()
+            unknown_roll = self._rng.random()
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+
+        headers = {}
+        if remaining is not None:
+            headers["X-RateLimit-Limit"] = str(int(self._limiter.per_second))
+            headers["X-RateLimit-Remaining"] = str(remaining)
+        if not allowed:
+            headers["Retry-After"] = str(max(1, round(reset_in)))
+            return 429, headers, 0.0, False
+
+        if delay:
+            time.sleep(delay)
+
+        if self.valid_tokens is not None and token not in self.valid_tokens:
+            return 401, headers, delay, False
+        if roll < self.unauthorized_rate:
+            return 401, headers, delay, False
+        if roll < self.unauthorized_rate + self.error_rate:
+            return 500, headers, delay, False
+        return None, headers, delay, unknown_roll < self.unknown_rate
+
+    def _count(self, endpoint: str, status: int):
+        with self._lock:
+            self.stats[(endpoint, status)] += 1
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # sessiz
+                pass
+
+            def _send(self, status: int, body, headers=None):
+                payload = json.dumps(body).encode("utf-8") if not isinstance(body, bytes) else body
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _handle(self, endpoint: str, member_id_getter):
+                status, headers, _, unknown = mock._decide(self.headers.get("Authentication", ""))
+                if status is not None:
+                    mock._count(endpoint, status)
+                    messages = {401: "Unauthorized", 429: "Too Many Requests", 500: "Internal Server Error"}
+                    self._send(status, {"HasError": True, "ErrorMessage": messages[status]}, headers)
+                    return
+
+                try:
+                    member_id = int(member_id_getter())
+                except (TypeError, ValueError):
+                    mock._count(endpoint, 400)
+                    self._send(400, {"HasError": True, "ErrorMessage": "Invalid ClientId"}, headers)
+                    return
+
+                mock._count(endpoint, 200)
+                if unknown:
+                    # Gerçek API bulunamayan üye için de 200 döner
+                    data = None if endpoint == "client" else []
+                    self._send(200, {"HasError": False, "Data": data}, headers)
+                elif endpoint == "client":
+                    self._send(200, {"HasError": False, "Data": client_payload(member_id)}, headers)
+                else:
+                    self._send(200, {"HasError": False, "Data": [kpi_payload(member_id)]}, headers)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path != CLIENT_PATH:
+                    mock._count("other", 404)
+                    self._send(404, {"HasError": True, "ErrorMessage": "Not Found"})
+                    return
+                self._handle("client", lambda: parse_qs(parsed.query).get("id", [None])[0])
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if urlparse(self.path).path != KPI_PATH:
+                    mock._count("other", 404)
+                    self._send(404, {"HasError": True, "ErrorMessage": "Not Found"})
+                    return
+
+                def member_id():
+                    return json.loads(raw or b"{}").get("ClientId")
+
+                self._handle("kpi", member_id)
+
+        return Handler
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Yerel sahte BetConstruct backoffice sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Yanıt gecikmesi (saniye)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Gecikmeye eklenen rastgele süre üst sınırı")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 döndürme oranı (0-1)")
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0, help="401 döndürme oranı (0-1)")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Saniye başına izin verilen istek")
+    parser.add_argument("--token", action="append", dest="tokens", help="Geçerli token (tekrarlanabilir)")
+    args = parser.parse_args(argv)
+
+    server = MockBackoffice(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                            error_rate=args.error_rate, unauthorized_rate=args.unauthorized_rate,
+                            rate_limit=args.rate_limit, valid_tokens=args.tokens)
+    print(f"Mock backoffice: {server.base_url}  (BACKOFFICE_API_BASE olarak verin, Ctrl+C ile durdurun)")
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.snapshot(), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,496 @@
+"""
+Mock GitHub: GitHub REST API'sinin senkronizasyonda kullanılan kısmının yerel taklidi.
+- repos/{owner}/{repo}: repo bilgisi ve commit listesi
+- contents/{path}: dosya okuma (GET) ve oluşturma / güncelleme (PUT, sha kontrolü ile)
+- git/blobs, git/trees, git/commits, git/refs: Git Data API (düz ağaç modeli)
+- Ayarlanabilir gecikme, token kontrolü (401) ve X-RateLimit-* başlıkları (bitince 403)
+- Yöntem + rota bazında istek sayısı, gelen / giden bayt sayaçları (stats)
+
+Blob sha'ları git ile aynı hesaplanır (sha1("blob <boyut>\\0" + içerik)). 1 MB'den büyük
+dosyalarda contents yanıtı gerçek API gibi boş içerik ve encoding "none" döner.
+
+Kullanım:
+    with MockGitHub(latency=0.05) as server:
+        GitHubManager("Saxblue", "newsoldier", token="x", api_base=server.base_url)
+        GitHubSync(token="x", api_base=server.base_url)
+    python -m benchmarks.mock_github --port 8766
+"""
+import argparse
+import base64
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+MAX_CONTENTS_SIZE = 1024 * 1024  # contents API bu boyutun üzerindeki dosyalarda içerik döndürmez
+DEFAULT_RATE_LIMIT = 5000
+RATE_LIMIT_WINDOW = 3600
+
+
+def git_blob_sha(content: bytes) -> str:
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class _Repository:
+    """Bellekte tutulan repo: blob'lar, düz ağaçlar, commit'ler ve dallar"""
+
+    def __init__(self, owner: str, name: str, branch: str):
+        self.owner = owner
+        self.name = name
+        self.default_branch = branch
+        self.blobs: Dict[str, bytes] = {}
+        self.trees: Dict[str, Dict[str, str]] = {}
+        self.commits: Dict[str, dict] = {}
+        self.refs: Dict[str, str] = {}
+        self.pushed_at = _now()
+
+        root_tree = self.put_tree({})
+        self.refs[f"heads/{branch}"] = self.put_commit("Initial commit", root_tree, [])
+
+    def put_blob(self, content: bytes) -> str:
+        sha = git_blob_sha(content)
+        self.blobs[sha] = content
+        return sha
+
+    def put_tree(self, entries: Dict[str, str]) -> str:
+        sha = hashlib.sha1(json.dumps(sorted(entries.items())).encode()).hexdigest()
+        self.trees[sha] = dict(entries)
+        return sha
+
+    def put_commit(self, message: str, tree_sha: str, parents) -> str:
+        commit = {"message": message, "tree": tree_sha, "parents": list(parents), "date": _now()}
+        sha = hashlib.sha1(json.dumps(commit, sort_keys=True).encode()).hexdigest()
+        self.commits[sha] = commit
+        return sha
+
+    def head(self, branch: str) -> str:
+        ref = self.refs.get(f"heads/{branch}")
+        if ref is None:
+            raise ApiError(404, "No commit found for the ref " + branch)
+        return ref
+
+    def files(self, branch: str) -> Dict[str, str]:
+        return self.trees[self.commits[self.head(branch)]["tree"]]
+
+    def commit_file(self, branch: str, path: str, content: bytes, message: str) -> str:
+        parent = self.head(branch)
+        entries = dict(self.files(branch))
+        entries[path] = self.put_blob(content)
+        sha = self.put_commit(message, self.put_tree(entries), [parent])
+        self.refs[f"heads/{branch}"] = sha
+        self.pushed_at = _now()
+        return sha
+
+
+class MockGitHub:
+    """Arka planda çalışan ThreadingHTTPServer tabanlı sahte GitHub API'si"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, owner: str = "Saxblue", repo: str = "newsoldier",
+                 branch: str = "main", latency: float = 0.0, tokens: Optional[Iterable[str]] = None,
+                 rate_limit: int = DEFAULT_RATE_LIMIT):
+        self.latency = latency
+        self.tokens = set(tokens) if tokens is not None else None
+        self.rate_limit = rate_limit
+        self.rate_used = 0
+        self.rate_reset = int(time.time()) + RATE_LIMIT_WINDOW
+        self.repository = _Repository(owner, repo, branch)
+
+        self._lock = threading.RLock()
+        self.calls = Counter()
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def reset_stats(self):
+        with self._lock:
+            self.calls.clear()
+            self.bytes_in = 0
+            self.bytes_out = 0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": sum(self.calls.values()),
+                "by_route": {f"{method} {route}": count for (method, route), count in sorted(self.calls.items())},
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+            }
+
+    def seed_file(self, path: str, content: bytes, branch: Optional[str] = None):
+        """Sayaçlara yansımadan repoya dosya koy"""
+        with self._lock:
+            self.repository.commit_file(branch or self.repository.default_branch, path, content, f"Seed {path}")
+
+    # --- yanıt gövdeleri --------------------------------------------------------
+
+    def _repo_url(self) -> str:
+        return f"{self.base_url}/repos/{self.repository.owner}/{self.repository.name}"
+
+    def _repo_json(self) -> dict:
+        repo = self.repository
+        return {
+            "id": 1,
+            "name": repo.name,
+            "full_name": f"{repo.owner}/{repo.name}",
+            "owner": {"login": repo.owner, "id": 1, "type": "User"},
+            "private": True,
+            "html_url": f"https://github.com/{repo.owner}/{repo.name}",
+            "url": self._repo_url(),
+            "default_branch": repo.default_branch,
+            "pushed_at": repo.pushed_at,
+        }
+
+    def _content_json(self, path: str, blob_sha: str, with_content: bool = True) -> dict:
+        content = self.repository.blobs[blob_sha]
+        url = f"{self._repo_url()}/contents/{path}"
+        body = {
+            "type": "file",
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "sha": blob_sha,
+            "size": len(content),
+            "url": url,
+            "git_url": f"{self._repo_url()}/git/blobs/{blob_sha}",
+            "html_url": f"https://github.com/{self.repository.owner}/{self.repository.name}/blob/main/{path}",
+            "download_url": None,
+            "_links": {"self": url},
+        }
+        if with_content:
+            if len(content) > MAX_CONTENTS_SIZE:
+                body.update({"encoding": "none", "content": ""})
+            else:
+                # GitHub base64 içeriği 60 karakterlik satırlara böler
+                encoded = base64.b64encode(content).decode()
+                body.update({"encoding": "base64",
+                             "content": "\n".join(encoded[i:i + 60] for i in range(0, len(encoded), 60))})
+        return body
+
+    def _commit_json(self, sha: str) -> dict:
+        commit = self.repository.commits[sha]
+        return {
+            "sha": sha,
+            "url": f"{self._repo_url()}/git/commits/{sha}",
+            "message": commit["message"],
+            "tree": {"sha": commit["tree"], "url": f"{self._repo_url()}/git/trees/{commit['tree']}"},
+            "parents": [{"sha": parent} for parent in commit["parents"]],
+            "author": {"name": "bench", "email": "bench@example.com", "date": commit["date"]},
+            "committer": {"name": "bench", "email": "bench@example.com", "date": commit["date"]},
+        }
+
+    def _ref_json(self, ref: str) -> dict:
+        sha = self.repository.refs[ref]
+        return {"ref": f"refs/{ref}", "url": f"{self._repo_url()}/git/refs/{ref}",
+                "object": {"type": "commit", "sha": sha, "url": f"{self._repo_url()}/git/commits/{sha}"}}
+
+    # --- rotalar ----------------------------------------------------------------
+
+    ROUTES = [
+        ("GET", r"/rate_limit", "rate_limit"),
+        ("GET", r"/repos/{repo}", "repo"),
+        ("GET", r"/repos/{repo}/commits", "commits"),
+        ("GET", r"/repos/{repo}/contents/(?P<path>.+)", "get_contents"),
+        ("PUT", r"/repos/{repo}/contents/(?P<path>.+)", "put_contents"),
+        ("GET", r"/repos/{repo}/git/blobs/(?P<sha>\w+)", "get_blob"),
+        ("POST", r"/repos/{repo}/git/blobs", "create_blob"),
+        ("GET", r"/repos/{repo}/git/trees/(?P<sha>\w+)", "get_tree"),
+        ("POST", r"/repos/{repo}/git/trees", "create_tree"),
+        ("GET", r"/repos/{repo}/git/commits/(?P<sha>\w+)", "get_commit"),
+        ("POST", r"/repos/{repo}/git/commits", "create_commit"),
+        ("GET", r"/repos/{repo}/git/refs?/(?P<ref>heads/.+)", "get_ref"),
+        ("PATCH", r"/repos/{repo}/git/refs/(?P<ref>heads/.+)", "update_ref"),
+        ("POST", r"/repos/{repo}/git/refs", "create_ref"),
+    ]
+
+    def _route(self, method: str, path: str):
+        repo_pattern = re.escape(f"{self.repository.owner}/{self.repository.name}")
+        for route_method, pattern, name in self.ROUTES:
+            if route_method != method:
+                continue
+            match = re.fullmatch(pattern.replace("{repo}", repo_pattern), path)
+            if match:
+                return name, {key: unquote(value) for key, value in match.groupdict().items()}
+        return None, {}
+
+    def _rate_headers(self) -> dict:
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(0, self.rate_limit - self.rate_used)),
+            "X-RateLimit-Reset": str(self.rate_reset),
+            "X-RateLimit-Used": str(self.rate_used),
+            "X-RateLimit-Resource": "core",
+        }
+
+    def handle(self, method: str, raw_path: str, headers, body: bytes):
+        """(durum, yanıt_gövdesi, başlıklar)"""
+        parsed = urlparse(raw_path)
+        query = parse_qs(parsed.query)
+        route, params = self._route(method, parsed.path)
+
+        with self._lock:
+            self.calls[(method, route or "unknown")] += 1
+            self.bytes_in += len(body)
+
+            if time.time() >= self.rate_reset:
+                self.rate_used = 0
+                self.rate_reset = int(time.time()) + RATE_LIMIT_WINDOW
+            if route != "rate_limit":
+                if self.rate_used >= self.rate_limit:
+                    return 403, {"message": "API rate limit exceeded"}, self._rate_headers()
+                self.rate_used += 1
+            rate_headers = self._rate_headers()
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.tokens is not None:
+            auth = headers.get("Authorization", "")
+            token = auth.split(" ", 1)[1] if " " in auth else ""
+            if token not in self.tokens:
+                return 401, {"message": "Bad credentials"}, rate_headers
+
+        if route is None:
+            return 404, {"message": "Not Found"}, rate_headers
+
+        try:
+            payload = json.loads(body) if body else {}
+            with self._lock:
+                status, response = getattr(self, "_" + route)(params, query, payload)
+        except ApiError as e:
+            return e.status, {"message": e.message}, rate_headers
+        except (ValueError, KeyError) as e:
+            return 422, {"message": f"Invalid request: {e}"}, rate_headers
+        return status, response, rate_headers
+
+    def _rate_limit(self, params, query, payload):
+        core = {"limit": self.rate_limit, "remaining": max(0, self.rate_limit - self.rate_used),
+                "reset": self.rate_reset, "used": self.rate_used}
+        return 200, {"resources": {"core": core}, "rate": core}
+
+    def _repo(self, params, query, payload):
+        return 200, self._repo_json()
+
+    def _commits(self, params, query, payload):
+        branch = query.get("sha", [self.repository.default_branch])[0]
+        result = []
+        sha = self.repository.head(branch)
+        while sha and len(result) < int(query.get("per_page", ["30"])[0]):
+            commit = self._commit_json(sha)
+            result.append({"sha": sha, "url": f"{self._repo_url()}/commits/{sha}", "commit": commit})
+            parents = self.repository.commits[sha]["parents"]
+            sha = parents[0] if parents else None
+        return 200, result
+
+    def _get_contents(self, params, query, payload):
+        branch = query.get("ref", [self.repository.default_branch])[0]
+        blob_sha = self.repository.files(branch).get(params["path"])
+        if blob_sha is None:
+            raise ApiError(404, "Not Found")
+        return 200, self._content_json(params["path"], blob_sha)
+
+    def _put_contents(self, params, query, payload):
+        path = params["path"]
+        branch = payload.get("branch") or self.repository.default_branch
+        current = self.repository.files(branch).get(path)
+        if current is not None and not payload.get("sha"):
+            raise ApiError(422, 'Invalid request.\n\n"sha" wasn\'t supplied.')
+        if current is not None and payload["sha"] != current:
+            raise ApiError(409, f"{path} does not match {payload['sha']}")
+
+        content = base64.b64decode(payload["content"])
+        commit_sha = self.repository.commit_file(branch, path, content, payload.get("message", f"Update {path}"))
+        blob_sha = self.repository.files(branch)[path]
+        return (201 if current is None else 200), {
+            "content": self._content_json(path, blob_sha, with_content=False),
+            "commit": self._commit_json(commit_sha),
+        }
+
+    def _get_blob(self, params, query, payload):
+        content = self.repository.blobs.get(params["sha"])
+        if content is None:
+            raise ApiError(404, "Not Found")
+        return 200, {"sha": params["sha"], "size": len(content), "encoding": "base64",
+                     "content": base64.b64encode(content).decode(),
+                     "url": f"{self._repo_url()}/git/blobs/{params['sha']}"}
+
+    def _create_blob(self, params, query, payload):
+        if payload.get("encoding", "utf-8") == "base64":
+            content = base64.b64decode(payload["content"])
+        else:
+            content = payload["content"].encode("utf-8")
+        sha = self.repository.put_blob(content)
+        return 201, {"sha": sha, "url": f"{self._repo_url()}/git/blobs/{sha}"}
+
+    def _tree_json(self, sha: str) -> dict:
+        entries = self.repository.trees[sha]
+        return {
+            "sha": sha,
+            "url": f"{self._repo_url()}/git/trees/{sha}",
+            "truncated": False,
+            "tree": [{"path": path, "mode": "100644", "type": "blob", "sha": blob_sha,
+                      "size": len(self.repository.blobs[blob_sha]),
+                      "url": f"{self._repo_url()}/git/blobs/{blob_sha}"}
+                     for path, blob_sha in sorted(entries.items())],
+        }
+
+    def _get_tree(self, params, query, payload):
+        sha = params["sha"]
+        if sha in self.repository.commits:
+            sha = self.repository.commits[sha]["tree"]
+        if sha not in self.repository.trees:
+            raise ApiError(404, "Not Found")
+        return 200, self._tree_json(sha)
+
+    def _create_tree(self, params, query, payload):
+        entries = dict(self.repository.trees.get(payload.get("base_tree"), {}))
+        for item in payload["tree"]:
+            if item.get("sha") is None and "content" not in item:
+                entries.pop(item["path"], None)  # sha: null → dosyayı sil
+            elif "content" in item:
+                entries[item["path"]] = self.repository.put_blob(item["content"].encode("utf-8"))
+            else:
+                entries[item["path"]] = item["sha"]
+        return 201, self._tree_json(self.repository.put_tree(entries))
+
+    def _get_commit(self, params, query, payload):
+        if params["sha"] not in self.repository.commits:
+            raise ApiError(404, "Not Found")
+        return 200, self._commit_json(params["sha"])
+
+    def _create_commit(self, params, query, payload):
+        if payload["tree"] not in self.repository.trees:
+            raise ApiError(422, "Tree SHA does not exist")
+        sha = self.repository.put_commit(payload["message"], payload["tree"], payload.get("parents", []))
+        return 201, self._commit_json(sha)
+
+    def _get_ref(self, params, query, payload):
+        if params["ref"] not in self.repository.refs:
+            raise ApiError(404, "Not Found")
+        return 200, self._ref_json(params["ref"])
+
+    def _update_ref(self, params, query, payload):
+        ref = params["ref"]
+        current = self.repository.refs.get(ref)
+        if current is None:
+            raise ApiError(422, "Reference does not exist")
+        new_sha = payload["sha"]
+        if not payload.get("force") and current not in self.repository.commits[new_sha]["parents"]:
+            raise ApiError(422, "Update is not a fast forward")
+        self.repository.refs[ref] = new_sha
+        self.repository.pushed_at = _now()
+        return 200, self._ref_json(ref)
+
+    def _create_ref(self, params, query, payload):
+        ref = payload["ref"].replace("refs/", "", 1)
+        if ref in self.repository.refs:
+            raise ApiError(422, "Reference already exists")
+        self.repository.refs[ref] = payload["sha"]
+        return 201, self._ref_json(ref)
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # sessiz
+                pass
+
+            def _dispatch(self, method: str):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, response, headers = mock.handle(method, self.path, self.headers, body)
+                payload = json.dumps(response).encode("utf-8")
+                with mock._lock:
+                    mock.bytes_out += len(payload)
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_PUT(self):
+                self._dispatch("PUT")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_PATCH(self):
+                self._dispatch("PATCH")
+
+        return Handler
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Yerel sahte GitHub API sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency", type=float, default=0.0, help="Yanıt gecikmesi (saniye)")
+    parser.add_argument("--rate-limit", type=int, default=DEFAULT_RATE_LIMIT, help="Saatlik istek sınırı")
+    parser.add_argument("--token", action="append", dest="tokens", help="Geçerli token (tekrarlanabilir)")
+    args = parser.parse_args(argv)
+
+    server = MockGitHub(args.host, args.port, latency=args.latency, tokens=args.tokens, rate_limit=args.rate_limit)
+    print(f"Mock GitHub: {server.base_url}  (GITHUB_API_BASE olarak verin, Ctrl+C ile durdurun)")
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.snapshot(), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+"""
+Run: Benchmark senaryolarını ölçek ölçek çalıştırır ve sonuçları JSON'a yazar.
+- Her senaryo için tekrar sayısı kadar ölçüm: min / medyan / ortalama / maks (saniye)
+- İsteğe bağlı (--memory) tracemalloc ile tepe bellek kullanımı
+- Sonuç dosyasında git sürümü, Python ve platform bilgisi bulunur
+- --compare ile iki sonuç dosyası senaryo bazında karşılaştırılır
+
+Kullanım:
+    python -m benchmarks.run --scales 1,10 -o bench_results.json
+    python -m benchmarks.run --scales 100 --only aggregation,members --repeat 1
+    python -m benchmarks.run --compare eski.json yeni.json
+"""
+import argparse
+import fnmatch
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import List, Optional
+
+from benchmarks.generator import DEFAULT_SEED, ensure_dataset
+from benchmarks.scenarios import SCENARIOS, BenchContext
+
+DEFAULT_DATA_DIR = ".bench_data"
+DEFAULT_REPEAT = 3
+
+
+def _git_version() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _selected(scenario, only: List[str]) -> bool:
+    if not only:
+        return True
+    return any(fnmatch.fnmatch(scenario.name, pattern) or scenario.group == pattern for pattern in only)
+
+
+def run_scenario(scenario, ctx: BenchContext, repeat: int, memory: bool) -> dict:
+    """Senaryoyu tekrar sayısı kadar çalıştırıp süre istatistiklerini döndür"""
+    timings = []
+    items = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        items = scenario.func(ctx)
+        timings.append(time.perf_counter() - start)
+
+    result = {
+        "scenario": scenario.name,
+        "group": scenario.group,
+        "items": items,
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "max": max(timings),
+    }
+
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            scenario.func(ctx)
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def run(scales: List[float], only: List[str], repeat: int, memory: bool, data_dir: str, seed: int,
+        log=print) -> dict:
+    results = []
+    for scale in scales:
+        started = time.perf_counter()
+        dataset_dir = ensure_dataset(scale, data_dir, seed)
+        log(f"[x{scale:g}] veri hazır ({time.perf_counter() - started:.1f}s): {dataset_dir}")
+
+        ctx = BenchContext(dataset_dir)
+        try:
+            for scenario in SCENARIOS:
+                if not _selected(scenario, only):
+                    continue
+                if scale > scenario.max_scale:
+                    log(f"[x{scale:g}] {scenario.name}: atlandı (max_scale={scenario.max_scale:g})")
+                    continue
+                result = run_scenario(scenario, ctx, repeat, memory)
+                result["scale"] = scale
+                results.append(result)
+                log(f"[x{scale:g}] {scenario.name:<36} medyan {result['median'] * 1000:10.1f} ms"
+                    f"  ({result['items']} öğe)")
+        finally:
+            ctx.close()
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "version": _git_version(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": seed,
+            "scales": scales,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(old_path: str, new_path: str, log=print) -> List[dict]:
+    """İki sonuç dosyasını (senaryo, ölçek) bazında karşılaştır; oran = yeni / eski medyan"""
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    old_index = {(r["scenario"], r["scale"]): r for r in old["results"]}
+    rows = []
+    log(f"{'senaryo':<36} {'ölçek':>6} {'eski ms':>10} {'yeni ms':>10} {'oran':>7}")
+    for result in new["results"]:
+        previous = old_index.get((result["scenario"], result["scale"]))
+        if previous is None:
+            continue
+        ratio = result["median"] / previous["median"] if previous["median"] else float("inf")
+        rows.append({"scenario": result["scenario"], "scale": result["scale"],
+                     "old": previous["median"], "new": result["median"], "ratio": ratio})
+        log(f"{result['scenario']:<36} {result['scale']:>6g} {previous['median'] * 1000:10.1f} "
+            f"{result['median'] * 1000:10.1f} {ratio:7.2f}")
+    return rows
+
+
+def _parse_scales(value: str) -> List[float]:
+    return [float(part) for part in value.split(",") if part.strip()]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="BTag / CashBack benchmark senaryoları")
+    parser.add_argument("--scales", type=_parse_scales, default=[1.0, 10.0],
+                        help="Virgülle ayrılmış ölçekler (örn. 1,10,100,1000)")
+    parser.add_argument("--only", default="", help="Senaryo adı deseni ya da grup (virgülle ayrılmış)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--memory", action="store_true", help="tracemalloc ile tepe bellek ölç")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Üretilen veri setlerinin klasörü")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--list", action="store_true", help="Senaryoları listele")
+    parser.add_argument("--compare", nargs=2, metavar=("ESKI", "YENI"))
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS:
+            print(f"{scenario.group:<12} {scenario.name}")
+        return 0
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    only = [part.strip() for part in args.only.split(",") if part.strip()]
+    output = run(args.scales, only, args.repeat, args.memory, args.data_dir, args.seed)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar yazıldı: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,382 @@
+"""
+Scenarios: Uygulamanın sıcak yollarını Streamlit olmadan çalıştıran zamanlı senaryolar.
+- load: JSON dosyalarının okunması
+- aggregation: Ana sayfa, rapor, istatistik ve CashBack başlık metrikleri; üye / müşteri geçmişi indeksleri
+- excel: players-report / CashBack Excel içe aktarımı, rapor ve tarihsel analiz çıktısı
+- members: üye arama, filtreleme ve sıralama (dict listesi, member_model.MemberTable, member_search indeksi, member_views)
+- save: günlük veri, CashBack ve üye kaydetme yolları
+Her senaryo BenchContext alır ve işlenen öğe sayısını döndürür.
+"""
+import itertools
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+from typing import Callable, Dict, List, NamedTuple
+
+import analytics
+import daily_stats
+import member_model
+from btag_core import DailyDataStore, MemberService, TokenStore
+from cashback_core import CashbackProcessor, CashbackStore, group_by_customer
+from cashback_index import CustomerIndex
+from member_history import MemberHistoryIndex
+from member_search import MemberSearchIndex
+from member_views import MemberViews
+
+
+class Scenario(NamedTuple):
+    name: str
+    group: str
+    func: Callable
+    # Büyük ölçeklerde çok uzun süren senaryolar için ölçek sınırı
+    max_scale: float = float("inf")
+
+
+SCENARIOS: List[Scenario] = []
+
+
+def scenario(name: str, group: str, max_scale: float = float("inf")):
+    """Senaryo fonksiyonunu kayıt defterine ekle"""
+    def decorator(func):
+        SCENARIOS.append(Scenario(name, group, func, max_scale))
+        return func
+    return decorator
+
+
+class BenchContext:
+    """Bir ölçeğin veri seti; JSON içerikleri ilk erişimde bir kez yüklenir"""
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        with open(os.path.join(data_dir, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.anchor = date.fromisoformat(self.manifest["anchor_date"])
+        self._cache: Dict[str, object] = {}
+        self.work_dir = tempfile.mkdtemp(prefix="bench_work_")
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.data_dir, name)
+
+    def _load(self, name: str):
+        if name not in self._cache:
+            with open(self.path(name), encoding="utf-8") as f:
+                self._cache[name] = json.load(f)
+        return self._cache[name]
+
+    @property
+    def daily_data(self) -> dict:
+        return self._load("daily_data.json")
+
+    @property
+    def members(self) -> list:
+        return self._load("members.json")
+
+    @property
+    def cashback(self) -> list:
+        return self._load("CashBack.json")
+
+    @property
+    def member_table(self) -> member_model.MemberTable:
+        if "member_table" not in self._cache:
+            self._cache["member_table"] = member_model.MemberTable(member_model.load_members(self.path("members.json")))
+        return self._cache["member_table"]
+
+    @property
+    def search_index(self) -> MemberSearchIndex:
+        if "search_index" not in self._cache:
+            self._cache["search_index"] = MemberSearchIndex(self.member_table)
+        return self._cache["search_index"]
+
+    @property
+    def history_index(self) -> MemberHistoryIndex:
+        if "history_index" not in self._cache:
+            self._cache["history_index"] = MemberHistoryIndex(self.daily_data)
+        return self._cache["history_index"]
+
+    @property
+    def customer_index(self) -> CustomerIndex:
+        if "customer_index" not in self._cache:
+            self._cache["customer_index"] = CustomerIndex(CashbackStore._normalize(self.cashback))
+        return self._cache["customer_index"]
+
+    @property
+    def member_views(self) -> MemberViews:
+        if "member_views" not in self._cache:
+            self._cache["member_views"] = MemberViews(self.member_table)
+        return self._cache["member_views"]
+
+    def work_copy(self, name: str) -> str:
+        """Kaydetme senaryoları için dosyanın çalışma kopyası (orijinal veri değişmez)"""
+        target = os.path.join(self.work_dir, name)
+        if not os.path.exists(target):
+            shutil.copyfile(self.path(name), target)
+        return target
+
+    def close(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+# --- load -------------------------------------------------------------------
+
+@scenario("load_daily_data", "load")
+def load_daily_data(ctx: BenchContext):
+    with open(ctx.path("daily_data.json"), encoding="utf-8") as f:
+        return len(json.load(f))
+
+
+@scenario("load_members", "load")
+def load_members(ctx: BenchContext):
+    with open(ctx.path("members.json"), encoding="utf-8") as f:
+        return len(json.load(f))
+
+
+@scenario("load_member_table", "load")
+def load_member_table(ctx: BenchContext):
+    return len(member_model.MemberTable(member_model.load_members(ctx.path("members.json"))))
+
+
+@scenario("load_cashback", "load")
+def load_cashback(ctx: BenchContext):
+    return len(CashbackStore(json_file=ctx.path("CashBack.json")).load_all_data())
+
+
+# --- aggregation ------------------------------------------------------------
+
+@scenario("dashboard_summary", "aggregation")
+def dashboard_summary(ctx: BenchContext):
+    active = [m for m in ctx.members if m.get("is_active", True)]
+    summary = analytics.dashboard_summary(ctx.daily_data, active, ctx.anchor.strftime("%Y-%m"))
+    return summary["total_members"]
+
+
+@scenario("report_full_range", "aggregation")
+def report_full_range(ctx: BenchContext):
+    dates = analytics.sorted_dates(ctx.daily_data)
+    report = analytics.build_report(ctx.daily_data, analytics.parse_day(dates[0]), analytics.parse_day(dates[-1]))
+    analytics.member_report_rows(report["member_summary"])
+    return len(report["rows"])
+
+
+@scenario("statistics_full_range", "aggregation")
+def statistics_full_range(ctx: BenchContext):
+    dates = analytics.sorted_dates(ctx.daily_data)
+    start, end = analytics.parse_day(dates[0]), analytics.parse_day(dates[-1])
+    member_stats, _ = analytics.member_statistics(ctx.daily_data, start, end)
+    for key in ("total_deposits", "deposit_count", "total_withdrawals", "net_amount"):
+        analytics.top_members(member_stats, key)
+    analytics.daily_summary(ctx.daily_data, start, end)
+    return len(member_stats)
+
+
+@scenario("statistics_sketches_full_range", "aggregation")
+def statistics_sketches_full_range(ctx: BenchContext):
+    """statistics_full_range'in günlük özetlerle karşılığı (ilk tekrar gün özetlerinin kurulumunu içerir)"""
+    dates = analytics.sorted_dates(ctx.daily_data)
+    start, end = analytics.parse_day(dates[0]), analytics.parse_day(dates[-1])
+    return len(daily_stats.range_statistics(ctx.history_index, start, end)['top']['total_deposits'])
+
+
+@scenario("member_history_build", "aggregation")
+def member_history_build(ctx: BenchContext):
+    return len(MemberHistoryIndex(ctx.daily_data))
+
+
+@scenario("member_history_lookup", "aggregation")
+def member_history_lookup(ctx: BenchContext):
+    """Üye detayı: 100 üyenin geçmişi, toplamları ve ilk / son işlem tarihi"""
+    index = ctx.history_index
+    rows = 0
+    for member_id in index.member_ids()[:100]:
+        rows += len(index.history(member_id))
+        index.totals(member_id)
+        index.activity_range(member_id)
+    return rows
+
+
+@scenario("cashback_dashboard", "aggregation")
+def cashback_dashboard(ctx: BenchContext):
+    """Başlık metrikleri: günlük özetlerden (indeks dosya sürümü başına bir kez kurulur)"""
+    store = CashbackStore(json_file=ctx.path("CashBack.json"))
+    last_7 = store.get_summary(ctx.anchor - timedelta(days=7), ctx.anchor)
+    monthly = store.get_summary(ctx.anchor.replace(day=1), ctx.anchor)
+    store.get_daily_totals(ctx.anchor - timedelta(days=30), ctx.anchor)
+    return last_7["records"] + monthly["records"]
+
+
+@scenario("cashback_dashboard_scan", "aggregation")
+def cashback_dashboard_scan(ctx: BenchContext):
+    """Başlık metriklerinin eski yolu: her çizimde tüm geçmiş okunup filtrelenir (karşılaştırma için)"""
+    store = CashbackStore(json_file=ctx.path("CashBack.json"))
+    last_7 = store.get_data_by_date_range(ctx.anchor - timedelta(days=7), ctx.anchor)
+    monthly = store.get_data_by_date_range(ctx.anchor.replace(day=1), ctx.anchor)
+    return len(last_7) + len(monthly)
+
+
+@scenario("customer_index_build", "aggregation")
+def customer_index_build(ctx: BenchContext):
+    return len(CustomerIndex(CashbackStore._normalize(ctx.cashback)))
+
+
+_customer_query_runs = itertools.count()
+
+
+@scenario("customer_index_queries", "aggregation")
+def customer_index_queries(ctx: BenchContext):
+    """Müşteri detayı (100 müşteri), tekrar eden müşteriler ve son 30 / önceki 30 gün karşılaştırması"""
+    index = ctx.customer_index
+    rows = 0
+    for customer_id in index.customers()[:100]:
+        rows += len(index.customer_history(customer_id))
+        index.totals(customer_id, ctx.anchor - timedelta(days=30), ctx.anchor)
+    # leaderboard / compare sonuçları önbelleklenir; her tekrar farklı bir aralık sorar
+    end = ctx.anchor - timedelta(days=next(_customer_query_runs))
+    rows += len(index.leaderboard(20, end - timedelta(days=90), end))
+    rows += len(index.compare((end - timedelta(days=59), end - timedelta(days=30)), (end - timedelta(days=29), end)))
+    return rows
+
+
+@scenario("cashback_history_grouping", "aggregation")
+def cashback_history_grouping(ctx: BenchContext):
+    store = CashbackStore(json_file=ctx.path("CashBack.json"))
+    grouped = group_by_customer(store.get_data_by_date_range(ctx.anchor - timedelta(days=30), ctx.anchor))
+    return len(grouped)
+
+
+# --- excel ------------------------------------------------------------------
+
+@scenario("excel_ingest_players_report", "excel")
+def excel_ingest_players_report(ctx: BenchContext):
+    import pandas as pd
+
+    df = pd.read_excel(ctx.path("players-report.xlsx"))
+    store = DailyDataStore(daily_data_file=ctx.work_copy("daily_data.json"),
+                           members_file=ctx.work_copy("members.json"))
+    btag = ctx.manifest["btag_list"][0]
+    processed = store.process_excel_data(df[df['BTag'].astype(str) == btag])
+    return len(processed)
+
+
+@scenario("excel_ingest_cashback", "excel")
+def excel_ingest_cashback(ctx: BenchContext):
+    processor = CashbackProcessor()
+    grouped = processor.process_cashback_data(processor.read_excel(ctx.path("cashback.xlsx")))
+    return len(grouped)
+
+
+@scenario("excel_export_btag_report_7d", "excel", max_scale=100)
+def excel_export_btag_report(ctx: BenchContext):
+    from excel_export import build_report_workbook
+
+    report = analytics.build_report(ctx.daily_data, ctx.anchor - timedelta(days=6), ctx.anchor)
+    content = build_report_workbook(report, analytics.member_report_rows(report["member_summary"]))
+    return len(report["rows"]) if content else 0
+
+
+@scenario("excel_export_cashback_history_30d", "excel", max_scale=100)
+def excel_export_cashback_history(ctx: BenchContext):
+    store = CashbackStore(json_file=ctx.path("CashBack.json"))
+    date_range = (ctx.anchor - timedelta(days=30), ctx.anchor)
+    grouped = group_by_customer(store.get_data_by_date_range(*date_range))
+    content = CashbackProcessor().create_historical_analysis_excel(grouped.to_dict("records"), date_range)
+    return len(grouped) if content else 0
+
+
+# --- members ----------------------------------------------------------------
+
+SEARCH_TERMS = ["a", "yıl", "Mehmet", "ayse", "çelik", "30", "zzz"]
+SORT_KEYS = ["ID", "İsim", "Son Yatırım", "Toplam Yatırım"]
+
+
+@scenario("member_search", "members")
+def member_search(ctx: BenchContext):
+    found = 0
+    for term in SEARCH_TERMS:
+        found += len(analytics.filter_members(ctx.members, term, "Tümü"))
+    return found
+
+
+@scenario("member_filter_sort_page", "members")
+def member_filter_sort_page(ctx: BenchContext):
+    # Üye Yönetimi sayfasının her rerun'da yaptığı iş: filtrele + sırala + 1 sayfa
+    shown = 0
+    for sort_by in SORT_KEYS:
+        members = analytics.filter_members(list(ctx.members), "", "Aktif")
+        analytics.sort_members(members, sort_by)
+        shown += len(members[:10])
+    return shown
+
+
+@scenario("member_table_search", "members")
+def member_table_search(ctx: BenchContext):
+    table = ctx.member_table
+    return sum(len(table.filter(term, "Tümü")) for term in SEARCH_TERMS)
+
+
+@scenario("member_table_filter_sort_page", "members")
+def member_table_filter_sort_page(ctx: BenchContext):
+    table = ctx.member_table
+    shown = 0
+    for sort_by in SORT_KEYS:
+        indices = table.sort(table.filter("", "Aktif"), sort_by)
+        shown += len([table.record(i) for i in indices[:10]])
+    return shown
+
+
+@scenario("build_member_views", "members")
+def build_member_views(ctx: BenchContext):
+    return len(MemberViews(ctx.member_table).table)
+
+
+@scenario("member_views_page", "members")
+def member_views_page(ctx: BenchContext):
+    views = ctx.member_views
+    shown = 0
+    for sort_by in SORT_KEYS:
+        indices, _ = views.page(sort_by, "Aktif", 0, 10)
+        shown += len([views.table.record(i) for i in indices])
+    return shown
+
+
+@scenario("build_search_index", "members")
+def build_search_index(ctx: BenchContext):
+    return len(MemberSearchIndex(ctx.member_table).words)
+
+
+@scenario("member_index_search", "members")
+def member_index_search(ctx: BenchContext):
+    index = ctx.search_index
+    return sum(len(index.search(term, "Tümü")) for term in SEARCH_TERMS)
+
+
+# --- save -------------------------------------------------------------------
+
+@scenario("save_daily_data", "save")
+def save_daily_data(ctx: BenchContext):
+    store = DailyDataStore(daily_data_file=ctx.work_copy("daily_data.json"),
+                           members_file=ctx.work_copy("members.json"))
+    day = ctx.daily_data[max(ctx.daily_data)]
+    btag, records = next(iter(day.items()))
+    store.save_daily_data(records, btag, ctx.anchor + timedelta(days=1))
+    return len(records)
+
+
+@scenario("save_cashback", "save")
+def save_cashback(ctx: BenchContext):
+    store = CashbackStore(json_file=ctx.work_copy("CashBack.json"))
+    records = ctx.cashback[0]["data"]
+    store.save_to_json(records, ctx.anchor + timedelta(days=1))
+    return len(records)
+
+
+@scenario("save_member_toggle", "save")
+def save_member_toggle(ctx: BenchContext):
+    members_file = ctx.work_copy("members.json")
+    service = MemberService(
+        members_file=members_file,
+        token_manager=TokenStore(token_file=os.path.join(ctx.work_dir, "token.json")),
+        data_processor=DailyDataStore(daily_data_file=ctx.work_copy("daily_data.json"), members_file=members_file)
+    )
+    service.toggle_member_status(ctx.members[len(ctx.members) // 2]["member_id"])
+    return 1
@@ -1,9 +1,6 @@
 import streamlit as st
 import pandas as pd
-import json
 import os
-import requests
-import time
 from datetime import datetime, timedelta
 
 def clear_streamlit_cache():
@@ -16,6 +13,16 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from io import BytesIO
+import data_export
+import analytics
+import daily_stats
+import perf
+import metrics
+import profiling
+import serializer
+from excel_export import build_report_workbook
+from btag_core import TokenStore, DailyDataStore, MemberService
+from streamlit_reporter import StreamlitReporter
 # GitHub sync'i opsiyonel olarak import et
 try:
     from github_sync import GitHubSync
@@ -24,7 +31,7 @@ except ImportError:
     GITHUB_SYNC_AVAILABLE = False
     class GitHubSync:
         """Dummy GitHub sync class when not available"""
-        def __init__(self):
+        def __init__(self, *args, **kwargs):
             self.sync_enabled = False
 
 # Streamlit sayfa konfigürasyonu
@@ -35,6 +42,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ENV BTAG_METRICS_PORT / BTAG_METRICS_FILE ile metrik dışa aktarımı (süreç başına bir kez başlar)
+metrics.start_from_env()
+
 # CSS stil eklemeleri
 st.markdown("""
 <style>
@@ -55,662 +65,58 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-class TokenManager:
+class TokenManager(TokenStore):
     """Token yönetimi için sınıf"""
     def __init__(self):
-        self.token_file = "token.json"
-        self.ensure_token_file()
-    
-    def ensure_token_file(self):
-        """Token dosyasının varlığını kontrol et"""
-        if not os.path.exists(self.token_file):
-            default_token = {
-                "token": "",
-                "api_url": "https://backofficewebadmin.betconstruct.com/api/tr/Client/GetClientWithdrawalRequestsWithTotals"
-            }
-            with open(self.token_file, 'w', encoding='utf-8') as f:
-                json.dump(default_token, f, ensure_ascii=False, indent=2)
-    
-    def load_token(self):
-        """Token dosyasını yükle"""
-        try:
-            with open(self.token_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            st.error(f"Token dosyası okuma hatası: {e}")
-            return {"token": "", "api_url": ""}
-    
-    def save_token(self, token, api_url):
-        """Token dosyasını kaydet"""
-        try:
-            token_data = {
-                "token": token,
-                "api_url": api_url
-            }
-            with open(self.token_file, 'w', encoding='utf-8') as f:
-                json.dump(token_data, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            st.error(f"Token kaydetme hatası: {e}")
-            return False
+        super().__init__(reporter=StreamlitReporter())
 
-class DataProcessor:
+class DataProcessor(DailyDataStore):
     """Veri işleme sınıfı"""
     def __init__(self):
-        self.daily_data_file = "daily_data.json"
-        self.members_file = "members.json"
-        self.github_sync = GitHubSync() if GITHUB_SYNC_AVAILABLE else None
-        self.ensure_data_files()
-    
-    def ensure_data_files(self):
-        """Veri dosyalarını oluştur"""
-        if not os.path.exists(self.daily_data_file):
-            with open(self.daily_data_file, 'w', encoding='utf-8') as f:
-                json.dump({}, f)
-        
-        if not os.path.exists(self.members_file):
-            with open(self.members_file, 'w', encoding='utf-8') as f:
-                json.dump([], f)
-    
-    def process_excel_data(self, df):
-        """Excel verisini işle"""
-        column_mapping = {
-            'ID': 'member_id',
-            'Kullanıcı Adı': 'username', 
-            'Müşteri Adı': 'customer_name',
-            'Para Yatırma Sayısı': 'deposit_count',
-            'Yatırımlar': 'total_deposits',
-            'Para Çekme Sayısı': 'withdrawal_count',
-            'Para Çekme Miktarı': 'total_withdrawals'
-        }
-        
-        df_processed = df.copy()
-        
-        for old_col, new_col in column_mapping.items():
-            if old_col in df_processed.columns:
-                df_processed = df_processed.rename(columns={old_col: new_col})
-        
-        required_columns = ['member_id', 'username', 'customer_name', 'deposit_count', 
-                          'total_deposits', 'withdrawal_count', 'total_withdrawals']
-        
-        for col in required_columns:
-            if col not in df_processed.columns:
-                df_processed[col] = 0
-        
-        numeric_columns = ['deposit_count', 'total_deposits', 'withdrawal_count', 'total_withdrawals']
-        for col in numeric_columns:
-            df_processed[col] = pd.to_numeric(df_processed[col], errors='coerce')
-            df_processed[col] = df_processed[col].fillna(0)
-        
-        string_columns = ['member_id', 'username', 'customer_name'] 
-        for col in string_columns:
-            df_processed[col] = df_processed[col].astype(str)
-            df_processed[col] = df_processed[col].fillna('')
-        
-        return df_processed[required_columns]
-    
-    def save_daily_data(self, processed_df, btag, date):
-        """Günlük veriyi kaydet ve GitHub'a senkronize et"""
-        try:
-            with open(self.daily_data_file, 'r', encoding='utf-8') as f:
-                daily_data = json.load(f)
-            
-            date_str = date.strftime('%Y-%m-%d')
-            
-            if date_str not in daily_data:
-                daily_data[date_str] = {}
-            
-            daily_data[date_str][btag] = processed_df.to_dict('records')
-            
-            with open(self.daily_data_file, 'w', encoding='utf-8') as f:
-                json.dump(daily_data, f, ensure_ascii=False, indent=2)
-            
-            # Otomatik GitHub senkronizasyonu
-            if self.github_sync and self.github_sync.sync_enabled:
-                with st.spinner("GitHub'a senkronize ediliyor..."):
-                    sync_success = self.github_sync.sync_json_file(self.daily_data_file)
-                    if sync_success:
-                        st.success("🔄 Veriler GitHub'a otomatik yüklendi!")
-            
-            return True
-        except Exception as e:
-            st.error(f"Veri kaydetme hatası: {e}")
-            return False
+        reporter = StreamlitReporter()
+        super().__init__(
+            reporter=reporter,
+            github_sync=GitHubSync(reporter=reporter) if GITHUB_SYNC_AVAILABLE else None
+        )
 
-class MemberManager:
+class MemberManager(MemberService):
     """Üye yönetimi sınıfı"""
     def __init__(self):
-        self.members_file = "members.json"
-        self.ensure_members_file()
-        self.token_manager = TokenManager()
-        self.data_processor = DataProcessor()
-        self.github_sync = GitHubSync() if GITHUB_SYNC_AVAILABLE else None
-    
-    def ensure_members_file(self):
-        """Üye dosyasını oluştur"""
-        if not os.path.exists(self.members_file):
-            with open(self.members_file, 'w', encoding='utf-8') as f:
-                json.dump([], f)
-    
-    def get_all_members(self):
-        """Tüm üyeleri getir"""
-        try:
-            with open(self.members_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return []
-    
-    def get_active_members(self):
-        """Aktif üyeleri getir"""
-        all_members = self.get_all_members()
-        return [member for member in all_members if member.get('is_active', True)]
-    
-    def add_member(self, member_id, username, full_name):
-        """Yeni üye ekle"""
-        try:
-            members = self.get_all_members()
-            
-            existing_member = next((m for m in members if m['member_id'] == str(member_id)), None)
-            if existing_member:
-                return False
-            
-            new_member = {
-                "member_id": str(member_id),
-                "username": username,
-                "full_name": full_name,
-                "is_active": True,
-                "created_at": datetime.now().isoformat(),
-                "last_deposit_date": None,
-                "days_without_deposit": 0,
-                "api_data": {},
-                "kpi_data": {},
-                "last_kpi_update": None,
-                "total_deposits": 0,
-                "total_withdrawals": 0,
-                "deposit_count": 0,
-                "withdrawal_count": 0
-            }
-            
-            members.append(new_member)
-            
-            with open(self.members_file, 'w', encoding='utf-8') as f:
-                json.dump(members, f, ensure_ascii=False, indent=2)
-            
-            # Üye eklendikten sonra API'den veri çek
-            self.fetch_member_api_data(str(member_id))
-            # KPI verilerini güncelle
-            self.update_member_kpis(str(member_id))
-            
-            return True
-        except Exception as e:
-            st.error(f"Üye ekleme hatası: {e}")
-            return False
-    
-    def add_members_bulk(self, member_ids):
-        """Toplu üye ekleme - API'den detaylı bilgilerle"""
-        added_count = 0
-        failed_ids = []
-        
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        for i, member_id in enumerate(member_ids):
-            if member_id.strip():
-                status_text.text(f"İşleniyor: {member_id.strip()}")
-                
-                # API'den üye bilgilerini çek
-                member_data = self.fetch_member_api_data(member_id.strip())
-                
-                if member_data and member_data.get('username'):
-                    success = self.add_member(
-                        member_id.strip(),
-                        member_data.get('username', f'User_{member_id}'),
-                        member_data.get('full_name', f'Member {member_id}')
-                    )
-                    if success:
-                        added_count += 1
-                        # KPI verilerini güncelle
-                        self.update_member_kpis(member_id.strip())
-                    else:
-                        failed_ids.append(member_id.strip())
-                else:
-                    failed_ids.append(member_id.strip())
-                
-                # Progress güncellemesi
-                progress = (i + 1) / len(member_ids)
-                progress_bar.progress(progress)
-        
-        progress_bar.empty()
-        status_text.empty()
-        
-        if failed_ids:
-            st.warning(f"⚠️ {len(failed_ids)} ID için veri çekilemedi: {', '.join(failed_ids[:5])}{'...' if len(failed_ids) > 5 else ''}")
-        
-        return added_count
-    
-    def fetch_member_api_data(self, member_id):
-        """API'den üye verilerini çek"""
-        try:
-            token_data = self.token_manager.load_token()
-            token = token_data.get('token', '')
-            
-            if not token:
-                return None
-            
-            # API URL'leri
-            client_url = f"https://backofficewebadmin.betconstruct.com/api/tr/Client/GetClientById?id={member_id}"
-            kpi_url = "https://backofficewebadmin.betconstruct.com/api/tr/Client/GetClientKpis"
-            
-            headers = {
-                'Authentication': token,
-                'Accept': 'application/json',
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
-                'Referer': 'https://backoffice.betconstruct.com/',
-                'Origin': 'https://backoffice.betconstruct.com',
-                'X-Requested-With': 'XMLHttpRequest'
-            }
-            
-            # Temel üye bilgilerini çek
-            client_response = requests.get(client_url, headers=headers, timeout=10)
-            
-            if client_response.status_code == 200:
-                client_data = client_response.json()
-                
-                # API verisini işle ve standartlaştır
-                processed_data = self.process_api_response(client_data)
-                
-                # KPI verilerini çek
-                try:
-                    kpi_payload = {"ClientId": int(member_id)}
-                    kpi_response = requests.post(kpi_url, headers=headers, json=kpi_payload, timeout=10)
-                    
-                    if kpi_response.status_code == 200:
-                        kpi_data = kpi_response.json()
-                        if not kpi_data.get("HasError", True) and kpi_data.get("Data"):
-                            kpi_info = kpi_data["Data"][0] if kpi_data["Data"] else {}
-                            processed_data.update({
-                                'total_deposits': kpi_info.get('TotalDeposit', 0),
-                                'total_withdrawals': kpi_info.get('TotalWithdrawal', 0),
-                                'deposit_count': kpi_info.get('DepositCount', 0),
-                                'withdrawal_count': kpi_info.get('WithdrawalCount', 0),
-                                'last_kpi_update': datetime.now().isoformat()
-                            })
-                except Exception as kpi_error:
-                    st.warning(f"KPI verileri çekilirken hata oluştu: {kpi_error}")
-                
-                # Üye veritabanını güncelle
-                self.update_member_api_data(member_id, processed_data)
-                
-                return processed_data
-            else:
-                st.warning(f"API yanıt hatası ({client_response.status_code}): {member_id}")
-                return None
-                
-        except Exception as e:
-            st.warning(f"API çağrısı hatası: {e}")
-            return None
+        super().__init__(
+            token_manager=TokenManager(),
+            data_processor=DataProcessor(),
+            reporter=StreamlitReporter()
+        )
+        self.github_sync = self.data_processor.github_sync
     
-    def is_token_valid(self, token):
-        """Token'ın geçerli olup olmadığını kontrol et"""
-        if not token:
-            return False
-            
-        # Token'ın son kullanma tarihini kontrol et
-        try:
-            if len(token) < 10:
-                return False
-                
-            # JWT token kontrolü
-            parts = token.split('.')
-            if len(parts) != 3:
-                return True  # JWT değilse basit token olarak kabul et
-            
-            # Payload kısmını al
-            payload = parts[1]
-            # Padding ekle (base64 decode için)
-            payload += '=' * (4 - len(payload) % 4)
-            
-            # Base64 decode et
-            import base64
-            import json
-            payload_data = json.loads(base64.b64decode(payload).decode('utf-8'))
-            
-            # Expire kontrolü
-            import time
-            current_time = time.time()
-            exp_time = payload_data.get('exp', 0)
-            
-            return exp_time > current_time
-        except:
-            # JWT decode hatası durumunda basit token olarak kabul et
-            return True
-
-    def update_member_kpis(self, member_id):
-        """Tek bir üyenin KPI verilerini güncelle"""
-        try:
-            members = self.get_all_members()
-            member_found = False
-            
-            for member in members:
-                if member['member_id'] == str(member_id):
-                    member_found = True
-                    
-                    # Token'ı yükle ve kontrol et
-                    token_data = self.token_manager.load_token()
-                    token = token_data.get('token', '')
-                    
-                    if not token or not self.is_token_valid(token):
-                        st.warning("Geçersiz veya süresi dolmuş API token'ı. Lütfen ayarlardan yeni bir token girin.")
-                        return False
-                    
-                    kpi_url = "https://backofficewebadmin.betconstruct.com/api/tr/Client/GetClientKpis"
-                    headers = {
-                        'Authentication': token,  # Bearer kaldırıldı
-                        'Accept': 'application/json',
-                        'Content-Type': 'application/json;charset=UTF-8',
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'Origin': 'https://backoffice.betconstruct.com',
-                        'Referer': 'https://backoffice.betconstruct.com/'
-                    }
-                    
-                    try:
-                        kpi_payload = {"ClientId": int(member_id)}
-                        
-                        # Debug için istek bilgilerini yazdır
-                        print(f"Sending request to {kpi_url}")
-                        print(f"Headers: {headers}")
-                        print(f"Payload: {kpi_payload}")
-                        
-                        response = requests.post(
-                            kpi_url, 
-                            headers=headers, 
-                            json=kpi_payload, 
-                            timeout=30
-                        )
-                        
-                        print(f"Response status: {response.status_code}")
-                        print(f"Response text: {response.text[:500]}")
-                        
-                        if response.status_code == 200:
-                            kpi_data = response.json()
-                            
-                            if kpi_data.get("HasError", True):
-                                error_msg = kpi_data.get("ErrorMessage", "Bilinmeyen hata")
-                                st.warning(f"API hatası: {error_msg}")
-                                
-                                # Yetki hatasında token'ı temizle
-                                if "token" in error_msg.lower() or "yetkisiz" in error_msg.lower():
-                                    self.token_manager.save_token("", "")
-                                return False
-                                
-                            if not kpi_data.get("Data"):
-                                st.warning(f"{member_id} ID'li üye için KPI verisi bulunamadı.")
-                                return False
-                                
-                            kpi_info = kpi_data["Data"][0] if kpi_data["Data"] else {}
-                            
-                            # KPI verilerini güncelle
-                            member['kpi_data'] = kpi_info
-                            member['last_kpi_update'] = datetime.now().isoformat()
-                            # Ana alanları da güncelle ve float'a çevir
-                            member['total_deposits'] = float(kpi_info.get('TotalDeposit', member.get('total_deposits', 0)) or 0)
-                            member['total_withdrawals'] = float(kpi_info.get('TotalWithdrawal', member.get('total_withdrawals', 0)) or 0)
-                            member['deposit_count'] = int(kpi_info.get('DepositCount', member.get('deposit_count', 0)) or 0)
-                            member['withdrawal_count'] = int(kpi_info.get('WithdrawalCount', member.get('withdrawal_count', 0)) or 0)
-                            
-                            # Dosyayı kaydet
-                            with open(self.members_file, 'w', encoding='utf-8') as f:
-                                json.dump(members, f, ensure_ascii=False, indent=2)
-                            
-                            return True
-                            
-                        elif response.status_code == 401 or response.status_code == 403:
-                            st.error("Yetkisiz erişim hatası. Lütfen API token'ınızı kontrol edin ve güncelleyin.")
-                            self.token_manager.save_token("", "")  # Geçersiz token'ı temizle
-                            return False
-                            
-                        else:
-                            st.warning(f"API yanıt hatası ({response.status_code}): {response.text}")
-                            return False
-                            
-                    except requests.exceptions.RequestException as req_err:
-                        st.error(f"API isteği sırasında hata oluştu: {req_err}")
-                        return False
-                        
-            if not member_found:
-                st.warning(f"{member_id} ID'li üye bulunamadı.")
-                
-            return False
-            
-        except Exception as e:
-            st.error(f"Beklenmeyen bir hata oluştu: {str(e)}")
-            import traceback
-            print(f"Hata detayı: {traceback.format_exc()}")
-            return False
-            
     def update_all_members_kpis(self):
-        """Tüm üyelerin KPI verilerini güncelle"""
+        """Tüm üyelerin KPI verilerini güncelle ve sonucu göster"""
         try:
-            members = self.get_all_members()
-            total_members = len(members)
-
-            if total_members == 0:
-                st.warning("Güncellenecek üye bulunamadı.")
-                return
-
-            # Token kontrolü yap
-            token_data = self.token_manager.load_token()
-            if not token_data.get('token'):
-                st.error("API token'ı bulunamadı. Lütfen ayarlardan token girin.")
+            result = super().update_all_members_kpis()
+            if result is None:
                 return
-
-            # İlerleme çubuğu ve durum metni oluştur
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            error_container = st.container()
-
-            updated_count = 0
-            failed_count = 0
-            errors = []
-
-            # Her bir üye için KPI güncelle
-            for i, member in enumerate(members):
-                member_id = member['member_id']
-                username = member.get('username', f'Üye-{member_id}')
-
-                # İlerleme durumunu güncelle
-                progress = (i + 1) / total_members
-                progress_bar.progress(progress)
-                status_text.text(f"Güncelleniyor: {username} ({i+1}/{total_members}) - Başarılı: {updated_count}, Başarısız: {failed_count}")
-
-                # KPI'ları güncelle
-                try:
-                    if self.update_member_kpis(member_id):
-                        updated_count += 1
-                    else:
-                        failed_count += 1
-                        errors.append(f"{username} (ID: {member_id}): Güncelleme başarısız")
-
-                    # API'ye çok fazla yüklenmemek için kısa bir bekleme
-                    time.sleep(0.5)
-
-                except Exception as e:
-                    failed_count += 1
-                    error_msg = f"{username} (ID: {member_id}) güncellenirken hata: {str(e)}"
-                    errors.append(error_msg)
-                    print(error_msg)  # Konsola da yazdır
-
-                # Her 5 üyede bir hataları göster
-                if errors and (i + 1) % 5 == 0:
-                    with error_container:
-                        st.error("Güncelleme hataları:")
-                        for error in errors[-10:]:  # Son 10 hatayı göster
-                            st.write(f"• {error}")
-                        if len(errors) > 10:
-                            st.info(f"Toplam {len(errors)} hata oluştu, son 10 hata gösteriliyor.")
-
-            # Tüm işlemler bittiğinde sonuçları göster
-            progress_bar.empty()
-            status_text.empty()
             
             # Son hataları göster
+            errors = result["errors"]
             if errors:
-                with error_container:
-                    st.error("Son güncelleme hataları:")
-                    for error in errors[-10:]:
-                        st.write(f"• {error}")
-                    if len(errors) > 10:
-                        st.info(f"Toplam {len(errors)} hata oluştu, son 10 hata gösteriliyor.")
-
-            if updated_count > 0:
-                st.success(f"✅ {updated_count} üyenin KPI verileri güncellendi.")
-            if failed_count > 0:
-                st.error(f"❌ {failed_count} üyenin KPI verileri güncellenirken hata oluştu.")
-
+                st.error("Son güncelleme hataları:")
+                for error in errors[-10:]:
+                    st.write(f"• {error}")
+                if len(errors) > 10:
+                    st.info(f"Toplam {len(errors)} hata oluştu, son 10 hata gösteriliyor.")
+            
+            if result["updated"] > 0:
+                st.success(f"✅ {result['updated']} üyenin KPI verileri güncellendi.")
+            if result["failed"] > 0:
+                st.error(f"❌ {result['failed']} üyenin KPI verileri güncellenirken hata oluştu.")
+            
             # Sayfayı yenile
             st.rerun()
             
         except Exception as e:
             st.error(f"Toplu güncelleme sırasında beklenmeyen bir hata oluştu: {str(e)}")
-            import traceback
-            print(f"Hata detayı: {traceback.format_exc()}")
             st.stop()
 
-def process_api_response(self, api_data):
-    """API yanıtını işle ve standartlaştır"""
-    try:
-        # API yanıtı doğrudan Data içinde gelebilir veya başka bir yapıda olabilir
-        if 'Data' in api_data and isinstance(api_data['Data'], dict):
-            data = api_data['Data']
-        else:
-            data = api_data  # Zaten doğrudan data gelmişse
-
-        # Tarih formatı dönüşümü için yardımcı fonksiyon
-        def parse_date(date_str):
-            if not date_str:
-                return ''
-            try:
-                # Farklı tarih formatlarını işle
-                for fmt in ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d'):
-                    try:
-                        return datetime.strptime(date_str.split('.')[0], fmt).strftime('%Y-%m-%d %H:%M:%S')
-                    except (ValueError, AttributeError):
-                        continue
-                return date_str
-            except Exception:
-                return date_str
-
-        processed = {
-            'username': data.get('Login', data.get('username', '')),
-            'full_name': f"{data.get('FirstName', data.get('first_name', ''))} {data.get('LastName', data.get('last_name', ''))}".strip(),
-            'email': data.get('Email', data.get('email', '')),
-            'phone': data.get('Phone', data.get('phone', '')),
-            'balance': float(data.get('Balance', data.get('balance', 0)) or 0),
-            'currency': data.get('Currency', data.get('currency', 'TRY')),
-            'registration_date': parse_date(data.get('RegistrationDate', data.get('registration_date', ''))),
-            'last_login_date': parse_date(data.get('LastLoginDate', data.get('last_login_date', ''))),
-            'is_active': not data.get('IsBlocked', not data.get('is_active', True) if 'is_active' in data else False),
-            'partner_name': data.get('PartnerName', data.get('partner_name', '')),
-            'birth_date': parse_date(data.get('BirthDate', data.get('birth_date', ''))),
-            'last_deposit_date': parse_date(data.get('LastDepositDate', data.get('last_deposit_date', ''))),
-            'last_casino_bet': parse_date(data.get('LastCasinoBet', data.get('last_casino_bet', '')))
-        }
-
-        # Günlük verileri kontrol et ve güncelle
-        if 'last_deposit_date' in processed and processed['last_deposit_date']:
-            try:
-                last_deposit = datetime.strptime(processed['last_deposit_date'].split('.')[0], '%Y-%m-%d %H:%M:%S')
-                days_diff = (datetime.now() - last_deposit).days
-                processed['days_without_deposit'] = max(0, days_diff)
-            except (ValueError, AttributeError, Exception):
-                processed['days_without_deposit'] = 999  # Hata durumunda büyük bir değer ata
-                
-        return processed
-        
-    except Exception as e:
-        st.error(f"API yanıtı işlenirken hata: {e}")
-        # Hata durumunda en azından boş bir dict döndür
-        return {
-            'username': '',
-            'full_name': '',
-            'email': '',
-            'phone': '',
-            'balance': 0,
-            'currency': 'TRY',
-            'registration_date': '',
-            'last_login_date': '',
-            'is_active': True,
-            'partner_name': '',
-            'birth_date': '',
-            'last_deposit_date': '',
-            'last_casino_bet': '',
-            'days_without_deposit': 999
-        }
-
-    def update_member_api_data(self, member_id, api_data):
-        """Üye API verisini güncelle"""
-        try:
-            members = self.get_all_members()
-            
-            for member in members:
-                if member['member_id'] == str(member_id):
-                    # Mevcut KPI verilerini koru
-                    kpi_data = member.get('kpi_data', {})
-                    last_kpi_update = member.get('last_kpi_update')
-                    
-                    # Üye verilerini güncelle
-                    member.update({
-                        'api_data': api_data,
-                        'last_api_update': datetime.now().isoformat(),
-                        'kpi_data': kpi_data,
-                        'last_kpi_update': last_kpi_update
-                    })
-                    
-                    # API'den gelen bilgileri üye kaydına ekle
-                    if api_data:
-                        member['email'] = api_data.get('email', member.get('email', ''))
-                        member['phone'] = api_data.get('phone', member.get('phone', ''))
-                        member['balance'] = api_data.get('balance', member.get('balance', 0))
-                        member['currency'] = api_data.get('currency', member.get('currency', 'TRY'))
-                        member['total_deposits'] = api_data.get('total_deposits', member.get('total_deposits', 0))
-                        member['total_withdrawals'] = api_data.get('total_withdrawals', member.get('total_withdrawals', 0))
-                        member['last_deposit_date'] = api_data.get('last_deposit_date', member.get('last_deposit_date', ''))
-                        member['last_casino_bet'] = api_data.get('last_casino_bet', member.get('last_casino_bet', ''))
-                        member['days_without_deposit'] = api_data.get('days_without_deposit', member.get('days_without_deposit', 999))
-                        member['registration_date'] = api_data.get('registration_date', member.get('registration_date', ''))
-                        member['last_login_date'] = api_data.get('last_login_date', member.get('last_login_date', ''))
-                        member['partner_name'] = api_data.get('partner_name', member.get('partner_name', ''))
-                        member['birth_date'] = api_data.get('birth_date', member.get('birth_date', ''))
-                    
-                    break
-            
-            with open(self.members_file, 'w', encoding='utf-8') as f:
-                json.dump(members, f, ensure_ascii=False, indent=2)
-            
-            return True
-        except Exception as e:
-            st.error(f"Üye güncelleme hatası: {e}")
-            return False
-    
-    def toggle_member_status(self, member_id):
-        """Üyenin aktif/pasif durumunu değiştir"""
-        try:
-            members = self.get_all_members()
-            
-            for member in members:
-                if member['member_id'] == str(member_id):
-                    member['is_active'] = not member.get('is_active', True)
-                    member['status_updated_at'] = datetime.now().isoformat()
-                    break
-            
-            with open(self.members_file, 'w', encoding='utf-8') as f:
-                json.dump(members, f, ensure_ascii=False, indent=2)
-            
-            return True
-        except Exception as e:
-            st.error(f"Üye durumu değiştirme hatası: {e}")
-            return False
-
 def show_reports():
     """Raporlar sayfası"""
     st.header("📊 Raporlar")
@@ -719,8 +125,7 @@ def show_reports():
     
     # Günlük verileri yükle
     try:
-        with open(member_manager.data_processor.daily_data_file, 'r', encoding='utf-8') as f:
-            daily_data = json.load(f)
+        daily_data = serializer.load_file(member_manager.data_processor.daily_data_file)
     except Exception as e:
         st.error(f"Veri yükleme hatası: {e}")
         st.warning("Henüz veri bulunmuyor.")
@@ -938,7 +343,7 @@ def show_settings():
     st.header("⚙️ Ayarlar")
     
     # API Ayarları Sekmesi
-    tab1, tab2 = st.tabs(["🔑 API Ayarları", "🔄 GitHub Senkronizasyon"])
+    tab1, tab2, tab3, tab4 = st.tabs(["🔑 API Ayarları", "🔄 GitHub Senkronizasyon", "⏱️ Performans", "🔬 Profilleme"])
     
     with tab1:
         st.subheader("📋 API Token Ayarları")
@@ -969,6 +374,13 @@ def show_settings():
                 else:
                     st.error("❌ Lütfen tüm alanları doldurun!")
     
+    # GitHub sekmesi modül yoksa erken döndüğü için performans sekmeleri önce çizilir
+    with tab3:
+        show_performance_panel()
+    
+    with tab4:
+        show_profiling_panel()
+    
     with tab2:
         st.subheader("🔄 GitHub Otomatik Senkronizasyon")
         
@@ -977,11 +389,10 @@ def show_settings():
             st.info("📦 GitHub özelliklerini kullanmak için requirements.txt dosyasını GitHub'a yükleyin.")
             return
         
-        # GitHub Sync nesnesi oluştur
-        github_sync = GitHubSync()
-        
-        # Repository bilgilerini göster
-        repo_info = github_sync.get_repo_info() if github_sync.sync_enabled else None
+        # GitHub Sync nesnesi oluştur ve repository bilgilerini al
+        with perf.stage("github.repo_info"):
+            github_sync = GitHubSync(reporter=StreamlitReporter())
+            repo_info = github_sync.get_repo_info() if github_sync.sync_enabled else None
         if repo_info:
             st.success("✅ GitHub bağlantısı başarılı!")
             
@@ -1048,6 +459,131 @@ def show_settings():
         - `token.json`
         """)
 
+def show_performance_panel():
+    """Son rerun'ın aşama dökümü ve aşama bazında kayan yüzdelikler"""
+    st.subheader("⏱️ Performans")
+    
+    if not perf.ENABLED:
+        st.info("Ölçüm kapalı (BTAG_PERF=0).")
+        return
+    
+    reruns = perf.recent_reruns("btag")
+    if reruns:
+        last = reruns[0]
+        started = datetime.fromtimestamp(last['started_at']).strftime('%H:%M:%S')
+        note = " (st.rerun / st.stop ile kesildi)" if last['interrupted'] else ""
+        st.caption(f"Son tamamlanan çalıştırma: {started} - {last['seconds'] * 1000:.0f} ms{note}")
+        
+        stage_rows = [{
+            'Aşama': name,
+            'Adet': stage['count'],
+            'Süre (ms)': round(stage['seconds'] * 1000, 1),
+            'Bayt': stage['bytes']
+        } for name, stage in sorted(last['stages'].items(), key=lambda item: item[1]['seconds'], reverse=True)]
+        st.dataframe(pd.DataFrame(stage_rows), use_container_width=True, hide_index=True)
+        
+        st.markdown("**📈 Son çalıştırmalar**")
+        history = pd.DataFrame([{
+            'Saat': datetime.fromtimestamp(r['started_at']).strftime('%H:%M:%S'),
+            'Süre (ms)': round(r['seconds'] * 1000, 1),
+            'Kesildi': r['interrupted']
+        } for r in reruns[:20]])
+        st.dataframe(history, use_container_width=True, hide_index=True)
+    else:
+        st.info("Henüz tamamlanmış bir çalıştırma yok.")
+    
+    summary = perf.summary()
+    if summary:
+        st.markdown("**🧮 Aşama bazında toplamlar ve yüzdelikler** (iç içe aşamaların süreleri kapsayıcıdır)")
+        df_summary = pd.DataFrame(summary).rename(columns={
+            'stage': 'Aşama', 'count': 'Adet', 'total_ms': 'Toplam (ms)', 'bytes': 'Bayt',
+            'p50_ms': 'p50 (ms)', 'p90_ms': 'p90 (ms)', 'p99_ms': 'p99 (ms)'
+        })
+        st.dataframe(df_summary.round(1), use_container_width=True, hide_index=True)
+    
+    with st.expander("📡 Prometheus metrikleri"):
+        st.caption("Dışa aktarım için BTAG_METRICS_PORT (/metrics) ya da BTAG_METRICS_FILE ayarlayın.")
+        st.code(metrics.render(), language='text')
+    
+    if st.button("🧹 Ölçümleri Sıfırla"):
+        perf.reset()
+        st.rerun()
+
+PROFILE_PAGES = {
+    "dashboard": "🏠 Ana Sayfa",
+    "excel_upload": "📤 Excel Yükleme",
+    "member_management": "👥 Üye Yönetimi",
+    "reports": "📋 Raporlar",
+    "statistics": "📊 İstatistikler",
+    "settings": "⚙️ Ayarlar"
+}
+
+def show_profiling_panel():
+    """Seçilen sayfanın sonraki çalıştırmalarını profille ve kayıtlı profilleri göster"""
+    st.subheader("🔬 Profilleme")
+    st.caption("Seçilen sayfanın sonraki çalıştırmaları cProfile (isteğe bağlı tracemalloc) ile ölçülür. "
+               "Çıktılar .profiles/ klasörüne kaydedilir. ENV: BTAG_PROFILE=\"statistics:3:mem\"")
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        page = st.selectbox("Sayfa", list(PROFILE_PAGES), format_func=PROFILE_PAGES.get, key="profile_page")
+    with col2:
+        runs = st.number_input("Çalıştırma sayısı", min_value=1, max_value=20, value=1, key="profile_runs")
+    with col3:
+        memory = st.checkbox("Bellek (tracemalloc)", key="profile_memory")
+    
+    col_start, col_stop = st.columns(2)
+    with col_start:
+        if st.button("▶️ Profillemeyi Başlat", type='primary'):
+            profiling.arm(page, int(runs), memory)
+            st.success(f"✅ {PROFILE_PAGES[page]} sayfasının sonraki {int(runs)} çalıştırması profillenecek.")
+    with col_stop:
+        if st.button("⏹️ Profillemeyi Durdur"):
+            profiling.disarm()
+    
+    pending = profiling.armed()
+    if pending:
+        st.info("Bekleyen: " + ", ".join(f"{PROFILE_PAGES.get(p, p)} ({s['remaining']})" for p, s in pending.items()))
+    
+    profile_files = profiling.list_profiles()
+    if not profile_files:
+        st.info("Henüz kayıtlı profil yok.")
+        return
+    
+    selected = st.selectbox("Kayıtlı profiller", profile_files,
+                            format_func=lambda path: os.path.basename(path)[:-5], key="profile_file")
+    summary = profiling.load_summary(selected)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Süre", f"{summary['seconds'] * 1000:,.0f} ms")
+    with col2:
+        st.metric("Fonksiyon çağrısı", f"{summary['total_calls']:,}")
+    with col3:
+        peak = summary.get('peak_bytes')
+        st.metric("Tepe bellek", f"{peak / 1024 / 1024:,.1f} MB" if peak else "-")
+    
+    sort_key = st.radio("Sıralama", ["Kümülatif süre", "Kendi süresi"], horizontal=True, key="profile_sort")
+    rows = summary['by_cumulative'] if sort_key == "Kümülatif süre" else summary['by_tottime']
+    df_functions = pd.DataFrame(rows).rename(columns={
+        'function': 'Fonksiyon', 'location': 'Konum', 'ncalls': 'Çağrı',
+        'primitive_calls': 'İlkel çağrı', 'tottime': 'Kendi (s)', 'cumtime': 'Kümülatif (s)'
+    })
+    st.dataframe(df_functions.round(4), use_container_width=True, hide_index=True)
+    
+    if summary.get('allocations'):
+        st.markdown("**🧠 En çok bellek ayıran satırlar**")
+        df_alloc = pd.DataFrame(summary['allocations']).rename(columns={
+            'location': 'Konum', 'size_kb': 'Boyut (KB)', 'count': 'Blok'
+        })
+        st.dataframe(df_alloc.round(1), use_container_width=True, hide_index=True)
+    
+    prof_path = os.path.join(os.path.dirname(selected), summary['prof_file'])
+    if os.path.exists(prof_path):
+        with open(prof_path, 'rb') as f:
+            st.download_button("📥 .prof dosyasını indir (snakeviz / pstats)", f.read(),
+                               file_name=summary['prof_file'], mime="application/octet-stream")
+
 def show_dashboard():
     """Ana sayfa göster"""
     st.header("🏠 Ana Sayfa")
@@ -1062,33 +598,19 @@ def show_dashboard():
     
     # Günlük verileri yükle
     try:
-        with open(member_manager.data_processor.daily_data_file, 'r', encoding='utf-8') as f:
-            daily_data = json.load(f)
+        with perf.stage("json.load.daily_data", perf.file_size(member_manager.data_processor.daily_data_file)):
+            daily_data = serializer.load_file(member_manager.data_processor.daily_data_file)
     except Exception as e:
         print(f"Veri yukleme hatasi: {e}")
         daily_data = {}
         st.error(f"Veri yukleme hatasi: {e}")
     
-    # Bu ay için toplam hesaplamaları
-    current_month_data = {}
-    total_deposits = 0
-    total_withdrawals = 0
-    total_net = 0
-    
-    # Aktif üyelerin ID'lerini al
-    active_member_ids = [str(m['member_id']) for m in members]
-    
-    for date, btag_data in daily_data.items():
-        if date.startswith(current_month):
-            for btag, records in btag_data.items():
-                for record in records:
-                    # Sadece aktif üyelerin verilerini dahil et
-                    member_id = str(record.get('member_id', ''))
-                    if member_id in active_member_ids:
-                        total_deposits += record.get('total_deposits', 0)
-                        total_withdrawals += record.get('total_withdrawals', 0)
-    
-    total_net = total_deposits - total_withdrawals
+    # Bu ayın toplamları ve son 7 gün (sadece aktif üyelerin verileri)
+    summary = analytics.dashboard_summary(daily_data, members, current_month)
+    total_deposits = summary['total_deposits']
+    total_withdrawals = summary['total_withdrawals']
+    total_net = summary['total_net']
+    passive_members = summary['passive_members']
     
     # Metrikler
     col1, col2, col3, col4 = st.columns(4)
@@ -1098,7 +620,6 @@ def show_dashboard():
     
     with col2:
         # Pasif üyeler (1 haftadan fazla yatırım yapmayan)
-        passive_members = len([m for m in members if m.get('days_without_deposit', 0) > 7])
         st.metric("⚠️ Pasif Üyeler", passive_members)
     
     with col3:
@@ -1111,8 +632,7 @@ def show_dashboard():
     st.markdown("---")
     st.subheader("👥 Üye Durumu Dağılımı")
     
-    # Aktif ve pasif üye sayılarını hesapla
-    active_members = total_members - passive_members
+    active_members = summary['active_members']
     
     if total_members > 0:
         col_chart1, col_chart2 = st.columns([2, 1])
@@ -1126,27 +646,28 @@ def show_dashboard():
             }
             
             # Pie chart oluştur
-            fig_pie = px.pie(
-                values=pie_data['Sayı'], 
-                names=pie_data['Durum'],
-                title='Üye Durumu Dağılımı',
-                color_discrete_sequence=['#00CC96', '#FF6B6B']
-            )
+            with perf.stage("chart"):
+                fig_pie = px.pie(
+                    values=pie_data['Sayı'], 
+                    names=pie_data['Durum'],
+                    title='Üye Durumu Dağılımı',
+                    color_discrete_sequence=['#00CC96', '#FF6B6B']
+                )
             
-            # Grafik ayarları
-            fig_pie.update_traces(
-                textposition='inside', 
-                textinfo='percent+label',
-                hovertemplate='<b>%{label}</b><br>Sayı: %{value}<br>Oran: %{percent}<extra></extra>'
-            )
+                # Grafik ayarları
+                fig_pie.update_traces(
+                    textposition='inside', 
+                    textinfo='percent+label',
+                    hovertemplate='<b>%{label}</b><br>Sayı: %{value}<br>Oran: %{percent}<extra></extra>'
+                )
             
-            fig_pie.update_layout(
-                showlegend=True,
-                height=400,
-                font=dict(size=14)
-            )
+                fig_pie.update_layout(
+                    showlegend=True,
+                    height=400,
+                    font=dict(size=14)
+                )
             
-            st.plotly_chart(fig_pie, use_container_width=True)
+                st.plotly_chart(fig_pie, use_container_width=True)
         
         with col_chart2:
             st.markdown("### 📊 Detaylar")
@@ -1186,43 +707,17 @@ def show_dashboard():
     if daily_data:
         st.subheader("📊 Son 7 Günün İstatistikleri")
         
-        # Son 7 günün verilerini al
-        recent_dates = sorted(daily_data.keys(), key=lambda x: datetime.strptime(x, '%Y-%m-%d'))[-7:]
-        daily_stats = []
-        
-        for date in recent_dates:
-            date_deposits = 0
-            date_withdrawals = 0
-            date_deposit_count = 0
-            date_withdrawal_count = 0
-            
-            for btag, records in daily_data[date].items():
-                for record in records:
-                    # Sadece aktif üyelerin verilerini dahil et
-                    member_id = str(record.get('member_id', ''))
-                    if member_id in active_member_ids:
-                        date_deposits += record.get('total_deposits', 0)
-                        date_withdrawals += record.get('total_withdrawals', 0)
-                        date_deposit_count += record.get('deposit_count', 0)
-                        date_withdrawal_count += record.get('withdrawal_count', 0)
-            
-            daily_stats.append({
-                'Tarih': date,
-                'Yatırım Adedi': date_deposit_count,
-                'Yatırım Miktarı': date_deposits,
-                'Çekim Adedi': date_withdrawal_count,
-                'Çekim Miktarı': date_withdrawals,
-                'Net': date_deposits - date_withdrawals
-            })
+        daily_stats = summary['daily_stats']
         
         if daily_stats:
             df_stats = pd.DataFrame(daily_stats)
             
             # Grafik
-            fig = px.bar(df_stats, x='Tarih', y=['Yatırım Miktarı', 'Çekim Miktarı'], 
-                        title='Son 7 Günün Yatırım-Çekim Grafiği',
-                        color_discrete_map={'Yatırım Miktarı': 'green', 'Çekim Miktarı': 'red'})
-            st.plotly_chart(fig, use_container_width=True)
+            with perf.stage("chart"):
+                fig = px.bar(df_stats, x='Tarih', y=['Yatırım Miktarı', 'Çekim Miktarı'], 
+                            title='Son 7 Günün Yatırım-Çekim Grafiği',
+                            color_discrete_map={'Yatırım Miktarı': 'green', 'Çekim Miktarı': 'red'})
+                st.plotly_chart(fig, use_container_width=True)
             
             # Tablo
             def color_net(val):
@@ -1244,8 +739,7 @@ def show_dashboard():
         st.warning(f"🚨 {passive_members} üye 7 günden fazladır yatırım yapmıyor!")
         
         with st.expander("Pasif Üyeleri Göster"):
-            passive_list = [m for m in members if m.get('days_without_deposit', 0) > 7]
-            for member in passive_list:
+            for member in summary['passive_list']:
                 days = member.get('days_without_deposit', 0)
                 st.write(f"• {member['full_name']} ({member['username']}) - {days} gündür yatırım yapmıyor")
 
@@ -1394,8 +888,21 @@ def show_member_management():
     
     with col3:
         if st.button("📤 Üye Listesini Dışa Aktar", use_container_width=True):
-            # Dışa aktarma işlemleri
-            pass
+            members_for_export = member_manager.get_all_members()
+            export_formats = ["csv", "parquet"] if data_export.PARQUET_AVAILABLE else ["csv"]
+            for export_format in export_formats:
+                st.download_button(
+                    label=f"⬇️ {export_format.upper()} İndir",
+                    data=data_export.export_bytes(
+                        "members",
+                        export_format,
+                        rows=data_export.iter_member_rows(members_for_export)
+                    ),
+                    file_name=f"uyeler_{datetime.now().strftime('%Y%m%d')}.{export_format}",
+                    mime=data_export.MIME_TYPES[export_format],
+                    key=f"members_export_{export_format}",
+                    use_container_width=True
+                )
     
     # Üye ekleme seçenekleri
     with st.expander("➕ Üye Ekleme", expanded=False):
@@ -1441,8 +948,9 @@ def show_member_management():
     # Filtreleme ve sıralama
     st.subheader("📋 Üye Listesi")
     
-    members = member_manager.get_all_members()
-    if members:
+    views = member_manager.get_member_views()
+    members = views.table
+    if len(members):
         # Filtreleme
         col1, col2, col3 = st.columns(3)
         
@@ -1453,55 +961,30 @@ def show_member_management():
             status_filter = st.selectbox("Durum", ["Tümü", "Aktif", "Pasif"])
         
         with col3:
-            sort_by = st.selectbox("Sırala", ["ID", "İsim", "Son Yatırım", "Toplam Yatırım"], index=0)
+            sort_by = st.selectbox("Sırala", ["ID", "İsim", "Son Yatırım", "Toplam Yatırım", "Eşleşme"], index=0)
         
-        # Filtreleme işlemi
-        filtered_members = members
-        
-        if search_term:
-            filtered_members = [
-                m for m in filtered_members 
-                if (search_term.lower() in m.get('full_name', '').lower() or 
-                     search_term.lower() in m.get('username', '').lower() or
-                     search_term in str(m.get('member_id', '')))
-            ]
-        
-        if status_filter == "Aktif":
-            filtered_members = [m for m in filtered_members if m.get('is_active', True)]
-        elif status_filter == "Pasif":
-            filtered_members = [m for m in filtered_members if not m.get('is_active', True)]
-        
-        # Sıralama işlemi
-        if sort_by == "ID":
-            filtered_members.sort(key=lambda x: int(x.get('member_id', 0)))
-        elif sort_by == "İsim":
-            filtered_members.sort(key=lambda x: x.get('full_name', '').lower())
-        elif sort_by == "Son Yatırım":
-            filtered_members.sort(
-                key=lambda x: datetime.strptime(x.get('last_deposit_date', '1970-01-01').split('T')[0], '%Y-%m-%d') 
-                if x.get('last_deposit_date') and 'T' in x.get('last_deposit_date', '') 
-                else datetime.min, 
-                reverse=True
-            )
-        elif sort_by == "Toplam Yatırım":
-            filtered_members.sort(key=lambda x: float(x.get('total_deposits', 0)), reverse=True)
+        # Filtreleme, sıralama ve sayfalama: arama yoksa önceden sıralanmış görünümden tek sayfa okunur;
+        # arama varsa indeks en iyi eşleşmeyi başa koyar, "Eşleşme" dışındaki sıralamalar bunun üzerine uygulanır
+        matches = None
+        if search_term.strip():
+            matches = member_manager.get_search_index(members).search(search_term, status_filter)
+        total_members = len(matches) if matches is not None else views.count(status_filter)
         
         # Sayfalama
         items_per_page = 10
-        total_pages = (len(filtered_members) + items_per_page - 1) // items_per_page
+        total_pages = (total_members + items_per_page - 1) // items_per_page
         
-        if not filtered_members:
+        if not total_members:
             st.warning("Filtrelere uygun üye bulunamadı.")
             return
         
         # Sayfa numarası seçimi
+        page = 1
         if total_pages > 1:
             page = st.number_input("Sayfa", min_value=1, max_value=total_pages, value=1, step=1)
-            start_idx = (page - 1) * items_per_page
-            end_idx = min(start_idx + items_per_page, len(filtered_members))
-            current_page_members = filtered_members[start_idx:end_idx]
-        else:
-            current_page_members = filtered_members
+        page_indices, _ = views.page(sort_by, status_filter, page - 1, items_per_page, matches)
+        current_page_members = [members.record(i) for i in page_indices]
+        history_index = member_manager.data_processor.get_history_index()
         
         # Üye tablosu
         for member in current_page_members:
@@ -1601,16 +1084,38 @@ def show_member_management():
                     
                     with tab3:
                         st.subheader("📜 Son İşlemler")
-                        # Bu kısımda işlem geçmişi gösterilebilir
-                        st.info("İşlem geçmişi özelliği yakında eklenecektir.")
+                        # Üye geçmişi indeksi: yalnızca bu üyenin günlük kayıtları okunur
+                        lifetime = history_index.totals(member['member_id'])
+                        if lifetime:
+                            first_day, last_day = history_index.activity_range(member['member_id'])
+                            col1, col2, col3, col4 = st.columns(4)
+                            with col1:
+                                st.metric("💳 BTag Yatırım", f"{lifetime['total_deposits']:,.0f} TL")
+                            with col2:
+                                st.metric("💸 BTag Çekim", f"{lifetime['total_withdrawals']:,.0f} TL")
+                            with col3:
+                                st.metric("📅 Kayıtlı Gün", lifetime['days_active'])
+                            with col4:
+                                st.write(f"**İlk İşlem:** {first_day}")
+                                st.write(f"**Son İşlem:** {last_day}")
+                            
+                            history_rows = history_index.history(member['member_id'])[::-1]
+                            df_history = pd.DataFrame(history_rows).reindex(
+                                columns=['date', 'btag', 'deposit_count', 'total_deposits',
+                                         'withdrawal_count', 'total_withdrawals'], fill_value=0)
+                            df_history.columns = ['Tarih', 'BTag', 'Yatırım Adedi', 'Yatırım Miktarı',
+                                                  'Çekim Adedi', 'Çekim Miktarı']
+                            st.dataframe(df_history, use_container_width=True, hide_index=True)
+                        else:
+                            st.info("Bu üyenin günlük BTag kaydı bulunmuyor.")
                 
                 st.markdown("---")
         
         # Sayfalama bilgisi
         if total_pages > 1:
-            st.write(f"📄 Sayfa {page}/{total_pages} - Toplam {len(filtered_members)} üye")
+            st.write(f"📄 Sayfa {page}/{total_pages} - Toplam {total_members} üye")
         else:
-            st.info(f"📊 Toplam {len(filtered_members)} üye gösteriliyor")
+            st.info(f"📊 Toplam {total_members} üye gösteriliyor")
     
     else:
         st.warning("Henüz üye eklenmemiş. Üstteki formu kullanarak yeni üye ekleyebilirsiniz.")
@@ -1625,8 +1130,8 @@ def show_reports():
     
     # Verileri yükle
     try:
-        with open(member_manager.data_processor.daily_data_file, 'r', encoding='utf-8') as f:
-            daily_data = json.load(f)
+        with perf.stage("json.load.daily_data", perf.file_size(member_manager.data_processor.daily_data_file)):
+            daily_data = serializer.load_file(member_manager.data_processor.daily_data_file)
     except Exception as e:
         print(f"Veri yukleme hatasi: {e}")
         daily_data = {}
@@ -1655,65 +1160,14 @@ def show_reports():
     if st.button("📋 Rapor Oluştur"):
         st.markdown("---")
         
-        # Seçilen tarih aralığındaki verileri filtrele
-        filtered_data = []
-        total_deposits = 0
-        total_withdrawals = 0
-        member_summary = {}
-        
-        # Aktif üyelerin ID'lerini al
-        all_members = member_manager.get_all_members()
-        active_member_ids = [str(m['member_id']) for m in all_members if m.get('is_active', True)]
-        
-        for date_str in daily_data:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-            if start_date <= date_obj <= end_date:
-                for btag, records in daily_data[date_str].items():
-                    for record in records:
-                        member_id = str(record.get('member_id', ''))
-                        # Sadece aktif üyelerin verilerini dahil et
-                        # Tum uyeleri dahil et - aktif kontrolunu gevset
-                        # if member_id not in active_member_ids:
-                        #     continue
-                            
-                        deposits = record.get('total_deposits', 0)
-                        withdrawals = record.get('total_withdrawals', 0)
-                        deposit_count = record.get('deposit_count', 0)
-                        withdrawal_count = record.get('withdrawal_count', 0)
-                        
-                        filtered_data.append({
-                            'Tarih': date_str,
-                            'BTag': btag,
-                            'Üye ID': member_id,
-                            'Kullanıcı Adı': record.get('username', ''),
-                            'Müşteri Adı': record.get('customer_name', ''),
-                            'Yatırım Adedi': deposit_count,
-                            'Yatırım': deposits,
-                            'Çekim Adedi': withdrawal_count,
-                            'Çekim': withdrawals,
-                            'Net': deposits - withdrawals
-                        })
-                        
-                        total_deposits += deposits
-                        total_withdrawals += withdrawals
-                        
-                        # Üye bazında özet
-                        if member_id not in member_summary:
-                            member_summary[member_id] = {
-                                'username': record.get('username', ''),
-                                'customer_name': record.get('customer_name', ''),
-                                'deposits': 0,
-                                'withdrawals': 0,
-                                'deposit_count': 0,
-                                'withdrawal_count': 0
-                            }
-                        member_summary[member_id]['deposits'] += deposits
-                        member_summary[member_id]['withdrawals'] += withdrawals
-                        member_summary[member_id]['deposit_count'] += deposit_count
-                        member_summary[member_id]['withdrawal_count'] += withdrawal_count
+        # Seçilen tarih aralığındaki verileri filtrele (tüm üyeler dahil)
+        report = analytics.build_report(daily_data, start_date, end_date)
+        filtered_data = report['rows']
+        total_deposits = report['total_deposits']
+        total_withdrawals = report['total_withdrawals']
         
         if filtered_data:
-            total_net = total_deposits - total_withdrawals
+            total_net = report['total_net']
             
             # Genel özet
             st.subheader("📈 Genel Özet")
@@ -1740,29 +1194,16 @@ def show_reports():
             }).reset_index()
             daily_summary['Net'] = daily_summary['Yatırım'] - daily_summary['Çekim']
             
-            fig = px.line(daily_summary, x='Tarih', y=['Yatırım', 'Çekim'], 
-                         title='Günlük Yatırım-Çekim Trendi',
-                         color_discrete_map={'Yatırım': 'green', 'Çekim': 'red'})
-            st.plotly_chart(fig, use_container_width=True)
+            with perf.stage("chart"):
+                fig = px.line(daily_summary, x='Tarih', y=['Yatırım', 'Çekim'], 
+                             title='Günlük Yatırım-Çekim Trendi',
+                             color_discrete_map={'Yatırım': 'green', 'Çekim': 'red'})
+                st.plotly_chart(fig, use_container_width=True)
             
             # Üye bazında özet
             st.subheader("👥 Üye Bazında Özet")
-            member_report = []
-            for member_id, data in member_summary.items():
-                net = data['deposits'] - data['withdrawals']
-                member_report.append({
-                    'Üye ID': member_id,
-                    'Kullanıcı Adı': data['username'],
-                    'Müşteri Adı': data['customer_name'],
-                    'Yatırım Adedi': data['deposit_count'],
-                    'Yatırım Miktarı': data['deposits'],
-                    'Çekim Adedi': data['withdrawal_count'],
-                    'Çekim Miktarı': data['withdrawals'],
-                    'Net': net
-                })
-            
+            member_report = analytics.member_report_rows(report['member_summary'])
             df_members = pd.DataFrame(member_report)
-            df_members = df_members.sort_values('Net', ascending=False)
             
             # Renk kodlaması
             def highlight_net(val):
@@ -1780,37 +1221,30 @@ def show_reports():
             # Excel indirme
             st.subheader("📥 Raporu İndir")
             
-            # Excel dosyası oluştur
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                # Genel özet
-                summary_data = {
-                    'Metrik': ['Toplam Gün', 'Toplam Yatırım', 'Toplam Çekim', 'Net Kar/Zarar'],
-                    'Değer': [
-                        (end_date - start_date).days + 1,
-                        f"{total_deposits:,.0f} TL",
-                        f"{total_withdrawals:,.0f} TL",
-                        f"{total_net:,.0f} TL"
-                    ]
-                }
-                pd.DataFrame(summary_data).to_excel(writer, sheet_name='Özet', index=False)
-                
-                # Günlük detay
-                df_daily_detail = pd.DataFrame(filtered_data)
-                df_daily_detail.to_excel(writer, sheet_name='Günlük Detay', index=False)
-                
-                # Üye bazında
-                df_members.to_excel(writer, sheet_name='Üye Bazında', index=False)
-            
-            output.seek(0)
-            
             st.download_button(
                 label="📊 Excel Raporu İndir",
-                data=output.read(),
+                data=build_report_workbook(report, member_report),
                 file_name=f"btag_raporu_{start_date}_{end_date}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
             
+            # Ham veri (CSV / Parquet) - stilsiz, hızlı üretilir ve okunur
+            export_formats = ["csv", "parquet"] if data_export.PARQUET_AVAILABLE else ["csv"]
+            export_cols = st.columns(len(export_formats))
+            for export_col, export_format in zip(export_cols, export_formats):
+                with export_col:
+                    st.download_button(
+                        label=f"⬇️ Ham Veri ({export_format.upper()})",
+                        data=data_export.export_bytes(
+                            "report",
+                            export_format,
+                            rows=data_export.iter_report_rows(daily_data, start_date, end_date)
+                        ),
+                        file_name=f"btag_ham_veri_{start_date}_{end_date}.{export_format}",
+                        mime=data_export.MIME_TYPES[export_format],
+                        key=f"report_export_{export_format}"
+                    )
+            
         else:
             st.warning("Seçilen tarih aralığında veri bulunamadı.")
 
@@ -1820,14 +1254,9 @@ def show_statistics():
     
     member_manager = MemberManager()
     
-    # Verileri yükle
-    try:
-        with open(member_manager.data_processor.daily_data_file, 'r', encoding='utf-8') as f:
-            daily_data = json.load(f)
-    except Exception as e:
-        print(f"Veri yukleme hatasi: {e}")
-        daily_data = {}
-        st.error(f"Veri yukleme hatasi: {e}")
+    # Verileri yükle (üye geçmişi indeksiyle birlikte; dosya değişmedikçe yeniden okunmaz)
+    history_index = member_manager.data_processor.get_history_index()
+    daily_data = history_index.daily_data
     
     if not daily_data:
         st.warning("⚠️ Henüz veri bulunmuyor. Önce Excel dosyası yükleyin.")
@@ -1837,7 +1266,7 @@ def show_statistics():
     st.subheader("📅 Tarih Aralığı Seçin")
     col1, col2 = st.columns(2)
     
-    available_dates = sorted(daily_data.keys(), key=lambda x: datetime.strptime(x, '%Y-%m-%d'))
+    available_dates = analytics.sorted_dates(daily_data)
     if available_dates:
         with col1:
             start_date = st.date_input(
@@ -1853,56 +1282,28 @@ def show_statistics():
         st.error("Veri bulunamadı")
         return
     
-    # Veri toplama
-    member_stats = {}
-    total_deposits = 0
-    total_withdrawals = 0
-    total_deposit_count = 0
-    total_withdrawal_count = 0
-    
-    for date_str, btag_data in daily_data.items():
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-        
-        if start_date <= date_obj <= end_date:
-            for btag, records in btag_data.items():
-                for record in records:
-                    member_id = str(record.get('member_id', ''))
-                    username = record.get('username', '')
-                    customer_name = record.get('customer_name', '')
-                    deposit_count = record.get('deposit_count', 0)
-                    deposit_amount = record.get('total_deposits', 0)
-                    withdrawal_count = record.get('withdrawal_count', 0)
-                    withdrawal_amount = record.get('total_withdrawals', 0)
-                    
-                    if member_id not in member_stats:
-                        member_stats[member_id] = {
-                            'username': username,
-                            'customer_name': customer_name,
-                            'total_deposits': 0,
-                            'total_withdrawals': 0,
-                            'deposit_count': 0,
-                            'withdrawal_count': 0,
-                            'net_amount': 0,
-                            'days_active': 0
-                        }
-                    
-                    member_stats[member_id]['total_deposits'] += deposit_amount
-                    member_stats[member_id]['total_withdrawals'] += withdrawal_amount
-                    member_stats[member_id]['deposit_count'] += deposit_count
-                    member_stats[member_id]['withdrawal_count'] += withdrawal_count
-                    member_stats[member_id]['days_active'] += 1
-                    
-                    total_deposits += deposit_amount
-                    total_withdrawals += withdrawal_amount
-                    total_deposit_count += deposit_count
-                    total_withdrawal_count += withdrawal_count
-    
-    # Net miktarları hesapla
-    for member_id in member_stats:
-        member_stats[member_id]['net_amount'] = (
-            member_stats[member_id]['total_deposits'] - 
-            member_stats[member_id]['total_withdrawals']
-        )
+    # Veri toplama: varsayılan kesin tarama; uzun aralıklarda istenirse kayıtlar yerine günlük özetler
+    # birleştirilir (daily_stats — aktif üye, dağılımlar ve kanıtlanamayan sıralamalar yaklaşık)
+    use_sketches = False
+    if (end_date - start_date).days + 1 > daily_stats.SKETCH_MIN_DAYS:
+        use_sketches = st.checkbox("⚡ Hızlı özet (yaklaşık)", key="statistics_fast")
+    
+    # Sıralaması kanıtlanamayan ölçütler (günlük en iyi listeleri kesildiğinden yaklaşık)
+    approximate = set()
+    if use_sketches:
+        range_stats = history_index.range_statistics(start_date, end_date)
+        totals = range_stats['totals']
+        # Yalnızca en iyi üye listelerindeki üyeler (toplamları kesin)
+        member_stats = {member_id: stats for rows in range_stats['top'].values() for member_id, stats in rows}
+        approximate = {metric for metric, exact in range_stats['top_exact'].items() if not exact}
+        st.caption("≈ Hızlı özet: aktif üye sayısı ve dağılımlar günlük özetlerden tahmin edilir; genel "
+                   "toplamlar kesindir. Üye sıralamaları yalnızca kesinliği kanıtlanabildiyse kesindir")
+    else:
+        member_stats, totals = analytics.member_statistics(daily_data, start_date, end_date)
+    total_deposits = totals['total_deposits']
+    total_withdrawals = totals['total_withdrawals']
+    total_deposit_count = totals['total_deposit_count']
+    total_withdrawal_count = totals['total_withdrawal_count']
     
     # Genel özet metrikleri
     st.subheader("📈 Genel Özet")
@@ -1924,8 +1325,10 @@ def show_statistics():
             st.metric("📊 Ort. Yatırım", f"{avg_deposit:,.0f} TL")
     
     with col4:
-        total_members = len(member_stats)
-        st.metric("👥 Aktif Üye", total_members)
+        if use_sketches:
+            st.metric("👥 Aktif Üye", f"≈{range_stats['active_members']:,}")
+        else:
+            st.metric("👥 Aktif Üye", len(member_stats))
         if total_withdrawal_count > 0:
             avg_withdrawal = total_withdrawals / total_withdrawal_count
             st.metric("📊 Ort. Çekim", f"{avg_withdrawal:,.0f} TL")
@@ -1934,13 +1337,14 @@ def show_statistics():
     
     # En iyi performans gösteren üyeler
     st.subheader("🏆 Top Performans")
+    approximate_note = ("≈ Yaklaşık sıralama: adaylar günlük en iyi listelerinden seçildi, listelerin "
+                        "hemen altında kalan üyeler eksik olabilir (tutarlar kesin)")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.write("**💰 En Çok Yatırım Yapan Üyeler**")
-        top_deposits = sorted(member_stats.items(), 
-                            key=lambda x: x[1]['total_deposits'], reverse=True)[:10]
+        top_deposits = analytics.top_members(member_stats, 'total_deposits')
         
         top_deposits_data = []
         for member_id, stats in top_deposits:
@@ -1953,12 +1357,13 @@ def show_statistics():
                     'Yatırım Adedi': stats['deposit_count']
                 })
         
+        if 'total_deposits' in approximate:
+            st.caption(approximate_note)
         if top_deposits_data:
             st.dataframe(pd.DataFrame(top_deposits_data), use_container_width=True)
         
         st.write("**🔢 En Sık Yatırım Yapan Üyeler**")
-        top_deposit_count = sorted(member_stats.items(), 
-                                 key=lambda x: x[1]['deposit_count'], reverse=True)[:10]
+        top_deposit_count = analytics.top_members(member_stats, 'deposit_count')
         
         top_count_data = []
         for member_id, stats in top_deposit_count:
@@ -1971,13 +1376,15 @@ def show_statistics():
                     'Toplam Miktar': f"{stats['total_deposits']:,.0f} TL"
                 })
         
-        if top_count_data:
+        if 'deposit_count' in approximate:
+            # Adetler günlere düz dağıldığından günlük listeler bu sıralamayı çoğu zaman kaçırır
+            st.caption("≈ Hızlı özette bu sıralama kanıtlanamadı; görmek için hızlı özeti kapatın")
+        elif top_count_data:
             st.dataframe(pd.DataFrame(top_count_data), use_container_width=True)
     
     with col2:
         st.write("**💸 En Çok Çekim Yapan Üyeler**")
-        top_withdrawals = sorted(member_stats.items(), 
-                               key=lambda x: x[1]['total_withdrawals'], reverse=True)[:10]
+        top_withdrawals = analytics.top_members(member_stats, 'total_withdrawals')
         
         top_withdrawals_data = []
         for member_id, stats in top_withdrawals:
@@ -1990,12 +1397,13 @@ def show_statistics():
                     'Çekim Adedi': stats['withdrawal_count']
                 })
         
+        if 'total_withdrawals' in approximate:
+            st.caption(approximate_note)
         if top_withdrawals_data:
             st.dataframe(pd.DataFrame(top_withdrawals_data), use_container_width=True)
         
         st.write("**📈 En Karlı Üyeler**")
-        top_profitable = sorted(member_stats.items(), 
-                              key=lambda x: x[1]['net_amount'], reverse=True)[:10]
+        top_profitable = analytics.top_members(member_stats, 'net_amount')
         
         top_profit_data = []
         for member_id, stats in top_profitable:
@@ -2008,11 +1416,54 @@ def show_statistics():
                     'Yatırım': f"{stats['total_deposits']:,.0f} TL"
                 })
         
+        if 'net_amount' in approximate:
+            st.caption(approximate_note)
         if top_profit_data:
             st.dataframe(pd.DataFrame(top_profit_data), use_container_width=True)
     
     st.markdown("---")
     
+    # Üye detayı: üye geçmişi indeksinden yalnızca seçilen üyenin kayıtları okunur
+    st.subheader("🔎 Üye Detayı")
+    member_options = [member_id for member_id, _ in analytics.top_members(member_stats, 'total_deposits',
+                                                                            n=len(member_stats))]
+    selected_member = st.selectbox(
+        "Üye",
+        member_options,
+        format_func=lambda member_id: f"{member_stats[member_id]['username']} ({member_id})",
+        key="statistics_member_detail"
+    )
+    if selected_member:
+        member_totals = history_index.totals(selected_member, start_date, end_date)
+        first_day, last_day = history_index.activity_range(selected_member)
+        if member_totals:
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("💰 Yatırım", f"{member_totals['total_deposits']:,.0f} TL")
+                st.metric("🔢 Yatırım Adedi", member_totals['deposit_count'])
+            with col2:
+                st.metric("💸 Çekim", f"{member_totals['total_withdrawals']:,.0f} TL")
+                st.metric("🔢 Çekim Adedi", member_totals['withdrawal_count'])
+            with col3:
+                st.metric("📊 Net", f"{member_totals['net_amount']:,.0f} TL")
+                st.metric("📅 Aktif Gün", member_totals['days_active'])
+            with col4:
+                st.write(f"**İlk İşlem:** {first_day}")
+                st.write(f"**Son İşlem:** {last_day}")
+            
+            member_history = pd.DataFrame(history_index.history(selected_member, start_date, end_date))
+            if not member_history.empty:
+                daily_member = member_history.groupby('date')[['total_deposits', 'total_withdrawals']].sum()
+                daily_member.index = pd.to_datetime(daily_member.index)
+                with perf.stage("chart"):
+                    fig = px.bar(daily_member, y=['total_deposits', 'total_withdrawals'], barmode='group',
+                                 title=f"{member_totals['username']} - Günlük Yatırım / Çekim",
+                                 labels={'value': 'Miktar (TL)', 'date': 'Tarih', 'variable': ''},
+                                 color_discrete_map={'total_deposits': 'green', 'total_withdrawals': 'red'})
+                    st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
     # Grafik analizler
     st.subheader("📊 Grafik Analizleri")
     
@@ -2021,68 +1472,74 @@ def show_statistics():
     with tab1:
         col1, col2 = st.columns(2)
         
-        with col1:
-            # Yatırım miktarı dağılımı
-            deposit_amounts = [stats['total_deposits'] for stats in member_stats.values() if stats['total_deposits'] > 0]
-            if deposit_amounts:
-                fig = px.histogram(x=deposit_amounts, nbins=20, 
-                                 title='Yatırım Miktarı Dağılımı',
-                                 labels={'x': 'Yatırım Miktarı (TL)', 'y': 'Üye Sayısı'})
-                st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Çekim miktarı dağılımı
-            withdrawal_amounts = [stats['total_withdrawals'] for stats in member_stats.values() if stats['total_withdrawals'] > 0]
-            if withdrawal_amounts:
-                fig = px.histogram(x=withdrawal_amounts, nbins=20,
-                                 title='Çekim Miktarı Dağılımı',
-                                 labels={'x': 'Çekim Miktarı (TL)', 'y': 'Üye Sayısı'})
-                st.plotly_chart(fig, use_container_width=True)
+        if use_sketches:
+            # Üye-gün tutarlarının dağılımı (günlük özetlerin birleşimi)
+            sketch_charts = [
+                (col1, range_stats['deposits'], 'Üye-Gün Yatırım Dağılımı (yaklaşık)'),
+                (col2, range_stats['withdrawals'], 'Üye-Gün Çekim Dağılımı (yaklaşık)'),
+            ]
+            for column, sketch, title in sketch_charts:
+                bins = sketch.histogram(20)
+                if not bins:
+                    continue
+                with column, perf.stage("chart"):
+                    fig = px.bar(x=[(low + high) / 2 for low, high, _ in bins],
+                                 y=[count for _, _, count in bins],
+                                 title=title,
+                                 labels={'x': 'Miktar (TL)', 'y': 'Üye-Gün Sayısı'})
+                    fig.update_traces(width=bins[0][1] - bins[0][0])
+                    st.plotly_chart(fig, use_container_width=True)
+                    st.caption(f"Medyan: {sketch.quantile(0.5):,.0f} TL | %90: {sketch.quantile(0.9):,.0f} TL")
+        else:
+            with col1:
+                # Yatırım miktarı dağılımı
+                deposit_amounts = [stats['total_deposits'] for stats in member_stats.values() if stats['total_deposits'] > 0]
+                if deposit_amounts:
+                    with perf.stage("chart"):
+                        fig = px.histogram(x=deposit_amounts, nbins=20, 
+                                         title='Yatırım Miktarı Dağılımı',
+                                         labels={'x': 'Yatırım Miktarı (TL)', 'y': 'Üye Sayısı'})
+                        st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                # Çekim miktarı dağılımı
+                withdrawal_amounts = [stats['total_withdrawals'] for stats in member_stats.values() if stats['total_withdrawals'] > 0]
+                if withdrawal_amounts:
+                    with perf.stage("chart"):
+                        fig = px.histogram(x=withdrawal_amounts, nbins=20,
+                                         title='Çekim Miktarı Dağılımı',
+                                         labels={'x': 'Çekim Miktarı (TL)', 'y': 'Üye Sayısı'})
+                        st.plotly_chart(fig, use_container_width=True)
     
     with tab2:
         # Günlük trend analizi
-        daily_summary = {}
-        for date_str, btag_data in daily_data.items():
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-            
-            if start_date <= date_obj <= end_date:
-                daily_deposits = 0
-                daily_withdrawals = 0
-                daily_dep_count = 0
-                daily_with_count = 0
-                
-                for btag, records in btag_data.items():
-                    for record in records:
-                        daily_deposits += record.get('total_deposits', 0)
-                        daily_withdrawals += record.get('total_withdrawals', 0)
-                        daily_dep_count += record.get('deposit_count', 0)
-                        daily_with_count += record.get('withdrawal_count', 0)
-                
-                daily_summary[date_str] = {
-                    'Yatırım Miktarı': daily_deposits,
-                    'Çekim Miktarı': daily_withdrawals,
-                    'Yatırım Adedi': daily_dep_count,
-                    'Çekim Adedi': daily_with_count
-                }
+        if use_sketches:
+            daily_summary = range_stats['daily']
+        else:
+            daily_summary = analytics.daily_summary(daily_data, start_date, end_date)
         
         if daily_summary:
             df_trend = pd.DataFrame(daily_summary).T
             df_trend.index = pd.to_datetime(df_trend.index)
             
             # Miktar trendi
-            fig = px.line(df_trend, y=['Yatırım Miktarı', 'Çekim Miktarı'],
-                         title='Günlük Miktar Trendi',
-                         color_discrete_map={'Yatırım Miktarı': 'green', 'Çekim Miktarı': 'red'})
-            st.plotly_chart(fig, use_container_width=True)
+            with perf.stage("chart"):
+                fig = px.line(df_trend, y=['Yatırım Miktarı', 'Çekim Miktarı'],
+                             title='Günlük Miktar Trendi',
+                             color_discrete_map={'Yatırım Miktarı': 'green', 'Çekim Miktarı': 'red'})
+                st.plotly_chart(fig, use_container_width=True)
             
             # Adet trendi
-            fig = px.line(df_trend, y=['Yatırım Adedi', 'Çekim Adedi'],
-                         title='Günlük İşlem Adedi Trendi',
-                         color_discrete_map={'Yatırım Adedi': 'blue', 'Çekim Adedi': 'orange'})
-            st.plotly_chart(fig, use_container_width=True)
+            with perf.stage("chart"):
+                fig = px.line(df_trend, y=['Yatırım Adedi', 'Çekim Adedi'],
+                             title='Günlük İşlem Adedi Trendi',
+                             color_discrete_map={'Yatırım Adedi': 'blue', 'Çekim Adedi': 'orange'})
+                st.plotly_chart(fig, use_container_width=True)
     
     with tab3:
         # Yatırım vs Çekim karşılaştırması
+        if use_sketches:
+            st.caption("Uzun aralık: yalnızca en iyi üye listelerindeki üyeler gösterilir")
         member_comparison = []
         for member_id, stats in member_stats.items():
             if stats['total_deposits'] > 0 or stats['total_withdrawals'] > 0:
@@ -2098,20 +1555,22 @@ def show_statistics():
             df_comparison = pd.DataFrame(member_comparison)
             
             # Miktar karşılaştırması
-            fig = px.scatter(df_comparison, x='Yatırım Miktarı', y='Çekim Miktarı',
-                           hover_data=['Kullanıcı Adı'],
-                           title='Yatırım vs Çekim Miktarı Karşılaştırması')
-            # Eşit çizgi ekle
-            max_val = max(df_comparison['Yatırım Miktarı'].max(), df_comparison['Çekim Miktarı'].max())
-            fig.add_shape(type="line", x0=0, y0=0, x1=max_val, y1=max_val, 
-                         line=dict(color="red", dash="dash"))
-            st.plotly_chart(fig, use_container_width=True)
+            with perf.stage("chart"):
+                fig = px.scatter(df_comparison, x='Yatırım Miktarı', y='Çekim Miktarı',
+                               hover_data=['Kullanıcı Adı'],
+                               title='Yatırım vs Çekim Miktarı Karşılaştırması')
+                # Eşit çizgi ekle
+                max_val = max(df_comparison['Yatırım Miktarı'].max(), df_comparison['Çekim Miktarı'].max())
+                fig.add_shape(type="line", x0=0, y0=0, x1=max_val, y1=max_val, 
+                             line=dict(color="red", dash="dash"))
+                st.plotly_chart(fig, use_container_width=True)
             
             # Adet karşılaştırması
-            fig = px.scatter(df_comparison, x='Yatırım Adedi', y='Çekim Adedi',
-                           hover_data=['Kullanıcı Adı'],
-                           title='Yatırım vs Çekim Adedi Karşılaştırması')
-            st.plotly_chart(fig, use_container_width=True)
+            with perf.stage("chart"):
+                fig = px.scatter(df_comparison, x='Yatırım Adedi', y='Çekim Adedi',
+                               hover_data=['Kullanıcı Adı'],
+                               title='Yatırım vs Çekim Adedi Karşılaştırması')
+                st.plotly_chart(fig, use_container_width=True)
 
 def main():
     # Veri yukleme oncesi cache temizle
@@ -2137,23 +1596,19 @@ if hasattr(st, 'cache_resource'):
         "⚙️ Ayarlar"
     ])
     
-    with tab1:
-        show_dashboard()
-    
-    with tab2:
-        show_excel_upload()
-    
-    with tab3:
-        show_member_management()
-    
-    with tab4:
-        show_reports()
-    
-    with tab5:
-        show_statistics()
-    
-    with tab6:
-        show_settings()
+    pages = [
+        (tab1, "dashboard", show_dashboard),
+        (tab2, "excel_upload", show_excel_upload),
+        (tab3, "member_management", show_member_management),
+        (tab4, "reports", show_reports),
+        (tab5, "statistics", show_statistics),
+        (tab6, "settings", show_settings)
+    ]
+    
+    with perf.rerun("btag"):
+        for tab, page, show_page in pages:
+            with tab, perf.stage(f"page.{page}"), profiling.profile_page(page):
+                show_page()
 
 if __name__ == "__main__":
     main()
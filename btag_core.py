@@ -0,0 +1,724 @@
+"""
+BTag Core: BTag Affiliate sisteminin Streamlit'ten bağımsız iş mantığı.
+- TokenStore: token.json okuma / yazma
+- DailyDataStore: Excel verisini işleme ve daily_data.json'a kaydetme
+- MemberService: üye listesi, backoffice API'den üye / KPI verisi çekme
+Hata ve ilerleme bildirimleri events.Reporter üzerinden yapılır; UI katmanı
+(btag_affiliate_system.py) bu sınıfları StreamlitReporter ile kullanır, cli.py
+ise JsonLinesReporter ile.
+JSON okuma / yazma ve API çağrıları perf aşamaları olarak ölçülür.
+Kayıtlar storage üzerinden atomik yazılır, üye kayıtları member_model ile normalize edilir; üye ve günlük veri güncellemeleri dosyanın güncel
+hâline uygulanır, eşzamanlı oturumlar birbirinin değişikliğini ezmez.
+"""
+import base64
+import json
+import os
+import time
+from datetime import date as date_type, datetime
+from typing import Iterable, List, Optional
+
+import member_history
+import member_model
+import member_search
+import member_views
+import perf
+import serializer
+import storage
+from events import NULL_REPORTER, Reporter
+
+BACKOFFICE_API_BASE = os.environ.get("BACKOFFICE_API_BASE", "https://backofficewebadmin.betconstruct.com/api/tr")
+DEFAULT_KPI_DELAY = 0.5  # API'ye çok fazla yüklenmemek için üyeler arası bekleme (saniye)
+
+EXCEL_COLUMN_MAPPING = {
+    'ID': 'member_id',
+    'Kullanıcı Adı': 'username',
+    'Müşteri Adı': 'customer_name',
+    'Para Yatırma Sayısı': 'deposit_count',
+    'Yatırımlar': 'total_deposits',
+    'Para Çekme Sayısı': 'withdrawal_count',
+    'Para Çekme Miktarı': 'total_withdrawals'
+}
+
+DAILY_COLUMNS = ['member_id', 'username', 'customer_name', 'deposit_count',
+                 'total_deposits', 'withdrawal_count', 'total_withdrawals']
+
+
+def _client_url(member_id) -> str:
+    return f"{BACKOFFICE_API_BASE}/Client/GetClientById?id={member_id}"
+
+
+def _kpi_url() -> str:
+    return f"{BACKOFFICE_API_BASE}/Client/GetClientKpis"
+
+
+def parse_api_date(date_str):
+    """API tarihlerini 'YYYY-MM-DD HH:MM:SS' biçimine çevir"""
+    if not date_str:
+        return ''
+    try:
+        # Farklı tarih formatlarını işle
+        for fmt in ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d'):
+            try:
+                return datetime.strptime(date_str.split('.')[0], fmt).strftime('%Y-%m-%d %H:%M:%S')
+            except (ValueError, AttributeError):
+                continue
+        return date_str
+    except Exception:
+        return date_str
+
+
+class TokenStore:
+    """Token dosyası yönetimi"""
+
+    def __init__(self, token_file: str = "token.json", reporter: Reporter = None):
+        self.token_file = token_file
+        self.reporter = reporter or NULL_REPORTER
+        self.ensure_token_file()
+
+    def ensure_token_file(self):
+        """Token dosyasının varlığını kontrol et"""
+        if not os.path.exists(self.token_file):
+            default_token = {
+                "token": "",
+                "api_url": f"{BACKOFFICE_API_BASE}/Client/GetClientWithdrawalRequestsWithTotals"
+            }
+            storage.ensure_json(self.token_file, default_token)
+
+    def load_token(self):
+        """Token dosyasını yükle"""
+        try:
+            return serializer.load_file(self.token_file)
+        except Exception as e:
+            self.reporter.error(f"Token dosyası okuma hatası: {e}")
+            return {"token": "", "api_url": ""}
+
+    def save_token(self, token, api_url):
+        """Token dosyasını kaydet"""
+        try:
+            token_data = {
+                "token": token,
+                "api_url": api_url
+            }
+            storage.write_json(self.token_file, token_data)
+            return True
+        except Exception as e:
+            self.reporter.error(f"Token kaydetme hatası: {e}")
+            return False
+
+
+class DailyDataStore:
+    """Günlük BTag verisinin işlenmesi ve saklanması"""
+
+    def __init__(self, daily_data_file: str = "daily_data.json", members_file: str = "members.json",
+                 reporter: Reporter = None, github_sync=None):
+        self.daily_data_file = daily_data_file
+        self.members_file = members_file
+        self.reporter = reporter or NULL_REPORTER
+        self.github_sync = github_sync
+        self.ensure_data_files()
+
+    def ensure_data_files(self):
+        """Veri dosyalarını oluştur"""
+        storage.ensure_json(self.daily_data_file, {})
+        storage.ensure_json(self.members_file, [])
+
+    @perf.timed("excel.process.daily")
+    def process_excel_data(self, df):
+        """Excel verisini işle"""
+        import pandas as pd
+
+        df_processed = df.copy()
+
+        for old_col, new_col in EXCEL_COLUMN_MAPPING.items():
+            if old_col in df_processed.columns:
+                df_processed = df_processed.rename(columns={old_col: new_col})
+
+        for col in DAILY_COLUMNS:
+            if col not in df_processed.columns:
+                df_processed[col] = 0
+
+        numeric_columns = ['deposit_count', 'total_deposits', 'withdrawal_count', 'total_withdrawals']
+        for col in numeric_columns:
+            df_processed[col] = pd.to_numeric(df_processed[col], errors='coerce')
+            df_processed[col] = df_processed[col].fillna(0)
+
+        string_columns = ['member_id', 'username', 'customer_name']
+        for col in string_columns:
+            df_processed[col] = df_processed[col].astype(str)
+            df_processed[col] = df_processed[col].fillna('')
+
+        return df_processed[DAILY_COLUMNS]
+
+    def load_daily_data(self) -> dict:
+        """daily_data.json içeriğini yükle"""
+        try:
+            with perf.stage("json.load.daily_data", perf.file_size(self.daily_data_file)):
+                return serializer.load_file(self.daily_data_file)
+        except Exception as e:
+            self.reporter.error(f"Günlük veri okuma hatası: {e}")
+            return {}
+
+    def get_history_index(self) -> member_history.MemberHistoryIndex:
+        """Üye bazlı günlük kayıt indeksi (geçmiş, toplamlar, ilk / son işlem tarihi)"""
+        try:
+            return member_history.load_index(self.daily_data_file)
+        except Exception as e:
+            self.reporter.error(f"Üye geçmişi indeksi hatası: {e}")
+            return member_history.MemberHistoryIndex({})
+
+    def save_daily_data(self, processed_df, btag, date):
+        """Günlük veriyi kaydet ve GitHub'a senkronize et (DataFrame ya da kayıt listesi kabul eder)"""
+        try:
+            date_str = date.strftime('%Y-%m-%d') if isinstance(date, (date_type, datetime)) else str(date)
+            records = processed_df.to_dict('records') if hasattr(processed_df, 'to_dict') else list(processed_df)
+
+            def apply(daily_data):
+                daily_data.setdefault(date_str, {})[str(btag)] = records
+                return daily_data
+
+            def on_write(daily_data, base_version, version):
+                # Üye geçmişi indeksinde yalnızca bu (tarih, btag) dilimi yeniden indekslenir
+                try:
+                    member_history.apply_write(self.daily_data_file, base_version, version, date_str, str(btag),
+                                               records)
+                except Exception as e:
+                    self.reporter.warning(f"Üye geçmişi indeksi güncellenemedi, yeniden yüklenecek: {e}")
+
+            with perf.stage("json.save.daily_data") as timing:
+                timing["bytes"] = storage.update_json(self.daily_data_file, apply, default={}, on_write=on_write)
+                timing["btag"] = str(btag)
+                timing["records"] = len(records)
+
+            # Otomatik GitHub senkronizasyonu
+            if self.github_sync and self.github_sync.sync_enabled:
+                with self.reporter.spinner("GitHub'a senkronize ediliyor..."):
+                    sync_success = self.github_sync.sync_json_file(self.daily_data_file)
+                    if sync_success:
+                        self.reporter.success("🔄 Veriler GitHub'a otomatik yüklendi!")
+
+            return True
+        except Exception as e:
+            self.reporter.error(f"Veri kaydetme hatası: {e}")
+            return False
+
+
+class MemberService:
+    """Üye yönetimi ve backoffice API entegrasyonu"""
+
+    def __init__(self, members_file: str = "members.json", token_manager: Optional[TokenStore] = None,
+                 data_processor: Optional[DailyDataStore] = None, reporter: Reporter = None):
+        self.members_file = members_file
+        self.reporter = reporter or NULL_REPORTER
+        self.ensure_members_file()
+        self.token_manager = token_manager or TokenStore(reporter=self.reporter)
+        self.data_processor = data_processor or DailyDataStore(members_file=members_file, reporter=self.reporter)
+
+    def ensure_members_file(self):
+        """Üye dosyasını oluştur"""
+        storage.ensure_json(self.members_file, [])
+
+    def _update_members(self, mutate, changed: Optional[list] = None):
+        """members.json'u güncel hâli üzerinden değiştir; mutate None döndürürse yazılmaz.
+
+        changed: mutate'in değiştirdiği / eklediği kayıtlar (mutate her çağrıda yeniden doldurur);
+        verilirse yazmadan sonra önbellekteki üye tablosuna artımlı uygulanır. Normalizasyon changed
+        dışındaki kayıtları da değiştirdiyse (henüz normalize edilmemiş dosya) tablo bırakılır ve
+        dosyadan yeniden yüklenir.
+        """
+        others_normalized = [False]
+
+        def apply(members):
+            members = mutate(members)
+            if members is None:
+                return None
+            if changed is not None:
+                own = {id(member) for member in changed}
+                others_normalized[0] = any(id(member) not in own and member_model.needs_normalize(member)
+                                           for member in members)
+            return member_model.normalize_members(members)
+
+        def on_write(members, base_version, version):
+            if changed is None:
+                return
+            if others_normalized[0]:
+                member_model.invalidate(self.members_file)
+                return
+            try:
+                member_model.apply_write(self.members_file, base_version, version, changed)
+            except Exception as e:
+                self.reporter.warning(f"Üye tablosu güncellenemedi, yeniden yüklenecek: {e}")
+
+        with perf.stage("json.save.members") as timing:
+            timing["bytes"] = storage.update_json(self.members_file, apply, default=[], on_write=on_write)
+        return timing["bytes"] is not None
+
+    def _update_member(self, member_id, apply):
+        """Tek üyeye apply(member) uygula; üye bulunamazsa False"""
+        changed = []
+
+        def mutate(members):
+            changed.clear()
+            for member in members:
+                if member['member_id'] == str(member_id):
+                    apply(member)
+                    changed.append(member)
+                    return members
+            return None
+        return self._update_members(mutate, changed)
+
+    def get_all_members(self):
+        """Tüm üyeleri getir"""
+        try:
+            with perf.stage("json.load.members", perf.file_size(self.members_file)):
+                return serializer.load_file(self.members_file)
+        except Exception:
+            return []
+
+    def get_member_table(self) -> member_model.MemberTable:
+        """Tipli üye tablosu (Üye Yönetimi arama / sıralama); dosya değişmedikçe önbellekten"""
+        try:
+            return member_model.load_table(self.members_file)
+        except Exception as e:
+            self.reporter.error(f"Üye listesi okuma hatası: {e}")
+            return member_model.MemberTable([])
+
+    def get_search_index(self, table: Optional[member_model.MemberTable] = None) -> member_search.MemberSearchIndex:
+        """Üye arama indeksi (isim / kullanıcı adı / ID; önek ve yazım hatası toleranslı)"""
+        try:
+            return member_search.load_index(self.members_file, table)
+        except Exception as e:
+            self.reporter.error(f"Üye arama indeksi hatası: {e}")
+            return member_search.MemberSearchIndex(member_model.MemberTable([]))
+
+    def get_member_views(self) -> member_views.MemberViews:
+        """Önceden sıralanmış üye görünümleri (sıralama × durum; sayfa başına dilim)"""
+        try:
+            return member_views.load_views(self.members_file)
+        except Exception as e:
+            self.reporter.error(f"Üye görünümleri hatası: {e}")
+            return member_views.MemberViews(member_model.MemberTable([]))
+
+    def get_active_members(self):
+        """Aktif üyeleri getir"""
+        all_members = self.get_all_members()
+        return [member for member in all_members if member.get('is_active', True)]
+
+    def add_member(self, member_id, username, full_name):
+        """Yeni üye ekle"""
+        try:
+            new_member = {
+                "member_id": str(member_id),
+                "username": username,
+                "full_name": full_name,
+                "is_active": True,
+                "created_at": datetime.now().isoformat(),
+                "last_deposit_date": None,
+                "days_without_deposit": 0,
+                "kpi_data": {},
+                "last_kpi_update": None,
+                "total_deposits": 0,
+                "total_withdrawals": 0,
+                "deposit_count": 0,
+                "withdrawal_count": 0
+            }
+
+            def append(members):
+                if any(m['member_id'] == str(member_id) for m in members):
+                    return None
+                return members + [new_member]
+
+            if not self._update_members(append, [new_member]):
+                return False
+
+            # Üye eklendikten sonra API'den veri çek
+            self.fetch_member_api_data(str(member_id))
+            # KPI verilerini güncelle
+            self.update_member_kpis(str(member_id))
+
+            return True
+        except Exception as e:
+            self.reporter.error(f"Üye ekleme hatası: {e}")
+            return False
+
+    def add_members_bulk(self, member_ids: Iterable[str]):
+        """Toplu üye ekleme - API'den detaylı bilgilerle"""
+        member_ids = list(member_ids)
+        added_count = 0
+        failed_ids = []
+
+        for i, member_id in enumerate(member_ids):
+            member_id = member_id.strip()
+            if member_id:
+                self.reporter.progress(i, len(member_ids), f"İşleniyor: {member_id}")
+
+                # API'den üye bilgilerini çek
+                member_data = self.fetch_member_api_data(member_id)
+
+                if member_data and member_data.get('username'):
+                    success = self.add_member(
+                        member_id,
+                        member_data.get('username', f'User_{member_id}'),
+                        member_data.get('full_name', f'Member {member_id}')
+                    )
+                    if success:
+                        added_count += 1
+                        # KPI verilerini güncelle
+                        self.update_member_kpis(member_id)
+                    else:
+                        failed_ids.append(member_id)
+                else:
+                    failed_ids.append(member_id)
+
+            self.reporter.progress(i + 1, len(member_ids), f"İşlendi: {member_id}")
+
+        self.reporter.progress_done()
+
+        if failed_ids:
+            self.reporter.warning(
+                f"⚠️ {len(failed_ids)} ID için veri çekilemedi: {', '.join(failed_ids[:5])}{'...' if len(failed_ids) > 5 else ''}",
+                failed_ids=failed_ids
+            )
+
+        return added_count
+
+    def fetch_member_api_data(self, member_id):
+        """API'den üye verilerini çek"""
+        import requests
+
+        try:
+            token_data = self.token_manager.load_token()
+            token = token_data.get('token', '')
+
+            if not token:
+                return None
+
+            headers = {
+                'Authentication': token,
+                'Accept': 'application/json',
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+                'Referer': 'https://backoffice.betconstruct.com/',
+                'Origin': 'https://backoffice.betconstruct.com',
+                'X-Requested-With': 'XMLHttpRequest'
+            }
+
+            # Temel üye bilgilerini çek
+            with perf.stage("api.client") as timing:
+                client_response = requests.get(_client_url(member_id), headers=headers, timeout=10)
+                timing["bytes"] = len(client_response.content)
+                timing["status"] = client_response.status_code
+
+            if client_response.status_code == 200:
+                client_data = client_response.json()
+
+                # API verisini işle ve standartlaştır
+                processed_data = self.process_api_response(client_data)
+
+                # KPI verilerini çek
+                try:
+                    kpi_payload = {"ClientId": int(member_id)}
+                    with perf.stage("api.kpi") as timing:
+                        kpi_response = requests.post(_kpi_url(), headers=headers, json=kpi_payload, timeout=10)
+                        timing["bytes"] = len(kpi_response.content)
+                        timing["status"] = kpi_response.status_code
+
+                    if kpi_response.status_code == 200:
+                        kpi_data = kpi_response.json()
+                        if not kpi_data.get("HasError", True) and kpi_data.get("Data"):
+                            kpi_info = kpi_data["Data"][0] if kpi_data["Data"] else {}
+                            processed_data.update({
+                                'total_deposits': kpi_info.get('TotalDeposit', 0),
+                                'total_withdrawals': kpi_info.get('TotalWithdrawal', 0),
+                                'deposit_count': kpi_info.get('DepositCount', 0),
+                                'withdrawal_count': kpi_info.get('WithdrawalCount', 0),
+                                'last_kpi_update': datetime.now().isoformat()
+                            })
+                except Exception as kpi_error:
+                    self.reporter.warning(f"KPI verileri çekilirken hata oluştu: {kpi_error}")
+
+                # Üye veritabanını güncelle
+                self.update_member_api_data(member_id, processed_data)
+
+                return processed_data
+            else:
+                self.reporter.warning(f"API yanıt hatası ({client_response.status_code}): {member_id}",
+                                      status=client_response.status_code)
+                return None
+
+        except Exception as e:
+            self.reporter.warning(f"API çağrısı hatası: {e}")
+            return None
+
+    def is_token_valid(self, token):
+        """Token'ın geçerli olup olmadığını kontrol et"""
+        if not token:
+            return False
+
+        # Token'ın son kullanma tarihini kontrol et
+        try:
+            if len(token) < 10:
+                return False
+
+            # JWT token kontrolü
+            parts = token.split('.')
+            if len(parts) != 3:
+                return True  # JWT değilse basit token olarak kabul et
+
+            # Payload kısmını al, base64 decode için padding ekle
+            payload = parts[1]
+            payload += '=' * (4 - len(payload) % 4)
+            payload_data = json.loads(base64.b64decode(payload).decode('utf-8'))
+
+            # Expire kontrolü
+            exp_time = payload_data.get('exp', 0)
+            return exp_time > time.time()
+        except Exception:
+            # JWT decode hatası durumunda basit token olarak kabul et
+            return True
+
+    def update_member_kpis(self, member_id):
+        """Tek bir üyenin KPI verilerini güncelle"""
+        import requests
+
+        try:
+            members = self.get_all_members()
+            member_found = False
+
+            for member in members:
+                if member['member_id'] == str(member_id):
+                    member_found = True
+
+                    # Token'ı yükle ve kontrol et
+                    token_data = self.token_manager.load_token()
+                    token = token_data.get('token', '')
+
+                    if not token or not self.is_token_valid(token):
+                        self.reporter.warning("Geçersiz veya süresi dolmuş API token'ı. Lütfen ayarlardan yeni bir token girin.")
+                        return False
+
+                    headers = {
+                        'Authentication': token,
+                        'Accept': 'application/json',
+                        'Content-Type': 'application/json;charset=UTF-8',
+                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                        'Origin': 'https://backoffice.betconstruct.com',
+                        'Referer': 'https://backoffice.betconstruct.com/'
+                    }
+
+                    try:
+                        kpi_payload = {"ClientId": int(member_id)}
+                        with perf.stage("api.kpi") as timing:
+                            response = requests.post(_kpi_url(), headers=headers, json=kpi_payload, timeout=30)
+                            timing["bytes"] = len(response.content)
+                            timing["status"] = response.status_code
+
+                        if response.status_code == 200:
+                            kpi_data = response.json()
+
+                            if kpi_data.get("HasError", True):
+                                error_msg = kpi_data.get("ErrorMessage", "Bilinmeyen hata")
+                                self.reporter.warning(f"API hatası: {error_msg}", member_id=str(member_id))
+
+                                # Yetki hatasında token'ı temizle
+                                if "token" in error_msg.lower() or "yetkisiz" in error_msg.lower():
+                                    self.token_manager.save_token("", "")
+                                return False
+
+                            if not kpi_data.get("Data"):
+                                self.reporter.warning(f"{member_id} ID'li üye için KPI verisi bulunamadı.", member_id=str(member_id))
+                                return False
+
+                            kpi_info = kpi_data["Data"][0] if kpi_data["Data"] else {}
+
+                            # KPI verilerini güncelle (API çağrısı sürerken değişmiş olabilecek güncel kayda)
+                            def apply(current):
+                                current['kpi_data'] = kpi_info
+                                current['last_kpi_update'] = datetime.now().isoformat()
+                                # Ana alanları da güncelle ve float'a çevir
+                                current['total_deposits'] = float(kpi_info.get('TotalDeposit', current.get('total_deposits', 0)) or 0)
+                                current['total_withdrawals'] = float(kpi_info.get('TotalWithdrawal', current.get('total_withdrawals', 0)) or 0)
+                                current['deposit_count'] = int(kpi_info.get('DepositCount', current.get('deposit_count', 0)) or 0)
+                                current['withdrawal_count'] = int(kpi_info.get('WithdrawalCount', current.get('withdrawal_count', 0)) or 0)
+
+                            return self._update_member(member_id, apply)
+
+                        elif response.status_code == 401 or response.status_code == 403:
+                            self.reporter.error("Yetkisiz erişim hatası. Lütfen API token'ınızı kontrol edin ve güncelleyin.",
+                                                status=response.status_code)
+                            self.token_manager.save_token("", "")  # Geçersiz token'ı temizle
+                            return False
+
+                        else:
+                            self.reporter.warning(f"API yanıt hatası ({response.status_code}): {response.text}",
+                                                  status=response.status_code)
+                            return False
+
+                    except requests.exceptions.RequestException as req_err:
+                        self.reporter.error(f"API isteği sırasında hata oluştu: {req_err}")
+                        return False
+
+            if not member_found:
+                self.reporter.warning(f"{member_id} ID'li üye bulunamadı.")
+
+            return False
+
+        except Exception as e:
+            import traceback
+            self.reporter.error(f"Beklenmeyen bir hata oluştu: {str(e)}", detail=traceback.format_exc())
+            return False
+
+    def update_all_members_kpis(self, member_ids: Optional[List[str]] = None, delay: float = DEFAULT_KPI_DELAY):
+        """Tüm (ya da verilen) üyelerin KPI verilerini güncelle.
+
+        Sonuç özeti döndürür: {"total", "updated", "failed", "errors"}; ön koşul
+        sağlanmazsa (üye yok, token yok) None döner.
+        """
+        members = self.get_all_members()
+        if member_ids is not None:
+            wanted = {str(member_id) for member_id in member_ids}
+            members = [m for m in members if m['member_id'] in wanted]
+        total_members = len(members)
+
+        if total_members == 0:
+            self.reporter.warning("Güncellenecek üye bulunamadı.")
+            return None
+
+        # Token kontrolü yap
+        token_data = self.token_manager.load_token()
+        if not token_data.get('token'):
+            self.reporter.error("API token'ı bulunamadı. Lütfen ayarlardan token girin.")
+            return None
+
+        updated_count = 0
+        failed_count = 0
+        errors = []
+
+        for i, member in enumerate(members):
+            member_id = member['member_id']
+            username = member.get('username', f'Üye-{member_id}')
+
+            self.reporter.progress(
+                i, total_members,
+                f"Güncelleniyor: {username} ({i+1}/{total_members}) - Başarılı: {updated_count}, Başarısız: {failed_count}",
+                member_id=member_id
+            )
+
+            try:
+                if self.update_member_kpis(member_id):
+                    updated_count += 1
+                else:
+                    failed_count += 1
+                    errors.append(f"{username} (ID: {member_id}): Güncelleme başarısız")
+            except Exception as e:
+                failed_count += 1
+                errors.append(f"{username} (ID: {member_id}) güncellenirken hata: {str(e)}")
+
+            # API'ye çok fazla yüklenmemek için kısa bir bekleme
+            if delay and i + 1 < total_members:
+                time.sleep(delay)
+
+        self.reporter.progress(total_members, total_members,
+                               f"Tamamlandı - Başarılı: {updated_count}, Başarısız: {failed_count}")
+        self.reporter.progress_done()
+
+        return {
+            "total": total_members,
+            "updated": updated_count,
+            "failed": failed_count,
+            "errors": errors
+        }
+
+    def process_api_response(self, api_data):
+        """API yanıtını işle ve standartlaştır"""
+        try:
+            # API yanıtı doğrudan Data içinde gelebilir veya başka bir yapıda olabilir
+            if 'Data' in api_data and isinstance(api_data['Data'], dict):
+                data = api_data['Data']
+            else:
+                data = api_data  # Zaten doğrudan data gelmişse
+
+            processed = {
+                'username': data.get('Login', data.get('username', '')),
+                'full_name': f"{data.get('FirstName', data.get('first_name', ''))} {data.get('LastName', data.get('last_name', ''))}".strip(),
+                'email': data.get('Email', data.get('email', '')),
+                'phone': data.get('Phone', data.get('phone', '')),
+                'balance': float(data.get('Balance', data.get('balance', 0)) or 0),
+                'currency': data.get('Currency', data.get('currency', 'TRY')),
+                'registration_date': parse_api_date(data.get('RegistrationDate', data.get('registration_date', ''))),
+                'last_login_date': parse_api_date(data.get('LastLoginDate', data.get('last_login_date', ''))),
+                'is_active': not data.get('IsBlocked', not data.get('is_active', True) if 'is_active' in data else False),
+                'partner_name': data.get('PartnerName', data.get('partner_name', '')),
+                'birth_date': parse_api_date(data.get('BirthDate', data.get('birth_date', ''))),
+                'last_deposit_date': parse_api_date(data.get('LastDepositDate', data.get('last_deposit_date', ''))),
+                'last_casino_bet': parse_api_date(data.get('LastCasinoBet', data.get('last_casino_bet', '')))
+            }
+
+            # Son yatırımdan bu yana geçen gün
+            if processed['last_deposit_date']:
+                try:
+                    last_deposit = datetime.strptime(processed['last_deposit_date'].split('.')[0], '%Y-%m-%d %H:%M:%S')
+                    processed['days_without_deposit'] = max(0, (datetime.now() - last_deposit).days)
+                except Exception:
+                    processed['days_without_deposit'] = 999  # Hata durumunda büyük bir değer ata
+
+            return processed
+
+        except Exception as e:
+            self.reporter.error(f"API yanıtı işlenirken hata: {e}")
+            # Hata durumunda en azından boş bir dict döndür
+            return {
+                'username': '',
+                'full_name': '',
+                'email': '',
+                'phone': '',
+                'balance': 0,
+                'currency': 'TRY',
+                'registration_date': '',
+                'last_login_date': '',
+                'is_active': True,
+                'partner_name': '',
+                'birth_date': '',
+                'last_deposit_date': '',
+                'last_casino_bet': '',
+                'days_without_deposit': 999
+            }
+
+    def update_member_api_data(self, member_id, api_data):
+        """Üye API verisini güncelle"""
+        try:
+            def apply(member):
+                # Mevcut KPI verilerini koru
+                kpi_data = member.get('kpi_data', {})
+                last_kpi_update = member.get('last_kpi_update')
+
+                member.update({
+                    'last_api_update': datetime.now().isoformat(),
+                    'kpi_data': kpi_data,
+                    'last_kpi_update': last_kpi_update
+                })
+
+                # API'den gelen bilgileri üye kaydına ekle
+                if api_data:
+                    for field, default in (('email', ''), ('phone', ''), ('balance', 0), ('currency', 'TRY'),
+                                           ('total_deposits', 0), ('total_withdrawals', 0),
+                                           ('last_deposit_date', ''), ('last_casino_bet', ''),
+                                           ('days_without_deposit', 999), ('registration_date', ''),
+                                           ('last_login_date', ''), ('partner_name', ''), ('birth_date', ''),
+                                           ('status', None)):
+                        member[field] = api_data.get(field, member.get(field, default))
+
+            return self._update_member(member_id, apply)
+        except Exception as e:
+            self.reporter.error(f"Üye güncelleme hatası: {e}")
+            return False
+
+    def toggle_member_status(self, member_id):
+        """Üyenin aktif/pasif durumunu değiştir"""
+        try:
+            def apply(member):
+                member['is_active'] = not member.get('is_active', True)
+                member['status_updated_at'] = datetime.now().isoformat()
+
+            return self._update_member(member_id, apply)
+        except Exception as e:
+            self.reporter.error(f"Üye durumu değiştirme hatası: {e}")
+            return False
@@ -0,0 +1,397 @@
+"""
+CashBack Core: CashBack Düzeltmesi analizinin Streamlit'ten bağımsız iş mantığı.
+- CashbackProcessor: Excel verisini müşteri bazında gruplar, Excel raporlarını üretir
+- CashbackStore: CashBack.json'a tarih bazlı kayıt (storage ile atomik), tarih aralığı sorguları;
+  get_customer_index ile müşteri bazlı indeks (cashback_index, kayıtta artımlı güncellenir); gösterge
+  paneli özetleri (get_summary, get_daily_totals) bu indeksin günlük özetlerinden okunur
+- group_by_customer: kayıtları müşteri bazında toplar (tarihsel analiz)
+Müşteri gruplaması ham isim yerine text_normalize.fold anahtarıyla yapılır (çift boşluk, büyük / küçük harf
+ve Türkçe karakter farkları grubu bölmez)
+Hata bildirimleri events.Reporter üzerinden yapılır; app.py bu sınıfları
+StreamlitReporter ile, cli.py ise JsonLinesReporter ile kullanır.
+"""
+import calendar
+import os
+import traceback
+from datetime import date, datetime, timedelta
+
+import cashback_index
+import perf
+import serializer
+import storage
+from events import NULL_REPORTER, Reporter
+from text_normalize import clean, fold, fold_all
+
+CASHBACK_FILE = "CashBack.json"
+NAME_KEY = "_isim_anahtari"  # Gruplama için katlanmış müşteri adı (çıktıya girmez)
+
+
+def _empty_frame():
+    import pandas as pd
+    return pd.DataFrame()
+
+
+def group_by_customer(records):
+    """Kayıtları (Müşteri_Kimliği, Müşteri_Adı) bazında toplayıp miktara göre sırala"""
+    import pandas as pd
+
+    df = pd.DataFrame(records)
+    if df.empty:
+        return df
+
+    # Günler arasında farklı yazılmış aynı isim (boşluk / büyük harf / Türkçe karakter) tek grupta toplanır
+    df[NAME_KEY] = fold_all(df['Müşteri_Adı'])
+    grouped = df.groupby(['Müşteri_Kimliği', NAME_KEY]).agg(
+        Müşteri_Adı=('Müşteri_Adı', 'first'),
+        Adet=('Adet', 'sum'),
+        Toplam_Miktar=('Toplam_Miktar', 'sum'),
+    ).reset_index().drop(columns=[NAME_KEY])
+    grouped['Müşteri_Adı'] = grouped['Müşteri_Adı'].map(clean)
+
+    return grouped.sort_values('Toplam_Miktar', ascending=False).reset_index(drop=True)
+
+
+class CashbackProcessor:
+    """Excel'den gelen CashBack Düzeltmesi kayıtlarını işler"""
+
+    def __init__(self, reporter: Reporter = None):
+        self.required_columns = ['Kullanıcı ID', 'Kullanıcı Adı', 'Bonus Türü']
+        self.cashback_value = "CashBack Düzeltmesi"
+        self.reporter = reporter or NULL_REPORTER
+
+    def read_excel(self, source, file_name: str = None):
+        """Excel dosyasını oku (yol ya da dosya nesnesi)"""
+        import pandas as pd
+
+        file_name = file_name or (source if isinstance(source, str) else getattr(source, "name", ""))
+        with perf.stage("excel.read"):
+            if str(file_name).endswith('.xlsx'):
+                return pd.read_excel(source, engine='openpyxl')
+            return pd.read_excel(source)
+
+    @perf.timed("excel.process.cashback")
+    def process_cashback_data(self, df):
+        """Excel dosyasından CashBack Düzeltmesi verilerini işler"""
+        import pandas as pd
+
+        try:
+            # Sütun isimlerini normalize et
+            df.columns = df.columns.str.strip()
+
+            self.reporter.info(f"📋 Bulunan sütunlar: {list(df.columns)}")
+
+            # Sütun eşleştirmesi
+            column_mapping = {}
+
+            # ID sütununu bul - öncelik sırasına göre
+            possible_id_columns = ['müşteri kimliği', 'müşteri_kimliği', 'kullanıcı id', 'kullanıcı_id', 'customer_id']
+            for possible in possible_id_columns:
+                for col in df.columns:
+                    if fold(possible) in fold(col):
+                        column_mapping['ID'] = col
+                        break
+                if 'ID' in column_mapping:
+                    break
+
+            # Eğer bulunamadıysa B sütununu kontrol et
+            if 'ID' not in column_mapping:
+                if len(df.columns) > 1:
+                    column_mapping['ID'] = df.columns[1]
+
+            # İsim sütununu bul
+            possible_name_columns = ['kullanıcı adı', 'kullanıcı_adı', 'müşteri adı', 'müşteri_adı', 'ad', 'isim']
+            for col in df.columns:
+                if any(fold(possible) in fold(col) for possible in possible_name_columns):
+                    column_mapping['Ad'] = col
+                    break
+
+            # Miktar sütununu bul
+            possible_amount_columns = ['para birimi miktar', 'miktar', 'tutar', 'amount', 'toplam']
+            for col in df.columns:
+                if any(fold(possible) in fold(col) for possible in possible_amount_columns):
+                    column_mapping['Miktar'] = col
+                    break
+
+            # Gerekli sütunların kontrolü
+            if 'ID' not in column_mapping:
+                self.reporter.error("❌ Müşteri ID sütunu bulunamadı!")
+                return pd.DataFrame()
+
+            if 'Ad' not in column_mapping:
+                self.reporter.error("❌ Müşteri Adı sütunu bulunamadı!")
+                return pd.DataFrame()
+
+            # Sütun eşleştirmesini göster
+            mapping_lines = "\n".join(f"- {key} → {value}" for key, value in column_mapping.items())
+            self.reporter.success(f"✅ Sütun eşleştirmesi tamamlandı:\n{mapping_lines}", column_mapping=column_mapping)
+
+            # Tüm satırlar CashBack Düzeltmesi olduğu için direkt işleme devam et
+            cashback_df = df.copy()
+
+            # Boş satırları temizle
+            cashback_df = cashback_df.dropna(subset=[column_mapping['ID'], column_mapping['Ad']])
+
+            if cashback_df.empty:
+                self.reporter.warning("⚠️ İşlenebilir veri bulunamadı!")
+                return pd.DataFrame()
+
+            self.reporter.success(f"✅ {len(cashback_df)} adet CashBack Düzeltmesi kaydı bulundu!", rows=len(cashback_df))
+
+            # Müşteri bazında gruplama yap
+            id_col = column_mapping['ID']
+            name_col = column_mapping['Ad']
+
+            # İsim farkları ("Özlem  Ali ", "ÖZLEM ALİ") grubu bölmesin: katlanmış isim anahtarıyla grupla,
+            # gösterimde ilk yazımın boşlukları düzeltilmiş hâli kullanılır
+            cashback_df[NAME_KEY] = fold_all(cashback_df[name_col])
+            aggregations = {
+                'Müşteri_Adı': pd.NamedAgg(column=name_col, aggfunc='first'),
+                'Adet': pd.NamedAgg(column=name_col, aggfunc='size'),
+            }
+            if 'Miktar' in column_mapping:
+                amount_col = column_mapping['Miktar']
+                # Miktar sütununu sayısal veriye çevir
+                cashback_df[amount_col] = pd.to_numeric(cashback_df[amount_col], errors='coerce').fillna(0)
+                # Her müşteri için işlem sayısı ve toplam miktar
+                aggregations['Toplam_Miktar'] = pd.NamedAgg(column=amount_col, aggfunc='sum')
+
+            grouped = cashback_df.groupby([id_col, NAME_KEY]).agg(**aggregations).reset_index()
+            if 'Toplam_Miktar' not in grouped:
+                # Miktar sütunu yoksa sadece işlem sayısı
+                grouped['Toplam_Miktar'] = 0
+
+            # Sütun isimlerini düzenle
+            grouped = grouped.drop(columns=[NAME_KEY]).rename(columns={id_col: 'Müşteri_Kimliği'})
+            grouped['Müşteri_Adı'] = grouped['Müşteri_Adı'].map(clean)
+
+            # Veri tiplerini düzelt
+            grouped['Müşteri_Kimliği'] = pd.to_numeric(grouped['Müşteri_Kimliği'], errors='coerce')
+            grouped['Adet'] = pd.to_numeric(grouped['Adet'], errors='coerce').fillna(0).astype(int)
+            grouped['Toplam_Miktar'] = pd.to_numeric(grouped['Toplam_Miktar'], errors='coerce').fillna(0)
+
+            # NaN değerleri temizle
+            grouped = grouped.dropna(subset=['Müşteri_Kimliği'])
+
+            # En yüksek miktardan en düşüğe sırala
+            if grouped['Toplam_Miktar'].sum() > 0:
+                grouped = grouped.sort_values('Toplam_Miktar', ascending=False).reset_index(drop=True)
+            else:
+                grouped = grouped.sort_values('Adet', ascending=False).reset_index(drop=True)
+
+            self.reporter.success(f"✅ {len(grouped)} farklı müşterinin CashBack analizi tamamlandı!", customers=len(grouped))
+
+            return grouped
+
+        except Exception as e:
+            self.reporter.error(f"❌ Veri işleme hatası: {str(e)}", detail=traceback.format_exc())
+            return _empty_frame()
+
+    @perf.timed("excel.export.cashback")
+    def create_formatted_excel(self, df):
+        """Formatlanmış Excel dosyası oluşturur"""
+        try:
+            from excel_export import build_cashback_workbook
+            return build_cashback_workbook(df)
+
+        except Exception as e:
+            self.reporter.error(f"❌ Excel dosyası oluşturma hatası: {str(e)}")
+            return None
+
+    @perf.timed("excel.export.cashback_history")
+    def create_historical_analysis_excel(self, data, date_range):
+        """Tarihsel analiz için renkli ve çarpıcı Excel dosyası oluşturur"""
+        try:
+            import pandas as pd
+            from excel_export import build_historical_workbook
+
+            # DataFrame oluştur ve sırala
+            df = pd.DataFrame(data)
+            if not df.empty:
+                df = df.sort_values('Toplam_Miktar', ascending=False).reset_index(drop=True)
+
+            return build_historical_workbook(df, date_range)
+
+        except Exception as e:
+            self.reporter.error(f"❌ Tarihsel Excel dosyası oluşturma hatası: {str(e)}")
+            return None
+
+
+class CashbackStore:
+    """CashBack.json üzerinde tarih bazlı kayıt ve sorgular"""
+
+    def __init__(self, json_file: str = CASHBACK_FILE, reporter: Reporter = None):
+        self.json_file = json_file
+        self.reporter = reporter or NULL_REPORTER
+
+    def save_to_json(self, df, selected_date=None):
+        """DataFrame'i (ya da kayıt listesini) JSON dosyasına belirli tarihe kaydeder"""
+        try:
+            if selected_date is None:
+                selected_date = date.today()
+
+            # Tarihi string formatına çevir
+            date_str = selected_date.strftime("%Y-%m-%d")
+            records = df.to_dict('records') if hasattr(df, 'to_dict') else list(df)
+
+            def apply(existing_data):
+                # Mevcut veriler (başka bir oturumun arada yaptığı kayıtlar dahil)
+                existing_data = self._normalize(existing_data)
+
+                # Aynı tarihli kayıt varsa güncelle, yoksa yeni ekle
+                updated = False
+                for entry in existing_data:
+                    if entry.get("date", "").split("_")[0] == date_str:
+                        entry["data"] = records
+                        entry["timestamp"] = datetime.now().isoformat()
+                        updated = True
+                        break
+
+                if not updated:
+                    new_data = {
+                        "date": f"{date_str}_{datetime.now().strftime('%H:%M:%S')}",
+                        "timestamp": datetime.now().isoformat(),
+                        "data": records
+                    }
+                    existing_data.append(new_data)
+
+                # Tarihe göre sırala (en yeni en üstte)
+                existing_data.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+                return existing_data
+
+            def on_write(history, base_version, version):
+                # Müşteri indeksinde yalnızca kaydedilen gün yeniden indekslenir
+                try:
+                    cashback_index.apply_write(self.json_file, base_version, version, history, date_str)
+                except Exception as e:
+                    self.reporter.warning(f"⚠️ Müşteri indeksi güncellenemedi, yeniden yüklenecek: {e}")
+
+            with perf.stage("json.save.cashback") as timing:
+                timing["bytes"] = storage.update_json(self.json_file, apply, default=[], on_write=on_write)
+
+            return True
+
+        except Exception as e:
+            self.reporter.error(f"❌ JSON kaydetme hatası: {str(e)}")
+            return False
+
+    @staticmethod
+    def _normalize(data):
+        """Dosya içeriğini tarih bazlı kayıt listesine çevir (eski düz liste biçimi dahil)"""
+        if isinstance(data, list) and data and isinstance(data[0], dict):
+            # Yeni format kontrolü
+            if "date" in data[0]:
+                return data
+            else:
+                # Eski format - yeni formata çevir
+                return [{
+                    "date": datetime.now().strftime("%Y-%m-%d_%H:%M:%S"),
+                    "timestamp": datetime.now().isoformat(),
+                    "data": data
+                }]
+
+        return data if isinstance(data, list) else []
+
+    def load_all_data(self):
+        """JSON dosyasından tüm verileri yükler"""
+        try:
+            if os.path.exists(self.json_file):
+                with perf.stage("json.load.cashback", perf.file_size(self.json_file)):
+                    return self._normalize(serializer.load_file(self.json_file))
+
+            return []
+
+        except Exception as e:
+            self.reporter.error(f"❌ JSON dosyası okuma hatası: {str(e)}")
+            return []
+
+    def get_customer_index(self) -> cashback_index.CustomerIndex:
+        """Müşteri bazlı CashBack indeksi (müşteri detayı, tekrar eden müşteriler, dönem karşılaştırma)"""
+        try:
+            return cashback_index.load_index(self.json_file, self._normalize)
+        except Exception as e:
+            self.reporter.error(f"❌ Müşteri indeksi hatası: {str(e)}")
+            return cashback_index.CustomerIndex()
+
+    def get_data_by_date_range(self, start_date, end_date):
+        """Tarih aralığına göre verileri filtreler"""
+        try:
+            all_data = self.load_all_data()
+
+            if not all_data:
+                return []
+
+            filtered_data = []
+
+            for entry in all_data:
+                # Tarih stringinden tarihi çıkar
+                date_str = entry.get("date", "").split("_")[0]
+                if date_str:
+                    try:
+                        entry_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+                        if start_date <= entry_date <= end_date:
+                            filtered_data.extend(entry["data"])
+                    except ValueError:
+                        continue
+
+            return filtered_data
+
+        except Exception as e:
+            self.reporter.error(f"❌ Tarihsel veri yükleme hatası: {str(e)}")
+            return []
+
+    def get_last_7_days_data(self):
+        """Son 7 günün verilerini getirir"""
+        end_date = date.today()
+        start_date = end_date - timedelta(days=7)
+        return self.get_data_by_date_range(start_date, end_date)
+
+    def get_monthly_data(self, year=None, month=None):
+        """Belirli bir ayın verilerini getirir"""
+        if year is None:
+            year = date.today().year
+        if month is None:
+            month = date.today().month
+
+        # Ayın ilk ve son günü
+        start_date = date(year, month, 1)
+        last_day = calendar.monthrange(year, month)[1]
+        end_date = date(year, month, last_day)
+
+        return self.get_data_by_date_range(start_date, end_date)
+
+    def get_summary(self, start_date, end_date):
+        """Tarih aralığının gösterge paneli özeti (kayıt / adet / miktar toplamı, tekil müşteri — uzun
+        aralıklarda tahmin, en yüksek kayıtlar); geçmişin tamamı yerine aralıktaki günlerin özetleri okunur"""
+        try:
+            return self.get_customer_index().summary(start_date, end_date)
+        except Exception as e:
+            self.reporter.error(f"❌ Özet hesaplama hatası: {str(e)}")
+            return {"records": 0, "count": 0, "amount": 0, "customers": 0, "customers_exact": True, "top": []}
+
+    def get_last_7_days_summary(self):
+        """Son 7 günün özeti (get_last_7_days_data ile aynı aralık)"""
+        end_date = date.today()
+        return self.get_summary(end_date - timedelta(days=7), end_date)
+
+    def get_monthly_summary(self, year=None, month=None):
+        """Belirli bir ayın özeti (get_monthly_data ile aynı aralık)"""
+        year = year or date.today().year
+        month = month or date.today().month
+        return self.get_summary(date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1]))
+
+    def get_daily_totals(self, start_date, end_date):
+        """Günlük toplam miktarları getirir (müşteri indeksinin günlük özetlerinden)"""
+        try:
+            daily_totals = {}
+
+            for date_str, amount in self.get_customer_index().day_totals(start_date, end_date).items():
+                try:
+                    daily_totals[datetime.strptime(date_str, "%Y-%m-%d").date()] = amount
+                except ValueError:
+                    continue
+
+            return daily_totals
+
+        except Exception as e:
+            self.reporter.error(f"❌ Günlük toplam hesaplama hatası: {str(e)}")
+            return {}
@@ -0,0 +1,396 @@
+"""
+CashBack Index: CashBack.json için müşteri bazlı indeks (Müşteri_Kimliği → tarih bazında adet / miktar).
+- Müşteri başına tarih sıralı günlük satırlar + kümülatif toplamlar (ilk sorguda): tarih aralığı
+  toplamı iki bisect ve bir çıkarma (girdileri dolaşmadan)
+- customer_history: müşteri detayı; leaderboard: en çok gün CashBack alan (tekrar eden) müşteriler;
+  compare: iki dönem arasında müşteri bazında miktar farkı
+- Gün başına özet (kayıt / adet / miktar toplamı, müşteri kümesi + HyperLogLog, en yüksek kayıtlar):
+  son 7 gün / ay başından bugüne metrikleri tüm geçmiş yerine aralıktaki günlerin özetlerinden okunur.
+  Tekil müşteri EXACT_CUSTOMER_DAYS güne kadar günlük kümelerin birleşimiyle kesin sayılır, daha uzun
+  aralıklarda HyperLogLog ile tahmin edilir
+- CashbackStore.save_to_json yazdıktan sonra apply_write ile yalnızca kaydedilen tarih yeniden
+  indekslenir; dosya başka bir oturumca değiştiyse load_index dosyayı yeniden okur
+"""
+import heapq
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from itertools import accumulate, chain
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import perf
+import storage
+from sketches import HyperLogLog
+from text_normalize import clean
+
+DayLike = Union[date, str, None]
+DASHBOARD_TOP = 15  # Gün başına saklanan en yüksek kayıt (gösterge paneli grafikleri en çok 15 gösterir)
+EXACT_CUSTOMER_DAYS = 31  # Bu kadar güne kadar tekil müşteri küme birleşimiyle kesin sayılır
+
+
+def _day(value: DayLike) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def customer_key(value):
+    """Müşteri_Kimliği'ni tek biçime getir (eski dosyalardaki 123.0 / "123" → 123)"""
+    if type(value) is int:
+        return value
+    try:
+        number = float(value)
+        if number.is_integer():
+            return int(number)
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+def _number(value) -> float:
+    if type(value) in (int, float):
+        return 0.0 if value != value else value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if number != number else number
+
+
+class _CustomerSeries:
+    """Bir müşterinin tarih sıralı günlük (tarih, adet, miktar, isim) satırları; tarih dizisi ve
+    kümülatif toplamlar ilk sorguda hesaplanır"""
+
+    __slots__ = ("rows", "_lookup")
+
+    def __init__(self):
+        self.rows: List[tuple] = []
+        self._lookup = None
+
+    def add(self, day: str, count: int, amount: float, name: str):
+        rows = self.rows
+        if not rows or day > rows[-1][0]:
+            rows.append((day, count, amount, name))  # Kurulumda günler sırayla gelir
+        else:
+            rows.insert(bisect_left(rows, day, key=itemgetter(0)), (day, count, amount, name))
+        self._lookup = None
+
+    def remove(self, day: str):
+        position = bisect_left(self.rows, day, key=itemgetter(0))
+        if position < len(self.rows) and self.rows[position][0] == day:
+            del self.rows[position]
+            self._lookup = None
+
+    def _index(self) -> tuple:
+        """(tarihler, kümülatif adetler, kümülatif miktarlar)"""
+        if self._lookup is None:
+            dates, counts, amounts, _ = zip(*self.rows) if self.rows else ((), (), (), ())
+            self._lookup = (dates, list(accumulate(counts, initial=0)), list(accumulate(amounts, initial=0.0)))
+        return self._lookup
+
+    def range(self, start: Optional[str], end: Optional[str]) -> Tuple[int, int]:
+        dates = self._index()[0]
+        low = bisect_left(dates, start) if start else 0
+        high = bisect_right(dates, end) if end else len(dates)
+        return low, high
+
+    def totals(self, start: Optional[str] = None, end: Optional[str] = None) -> Tuple[int, int, float]:
+        """(gün sayısı, adet, miktar)"""
+        _, counts, amounts = self._index()
+        low, high = self.range(start, end)
+        return high - low, counts[high] - counts[low], amounts[high] - amounts[low]
+
+    @property
+    def name(self) -> str:
+        """En yeni kayıttaki yazım"""
+        return clean(self.rows[-1][3]) if self.rows else ""
+
+    @property
+    def first_day(self) -> Optional[str]:
+        return self.rows[0][0] if self.rows else None
+
+    @property
+    def last_day(self) -> Optional[str]:
+        return self.rows[-1][0] if self.rows else None
+
+
+class _DaySummary:
+    """Bir günün gösterge paneli özeti: kayıt / adet / miktar toplamı, tekil müşteriler, en yüksek kayıtlar"""
+
+    __slots__ = ("records", "count", "amount", "customers", "top", "_sketch")
+
+    def __init__(self, records: list, count: int, amount: float, customers: set):
+        self.records = len(records)
+        self.count = count
+        self.amount = amount
+        self.customers = customers
+        self.top = heapq.nlargest(DASHBOARD_TOP, records, key=lambda record: _number(record.get("Toplam_Miktar", 0)))
+        self._sketch = None
+
+    @property
+    def sketch(self) -> HyperLogLog:
+        """Günün müşteri özeti (ilk ihtiyaçta, yalnızca o günün müşterileriyle kurulur)"""
+        if self._sketch is None:
+            self._sketch = HyperLogLog(values=self.customers)
+        return self._sketch
+
+
+class CustomerIndex:
+    """CashBack geçmişi üzerinde müşteri → tarih serisi indeksi ve günlük özetler"""
+
+    def __init__(self, history: Iterable[dict] = ()):
+        self._customers: Dict[object, _CustomerSeries] = {}
+        self._days: Dict[str, _DaySummary] = {}
+        self._day_list: List[str] = []  # _days'in sıralı anahtarları (aralık için bisect)
+        self._lock = threading.RLock()
+        # leaderboard / compare sonuçları: tüm müşterileri dolaşırlar, yeniden çizimlerde tekrar hesaplanmaz
+        self._results: Dict[tuple, List[dict]] = {}
+        by_date: Dict[str, list] = {}
+        for entry in history:
+            day = str(entry.get("date", "")).split("_")[0]
+            if day:
+                by_date.setdefault(day, []).extend(entry.get("data") or [])
+        for day in sorted(by_date):
+            self._append_day(day, by_date[day])
+
+    def __len__(self) -> int:
+        return len(self._customers)
+
+    def _append_day(self, day: str, records: list):
+        """Kurulum: günler artan sırada gelir, müşterinin aynı günkü kayıtları son elemana eklenir"""
+        customers = self._customers
+        members = set()
+        day_count, day_amount = 0, 0.0
+        for record in records:
+            key = customer_key(record.get("Müşteri_Kimliği"))
+            count = int(_number(record.get("Adet", 0)))
+            amount = _number(record.get("Toplam_Miktar", 0))
+            day_count += count
+            day_amount += amount
+            series = customers.get(key)
+            if series is None:
+                series = customers[key] = _CustomerSeries()
+            if key in members:
+                _, total_count, total_amount, _ = series.rows[-1]
+                series.rows[-1] = (day, total_count + count, total_amount + amount, record.get("Müşteri_Adı", ""))
+            else:
+                members.add(key)
+                series.rows.append((day, count, amount, record.get("Müşteri_Adı", "")))
+        self._days[day] = _DaySummary(records, day_count, day_amount, members)
+        self._day_list.append(day)
+
+    def _add_day(self, day: str, records: list):
+        totals: Dict[object, list] = {}
+        for record in records:
+            key = customer_key(record.get("Müşteri_Kimliği"))
+            count = int(_number(record.get("Adet", 0)))
+            amount = _number(record.get("Toplam_Miktar", 0))
+            row = totals.get(key)
+            if row is None:
+                totals[key] = [count, amount, record.get("Müşteri_Adı", "")]
+            else:
+                row[0] += count
+                row[1] += amount
+                row[2] = record.get("Müşteri_Adı", "")
+        customers = self._customers
+        for key, (count, amount, name) in totals.items():
+            series = customers.get(key)
+            if series is None:
+                series = customers[key] = _CustomerSeries()
+            series.add(day, count, amount, name)
+        day_count = sum(row[0] for row in totals.values())
+        day_amount = sum(row[1] for row in totals.values())
+        if day not in self._days:
+            insort(self._day_list, day)
+        self._days[day] = _DaySummary(records, day_count, day_amount, set(totals))
+
+    def replace_day(self, day: str, records: list):
+        """day tarihinin kayıtları yeniden yazıldı: yalnızca o günün müşterilerini güncelle"""
+        with self._lock:
+            self._results.clear()
+            previous = self._days.get(day)
+            for key in (previous.customers if previous else ()):
+                series = self._customers.get(key)
+                if series is not None:
+                    series.remove(day)
+                    if not series.rows:
+                        del self._customers[key]
+            self._add_day(day, records)
+
+    def _active(self, start: Optional[str], end: Optional[str]):
+        """Aralıkta CashBack alan müşteriler (aralık yoksa hepsi); yalnızca o günlerin kümeleri birleştirilir"""
+        if start is None and end is None:
+            return self._customers.keys()
+        active = set()
+        for day in self._days_between(start, end):
+            active.update(self._days[day].customers)
+        return active
+
+    def _days_between(self, start: Optional[str], end: Optional[str]) -> List[str]:
+        low = bisect_left(self._day_list, start) if start else 0
+        high = bisect_right(self._day_list, end) if end else len(self._day_list)
+        return self._day_list[low:high]
+
+    def day_totals(self, start_date: DayLike = None, end_date: DayLike = None) -> Dict[str, float]:
+        """Aralıktaki günlerin toplam miktarı (tarih → miktar); yalnızca o günlerin özetleri okunur"""
+        with self._lock:
+            return {day: self._days[day].amount for day in self._days_between(_day(start_date), _day(end_date))}
+
+    @perf.timed("cashback_index.summary")
+    def summary(self, start_date: DayLike = None, end_date: DayLike = None) -> dict:
+        """Aralığın gösterge paneli özeti: kayıt, adet ve miktar toplamı, tekil müşteri ve en yüksek
+        DASHBOARD_TOP kayıt. Maliyet aralıktaki gün sayısıyla sınırlı.
+
+        customers EXACT_CUSTOMER_DAYS güne kadar kesin, daha uzun aralıklarda HyperLogLog tahminidir;
+        customers_exact hangisi olduğunu söyler"""
+        start, end = _day(start_date), _day(end_date)
+        with self._lock:
+            cached = self._results.get(("summary", start, end))
+            if cached is not None:
+                return dict(cached)
+            days = [self._days[day] for day in self._days_between(start, end)]
+            exact = len(days) <= EXACT_CUSTOMER_DAYS
+            if exact:
+                customers = len(set().union(*(day.customers for day in days)))
+            else:
+                sketch = HyperLogLog()
+                for day in days:
+                    sketch.update(day.sketch)
+                customers = sketch.count()
+            result = self._results[("summary", start, end)] = {
+                "records": sum(day.records for day in days),
+                "count": sum(day.count for day in days),
+                "amount": sum(day.amount for day in days),
+                "customers": customers,
+                "customers_exact": exact,
+                "top": heapq.nlargest(DASHBOARD_TOP, chain.from_iterable(day.top for day in days),
+                                      key=lambda record: _number(record.get("Toplam_Miktar", 0))),
+            }
+            return dict(result)
+
+    def customers(self) -> List:
+        return list(self._customers)
+
+    def name(self, customer_id) -> str:
+        series = self._customers.get(customer_key(customer_id))
+        return series.name if series else ""
+
+    def totals(self, customer_id, start_date: DayLike = None, end_date: DayLike = None) -> Optional[dict]:
+        """Müşterinin (aralıktaki) gün sayısı, adet ve miktarı; ilk / son CashBack tarihi"""
+        with self._lock:
+            series = self._customers.get(customer_key(customer_id))
+            if series is None:
+                return None
+            days, count, amount = series.totals(_day(start_date), _day(end_date))
+            return {"customer_id": customer_key(customer_id), "name": series.name, "days": days,
+                    "count": count, "amount": amount, "first_day": series.first_day, "last_day": series.last_day}
+
+    @perf.timed("cashback_index.customer_history")
+    def customer_history(self, customer_id, start_date: DayLike = None,
+                         end_date: DayLike = None) -> List[dict]:
+        """Müşterinin gün bazında CashBack kayıtları (tarih sıralı)"""
+        with self._lock:
+            series = self._customers.get(customer_key(customer_id))
+            if series is None:
+                return []
+            low, high = series.range(_day(start_date), _day(end_date))
+            return [{"date": day, "count": count, "amount": amount}
+                    for day, count, amount, _ in series.rows[low:high]]
+
+    @perf.timed("cashback_index.leaderboard")
+    def leaderboard(self, n: int = 20, start_date: DayLike = None, end_date: DayLike = None,
+                    by: str = "days") -> List[dict]:
+        """En çok gün (by="days") ya da en yüksek miktarla (by="amount") CashBack alan n müşteri"""
+        start, end = _day(start_date), _day(end_date)
+        rank = 0 if by == "days" else 2
+        rows = []
+        with self._lock:
+            cached = self._results.get(("leaderboard", n, start, end, rank))
+            if cached is not None:
+                return list(cached)
+            customers = self._customers
+            for key in self._active(start, end):
+                totals = customers[key].totals(start, end)
+                if totals[0]:
+                    rows.append((totals[rank], totals[2], totals, key))
+            best = heapq.nlargest(n, rows, key=itemgetter(0, 1))
+            result = self._results[("leaderboard", n, start, end, rank)] = [
+                {"customer_id": key, "name": customers[key].name, "days": days, "count": count, "amount": amount}
+                for _, _, (days, count, amount), key in best]
+            return list(result)
+
+    @perf.timed("cashback_index.compare")
+    def compare(self, period_a: Tuple[DayLike, DayLike], period_b: Tuple[DayLike, DayLike],
+                n: Optional[int] = 20) -> List[dict]:
+        """İki dönemde müşteri bazında miktarlar; farkı (b - a) mutlak değerce en büyük n müşteri"""
+        a_start, a_end = map(_day, period_a)
+        b_start, b_end = map(_day, period_b)
+        rows = []
+        with self._lock:
+            cached = self._results.get(("compare", n, a_start, a_end, b_start, b_end))
+            if cached is not None:
+                return list(cached)
+            active = set(self._active(a_start, a_end))
+            active.update(self._active(b_start, b_end))
+            customers = self._customers
+            for key in active:
+                series = customers[key]
+                amount_a = series.totals(a_start, a_end)[2]
+                amount_b = series.totals(b_start, b_end)[2]
+                if amount_a or amount_b:
+                    rows.append((abs(amount_b - amount_a), amount_a, amount_b, key))
+            # Sözlükler yalnızca döndürülen satırlar için kurulur
+            by_change = itemgetter(0)  # Eşitlikte anahtarlar (int / str karışık) karşılaştırılmaz
+            if n is None:
+                rows = sorted(rows, key=by_change, reverse=True)
+            else:
+                rows = heapq.nlargest(n, rows, key=by_change)
+            result = self._results[("compare", n, a_start, a_end, b_start, b_end)] = [
+                {"customer_id": key, "name": customers[key].name, "amount_a": amount_a, "amount_b": amount_b,
+                 "change": amount_b - amount_a} for _, amount_a, amount_b, key in rows]
+            return list(result)
+
+
+_cache: Dict[str, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def load_index(path: str, normalize: Callable = list) -> CustomerIndex:
+    """CashBack.json'un güncel sürümü için indeks (dosya değişmediyse önceki indeks).
+
+    normalize: dosya içeriğini tarih bazlı kayıt listesine çevirir (CashbackStore._normalize)
+    """
+    key = os.path.abspath(path)
+    version = storage.file_version(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with perf.stage("json.load.cashback", perf.file_size(path)):
+        history, version = storage.read_json(path, [])
+    with perf.stage("cashback_index.build"):
+        index = CustomerIndex(normalize(history))
+    with _cache_lock:
+        _cache[key] = (version, index)
+    return index
+
+
+def apply_write(path: str, base_version: Optional[str], version: Optional[str], history: list, day: str):
+    """save_to_json'un yazdığı günü önbellekteki indekse uygula (indeks base_version'da değilse dokunulmaz)"""
+    key = os.path.abspath(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is None or base_version is None or cached[0] != base_version:
+            return
+        records = []
+        for entry in history:
+            if str(entry.get("date", "")).split("_")[0] == day:
+                records.extend(entry.get("data") or [])
+        try:
+            cached[1].replace_day(day, records)
+        except Exception:
+            _cache.pop(key, None)
+            raise
+        _cache[key] = (version, cached[1])
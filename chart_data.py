@@ -0,0 +1,94 @@
+"""
+Chart Data: Grafik verisinin sunucu tarafında küçültülmesi (tarayıcıya giden Plotly JSON'u sınırlı kalır).
+- resolution / aggregate: aralığın uzunluğuna göre gün / hafta / ay çözünürlüğüne toplama
+- lttb: Largest-Triangle-Three-Buckets; nokta bütçesini aşan serilerde şekli (tepe / dip) koruyarak
+  nokta seçer
+- scatter_trace: toplam nokta sayısı WEBGL_THRESHOLD'u aşan grafiklerde go.Scattergl (SVG yerine WebGL);
+  line_mode: uzun serilerde işaretçiler çizilmez
+"""
+from typing import Optional, Sequence, Tuple
+
+import pandas as pd
+import plotly.graph_objects as go
+
+DAILY_MAX_DAYS = 120     # Bu kadar güne kadar günlük noktalar
+WEEKLY_MAX_DAYS = 730    # Bu kadar güne kadar haftalık, sonrası aylık
+MAX_POINTS = 500         # Seri başına nokta bütçesi (LTTB)
+WEBGL_THRESHOLD = 1000   # Grafikteki toplam nokta bundan fazlaysa Scattergl
+MARKER_MAX_POINTS = 100  # Bundan uzun serilerde işaretçi çizilmez (yalnız çizgi)
+
+_DAYS = "_gun_sayisi"
+RESOLUTIONS = {"D": "Günlük", "W": "Haftalık", "MS": "Aylık"}
+
+
+def resolution(dates: Sequence) -> str:
+    """Tarih aralığının uzunluğuna göre pandas frekansı: "D", "W" ya da "MS\""""
+    if len(dates) == 0:
+        return "D"
+    span = (pd.Timestamp(max(dates)) - pd.Timestamp(min(dates))).days + 1
+    if span <= DAILY_MAX_DAYS:
+        return "D"
+    return "W" if span <= WEEKLY_MAX_DAYS else "MS"
+
+
+def aggregate(df: pd.DataFrame, date_column: str, freq: str, sums: Sequence[str] = (),
+              means: Sequence[str] = (), by: Optional[str] = None) -> pd.DataFrame:
+    """date_column'u freq dönemlerine topla (sums toplanır, means günlük ortalama alınır); by verilirse
+    grup başına. Günlük çözünürlükte gün başına tek satır olur."""
+    df = df.copy()
+    df[date_column] = pd.to_datetime(df[date_column])
+    # Önce gün (ve grup) başına topla: aynı günün satırları ortalamaya tek gün olarak girer
+    keys = [by, date_column] if by else [date_column]
+    daily = df.groupby(keys, sort=True)[list(sums) + list(means)].sum().reset_index()
+    if freq == "D":
+        return daily
+    grouper = [by, pd.Grouper(key=date_column, freq=freq)] if by else [pd.Grouper(key=date_column, freq=freq)]
+    rules = {column: "sum" for column in sums}
+    rules.update({column: "mean" for column in means})
+    rules[_DAYS] = "sum"
+    daily[_DAYS] = 1
+    result = daily.groupby(grouper).agg(rules).reset_index()
+    # Verisi olmayan dönemler (boş haftalar / aylar) sıfır değil, boşluk olarak kalır
+    return result[result[_DAYS] > 0].drop(columns=_DAYS).reset_index(drop=True)
+
+
+def lttb(x: Sequence, y: Sequence, threshold: int = MAX_POINTS) -> Tuple[list, list]:
+    """Seriyi threshold noktaya indir (ilk ve son nokta korunur); x sıralı olmalı"""
+    x, y = list(x), list(y)
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return x, y
+    xs = [pd.Timestamp(value).value if not isinstance(value, (int, float)) else value for value in x]
+    ys = [float(value) for value in y]
+
+    selected = [0]
+    bucket_size = (length - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        # Sonraki kovanın ortalaması üçgenin üçüncü köşesi
+        next_start, next_end = end, min(int((i + 2) * bucket_size) + 1, length)
+        count = max(next_end - next_start, 1)
+        avg_x = sum(xs[next_start:next_end]) / count if next_end > next_start else xs[-1]
+        avg_y = sum(ys[next_start:next_end]) / count if next_end > next_start else ys[-1]
+
+        best, best_area = start, -1.0
+        for j in range(start, min(end, length - 1)):
+            area = abs((xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(length - 1)
+    return [x[i] for i in selected], [y[i] for i in selected]
+
+
+def scatter_trace(total_points: int):
+    """Grafiğin toplam nokta sayısına göre iz sınıfı (go.Scatter ya da go.Scattergl)"""
+    return go.Scattergl if total_points > WEBGL_THRESHOLD else go.Scatter
+
+
+def line_mode(points: int) -> str:
+    """Seri uzunluğuna göre Plotly mode: kısa serilerde 'lines+markers', uzunlarda 'lines'"""
+    return 'lines+markers' if points <= MARKER_MAX_POINTS else 'lines'
@@ -0,0 +1,203 @@
+"""
+CLI: Streamlit arayüzü olmadan çalışan toplu işler (cron / zamanlanmış görevler).
+- import-daily: players-report Excel'ini BTag'e göre filtreleyip daily_data.json'a kaydeder
+- refresh-kpis: tüm (ya da seçili) üyelerin KPI verilerini backoffice API'den günceller
+- import-cashback: CashBack Excel'ini işleyip CashBack.json'a kaydeder
+- export: rapor / üye / CashBack verisini CSV, Parquet ya da (CashBack için) XLSX olarak yazar
+Tüm ilerleme ve sonuçlar stdout'a satır başına bir JSON olay olarak yazılır; son satır
+{"level": "result", ...} özetidir. Hata durumunda çıkış kodu 1'dir.
+--metrics-file (ya da ENV BTAG_METRICS_FILE) verilirse iş sonunda Prometheus metin biçiminde
+metrikler dosyaya yazılır (node_exporter textfile collector ile toplanabilir).
+
+Örnekler:
+    python cli.py import-daily players-report.xlsx --btag 2424878 --date 2025-08-01
+    python cli.py refresh-kpis --delay 0.2
+    python cli.py import-cashback cashback.xlsx --date 2025-08-01
+    python cli.py export report --format parquet --start 2025-08-01 -o rapor.parquet
+"""
+import argparse
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+from events import JsonLinesReporter
+
+
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _result(reporter, ok: bool, **fields) -> int:
+    reporter.emit(dict({"level": "result", "ok": ok}, **fields))
+    return 0 if ok else 1
+
+
+def cmd_import_daily(args, reporter) -> int:
+    import pandas as pd
+    from btag_core import DailyDataStore, MemberService
+
+    service = MemberService(members_file=os.path.join(args.data_dir, "members.json"), reporter=reporter)
+    github_sync = None
+    if args.sync:
+        from github_sync import GitHubSync
+        github_sync = GitHubSync(reporter=reporter)
+        if not github_sync.sync_enabled:
+            reporter.warning("GitHub senkronizasyonu kullanılamıyor (PyGithub / GITHUB_TOKEN).")
+
+    store = DailyDataStore(
+        daily_data_file=os.path.join(args.data_dir, "daily_data.json"),
+        members_file=service.members_file,
+        reporter=reporter,
+        github_sync=github_sync
+    )
+
+    with reporter.spinner(f"Excel okunuyor: {args.file}"):
+        df = pd.read_excel(args.file)
+
+    if 'BTag' not in df.columns:
+        reporter.error("Excel dosyasında 'BTag' sütunu bulunamadı.")
+        return _result(reporter, False, command="import-daily")
+
+    filtered_df = df[df['BTag'].astype(str) == str(args.btag)]
+    reporter.info(f"BTag {args.btag} için {len(filtered_df)} kayıt bulundu.", rows=len(filtered_df))
+    if filtered_df.empty:
+        return _result(reporter, False, command="import-daily", rows=0)
+
+    processed = store.process_excel_data(filtered_df)
+
+    added = 0
+    if args.add_new_members:
+        known_ids = {m['member_id'] for m in service.get_all_members()}
+        new_rows = processed[~processed['member_id'].isin(known_ids)]
+        for i, row in enumerate(new_rows.itertuples(index=False)):
+            reporter.progress(i, len(new_rows), f"Yeni üye ekleniyor: {row.member_id}")
+            if service.add_member(row.member_id, row.username, row.customer_name):
+                added += 1
+        reporter.progress(len(new_rows), len(new_rows), "Yeni üyeler eklendi")
+        reporter.progress_done()
+
+    ok = store.save_daily_data(processed, args.btag, args.date)
+    return _result(reporter, ok, command="import-daily", btag=str(args.btag), date=args.date.isoformat(),
+                   rows=len(processed), members_added=added)
+
+
+def cmd_refresh_kpis(args, reporter) -> int:
+    from btag_core import MemberService
+
+    service = MemberService(members_file=os.path.join(args.data_dir, "members.json"), reporter=reporter)
+    summary = service.update_all_members_kpis(member_ids=args.member_id, delay=args.delay)
+    if summary is None:
+        return _result(reporter, False, command="refresh-kpis")
+    return _result(reporter, summary["failed"] == 0, command="refresh-kpis", **summary)
+
+
+def cmd_import_cashback(args, reporter) -> int:
+    from cashback_core import CashbackProcessor, CashbackStore
+
+    processor = CashbackProcessor(reporter=reporter)
+    store = CashbackStore(json_file=os.path.join(args.data_dir, "CashBack.json"), reporter=reporter)
+
+    with reporter.spinner(f"Excel okunuyor: {args.file}"):
+        df = processor.read_excel(args.file)
+
+    grouped = processor.process_cashback_data(df)
+    if grouped.empty:
+        return _result(reporter, False, command="import-cashback", customers=0)
+
+    ok = store.save_to_json(grouped, args.date)
+    return _result(reporter, ok, command="import-cashback", date=args.date.isoformat(), customers=len(grouped),
+                   total_amount=float(grouped['Toplam_Miktar'].sum()))
+
+
+def cmd_export(args, reporter) -> int:
+    import data_export
+
+    if args.format == "xlsx":
+        if args.dataset != "cashback":
+            reporter.error("XLSX çıktısı yalnızca 'cashback' veri seti için destekleniyor.")
+            return _result(reporter, False, command="export")
+        from cashback_core import CashbackProcessor, CashbackStore, group_by_customer
+
+        store = CashbackStore(json_file=os.path.join(args.data_dir, "CashBack.json"), reporter=reporter)
+        # Arayüzdeki gibi varsayılan aralık: son 7 gün
+        end = args.end or date.today()
+        start = args.start or end - timedelta(days=7)
+        grouped = group_by_customer(store.get_data_by_date_range(start, end))
+        content = CashbackProcessor(reporter=reporter).create_historical_analysis_excel(
+            grouped.to_dict('records'), (start, end)
+        )
+        if content is None:
+            return _result(reporter, False, command="export")
+        with open(args.output, "wb") as f:
+            f.write(content)
+        return _result(reporter, True, command="export", dataset=args.dataset, format=args.format,
+                       path=args.output, bytes=len(content))
+
+    try:
+        path, size = data_export.export_file(args.dataset, args.format, args.output, args.start, args.end, args.data_dir)
+    except (RuntimeError, ValueError) as e:
+        reporter.error(str(e))
+        return _result(reporter, False, command="export")
+    return _result(reporter, True, command="export", dataset=args.dataset, format=args.format, path=path, bytes=size)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="BTag / CashBack toplu işleri (Streamlit olmadan)")
+    parser.add_argument("--data-dir", default=".", help="JSON dosyalarının bulunduğu klasör")
+    parser.add_argument("--progress-interval", type=float, default=0.0,
+                        help="İlerleme olayları arasındaki en kısa süre (saniye)")
+    parser.add_argument("--metrics-file", default=os.environ.get("BTAG_METRICS_FILE"),
+                        help="İş sonunda metriklerin yazılacağı dosya (Prometheus metin biçimi)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    daily = subparsers.add_parser("import-daily", help="players-report Excel'ini günlük veriye aktar")
+    daily.add_argument("file")
+    daily.add_argument("--btag", required=True)
+    daily.add_argument("--date", type=_parse_date, default=date.today(), help="YYYY-MM-DD (varsayılan: bugün)")
+    daily.add_argument("--add-new-members", action="store_true", help="Listede olmayan üyeleri de ekle")
+    daily.add_argument("--sync", action="store_true", help="Kayıttan sonra daily_data.json'u GitHub'a yükle")
+    daily.set_defaults(handler=cmd_import_daily)
+
+    kpis = subparsers.add_parser("refresh-kpis", help="Üye KPI verilerini güncelle")
+    kpis.add_argument("--member-id", action="append", help="Sadece bu üye (birden fazla verilebilir)")
+    kpis.add_argument("--delay", type=float, default=0.5, help="Üyeler arası bekleme (saniye)")
+    kpis.set_defaults(handler=cmd_refresh_kpis)
+
+    cashback = subparsers.add_parser("import-cashback", help="CashBack Excel'ini CashBack.json'a aktar")
+    cashback.add_argument("file")
+    cashback.add_argument("--date", type=_parse_date, default=date.today(), help="YYYY-MM-DD (varsayılan: bugün)")
+    cashback.set_defaults(handler=cmd_import_cashback)
+
+    export = subparsers.add_parser("export", help="Raporları dışa aktar")
+    export.add_argument("dataset", choices=["report", "members", "cashback"])
+    export.add_argument("--format", choices=["csv", "parquet", "xlsx"], default="csv")
+    export.add_argument("--start", type=_parse_date, help="YYYY-MM-DD")
+    export.add_argument("--end", type=_parse_date, help="YYYY-MM-DD")
+    export.add_argument("-o", "--output", required=True)
+    export.set_defaults(handler=cmd_export)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    reporter = JsonLinesReporter(min_progress_interval=args.progress_interval)
+    if args.metrics_file:
+        import metrics  # noqa: F401  (perf aşamalarını dinlemeye başlar)
+    try:
+        return args.handler(args, reporter)
+    except Exception as e:
+        import traceback
+        reporter.error(f"Beklenmeyen hata: {e}", detail=traceback.format_exc())
+        return _result(reporter, False, command=args.command)
+    finally:
+        if args.metrics_file:
+            import metrics
+            try:
+                metrics.write_file(args.metrics_file)
+            except OSError as e:
+                reporter.warning(f"Metrik dosyası yazılamadı: {e}", path=args.metrics_file)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
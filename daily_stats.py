@@ -0,0 +1,121 @@
+"""
+Daily Stats: daily_data'nın gün bazında birleştirilebilir özetleri (uzun aralıklı istatistikler için).
+- DayStats: bir günün toplamları (kesin), tekil üyeler (HyperLogLog), üye-gün yatırım / çekim
+  dağılımları (QuantileSketch) ve her ölçüt için günün en yüksek TOP_K üyesi
+- range_statistics: aralıktaki günlerin özetleri birleştirilir (yıllık aralık ~365 küçük özet); en iyi
+  üyeler için gün / ay listelerinden (leaderboard) aday seçilip adayların kesin toplamları üye geçmişi
+  indeksinden okunur. Aday seçimi kesilmiş listelerden yapıldığından sıralama yaklaşıktır; yalnızca
+  n. adayın kesin toplamı listelerin payına (leaderboard) ulaşıyorsa kesin olduğu kanıtlanır (top_exact)
+- Özetler MemberHistoryIndex.day_stats ile gün başına bir kez kurulur; save_daily_data bir günü
+  yazınca o günün özeti yeniden hesaplanır
+"""
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+import leaderboard
+import perf
+from leaderboard import TOP_K
+from sketches import HyperLogLog, QuantileSketch
+
+CANDIDATE_FACTOR = 5  # İstenen n üye için kesin toplamı okunan aday sayısı: n * CANDIDATE_FACTOR
+TOP_METRICS = ('total_deposits', 'deposit_count', 'total_withdrawals', 'net_amount')
+SKETCH_MIN_DAYS = 92  # İstatistik sayfası bundan uzun aralıklarda günlük özetlerle hızlı özet seçeneği sunar
+TOTAL_KEYS = ('total_deposits', 'total_withdrawals', 'total_deposit_count', 'total_withdrawal_count')
+
+
+class DayStats:
+    """Bir günün (tüm btag'ler) özeti"""
+
+    __slots__ = ("totals", "members", "deposits", "withdrawals", "top")
+
+    def __init__(self, slots: dict):
+        # Üye bir günde birden çok btag altında görünebilir: önce üye-gün toplamları
+        per_member: Dict[str, list] = {}
+        for records in slots.values():
+            for record in records:
+                member_id = str(record.get('member_id', ''))
+                row = per_member.get(member_id)
+                if row is None:
+                    row = per_member[member_id] = [0, 0, 0, 0]
+                row[0] += record.get('total_deposits', 0)
+                row[1] += record.get('deposit_count', 0)
+                row[2] += record.get('total_withdrawals', 0)
+                row[3] += record.get('withdrawal_count', 0)
+
+        self.totals = {
+            'total_deposits': sum(row[0] for row in per_member.values()),
+            'total_withdrawals': sum(row[2] for row in per_member.values()),
+            'total_deposit_count': sum(row[1] for row in per_member.values()),
+            'total_withdrawal_count': sum(row[3] for row in per_member.values()),
+        }
+        self.members = HyperLogLog(values=per_member)
+        self.deposits = QuantileSketch(values=(row[0] for row in per_member.values() if row[0] > 0))
+        self.withdrawals = QuantileSketch(values=(row[2] for row in per_member.values() if row[2] > 0))
+        values = {
+            'total_deposits': lambda row: row[0],
+            'deposit_count': lambda row: row[1],
+            'total_withdrawals': lambda row: row[2],
+            'net_amount': lambda row: row[0] - row[2],
+        }
+        self.top: Dict[str, List[Tuple[float, str]]] = {
+            metric: heapq.nlargest(TOP_K, ((value(row), member_id) for member_id, row in per_member.items()))
+            for metric, value in values.items()
+        }
+
+    def summary_row(self) -> dict:
+        """analytics.daily_summary'deki günün satırı"""
+        return {
+            'Yatırım Miktarı': self.totals['total_deposits'],
+            'Çekim Miktarı': self.totals['total_withdrawals'],
+            'Yatırım Adedi': self.totals['total_deposit_count'],
+            'Çekim Adedi': self.totals['total_withdrawal_count'],
+        }
+
+
+@perf.timed("aggregation.range_statistics")
+def range_statistics(history_index, start_date, end_date, n: int = 10) -> dict:
+    """Aralığın istatistikleri, günlük özetlerin birleştirilmesiyle.
+
+    Dönen sözlük: totals (member_statistics ile aynı, kesin), active_members (tahmin), top
+    (ölçüt → [(member_id, üye satırı)], satırlar kesin toplamlarla), top_exact (ölçüt → sıralamanın
+    tam tarama ile aynı olduğu kanıtlandı mı), deposits / withdrawals (üye-gün dağılımları), daily
+    (analytics.daily_summary ile aynı), days (gün sayısı)
+    """
+    start, end = start_date.isoformat(), end_date.isoformat()
+    dates = [date_str for date_str in sorted(history_index.daily_data) if start <= date_str <= end]
+    days = [history_index.day_stats(date_str) for date_str in dates]
+
+    totals = dict.fromkeys(TOTAL_KEYS, 0)
+    members = HyperLogLog()
+    deposits, withdrawals = QuantileSketch(), QuantileSketch()
+    for day in days:
+        for key in totals:
+            totals[key] += day.totals[key]
+        members.update(day.members)
+        deposits.update(day.deposits)
+        withdrawals.update(day.withdrawals)
+
+    top: Dict[str, List[Tuple[str, dict]]] = {}
+    top_exact: Dict[str, bool] = {}
+    exact: Dict[str, Optional[dict]] = {}
+    for metric in TOP_METRICS:
+        candidates, slack = leaderboard.range_candidates(history_index, dates, start_date, end_date, metric,
+                                                         n * CANDIDATE_FACTOR)
+        for member_id in candidates:
+            if member_id not in exact:
+                exact[member_id] = history_index.totals(member_id, start_date, end_date)
+        rows = [(member_id, exact[member_id]) for member_id in candidates if exact[member_id] is not None]
+        top[metric] = leaderboard.top_n(rows, n, key=lambda item: item[1][metric])
+        # Aday olmayan hiçbir üyenin toplamı slack'i aşamaz: n. satır slack'in altında değilse sıralama kesin
+        top_exact[metric] = slack <= 0 or (len(top[metric]) >= n and top[metric][-1][1][metric] >= slack)
+
+    return {
+        'totals': totals,
+        'active_members': members.count() if days else 0,
+        'top': top,
+        'top_exact': top_exact,
+        'deposits': deposits,
+        'withdrawals': withdrawals,
+        'daily': {date_str: day.summary_row() for date_str, day in zip(dates, days)},
+        'days': len(days),
+    }
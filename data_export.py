@@ -0,0 +1,297 @@
+"""
+DataExport: Ham veri için hızlı, makine odaklı dışa aktarım (CSV / Parquet).
+- CSV: satırlar parça parça (chunk) üretilir; büyük veride bellek sabit kalır
+- Parquet: sütun tipleri şemada açıkça belirlenir (kimlik=string, miktar=float64,
+  adet=int64, tarih=datetime64)
+- Veri setleri: rapor satırları (daily_data.json), üye listesi (members.json),
+  CashBack geçmişi (CashBack.json); dosyalar doğrudan serializer şemalarına çözülür
+- Komut satırı:
+    python data_export.py members --format parquet -o uyeler.parquet
+    python data_export.py report --start 2025-08-01 --end 2025-08-31 -o rapor.csv
+"""
+import argparse
+import csv
+import importlib.util
+import io
+import json
+import os
+import sys
+from datetime import date, datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import member_model
+import serializer
+
+DAILY_DATA_FILE = "daily_data.json"
+MEMBERS_FILE = "members.json"
+CASHBACK_FILE = "CashBack.json"
+
+DEFAULT_CHUNK_SIZE = 10000
+
+PARQUET_AVAILABLE = any(importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet"))
+
+# (sütun adı, pandas dtype)
+REPORT_SCHEMA = [
+    ("date", "datetime64[ns]"),
+    ("btag", "string"),
+    ("member_id", "string"),
+    ("username", "string"),
+    ("customer_name", "string"),
+    ("deposit_count", "int64"),
+    ("total_deposits", "float64"),
+    ("withdrawal_count", "int64"),
+    ("total_withdrawals", "float64"),
+    ("net", "float64"),
+]
+
+MEMBER_SCHEMA = [
+    ("member_id", "string"),
+    ("username", "string"),
+    ("full_name", "string"),
+    ("is_active", "bool"),
+    ("created_at", "datetime64[ns]"),
+    ("registration_date", "datetime64[ns]"),
+    ("last_deposit_date", "datetime64[ns]"),
+    ("days_without_deposit", "int64"),
+    ("balance", "float64"),
+    ("currency", "string"),
+    ("total_deposits", "float64"),
+    ("total_withdrawals", "float64"),
+    ("deposit_count", "int64"),
+    ("withdrawal_count", "int64"),
+    ("partner_name", "string"),
+    ("last_kpi_update", "datetime64[ns]"),
+]
+
+CASHBACK_SCHEMA = [
+    ("date", "datetime64[ns]"),
+    ("customer_id", "int64"),
+    ("customer_name", "string"),
+    ("count", "int64"),
+    ("amount", "float64"),
+]
+
+DATASETS = {
+    "report": REPORT_SCHEMA,
+    "members": MEMBER_SCHEMA,
+    "cashback": CASHBACK_SCHEMA,
+}
+
+MIME_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _typed(records, tp):
+    """dict kayıtları şemaya çevir; zaten şema nesnesiyse olduğu gibi bırak"""
+    records = records or []
+    if records and isinstance(records[0], dict):
+        return serializer.convert(records, List[tp])
+    return records
+
+
+def _in_range(date_str: str, start: Optional[date], end: Optional[date]) -> bool:
+    if start is None and end is None:
+        return True
+    try:
+        day = datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return False
+    if start is not None and day < start:
+        return False
+    if end is not None and day > end:
+        return False
+    return True
+
+
+def iter_report_rows(daily_data: dict, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[tuple]:
+    """daily_data içeriğini (tarih, btag, üye...) satırlarına düzleştir"""
+    for date_str in sorted(daily_data):
+        if not _in_range(date_str, start, end):
+            continue
+        for btag, records in daily_data[date_str].items():
+            for record in _typed(records, serializer.DailyRecord):
+                deposits = float(record.total_deposits or 0)
+                withdrawals = float(record.total_withdrawals or 0)
+                yield (
+                    date_str,
+                    btag,
+                    record.member_id,
+                    record.username,
+                    record.customer_name,
+                    int(record.deposit_count or 0),
+                    deposits,
+                    int(record.withdrawal_count or 0),
+                    withdrawals,
+                    deposits - withdrawals,
+                )
+
+
+def iter_member_rows(members: list) -> Iterator[tuple]:
+    """Üye listesini (dict ya da member_model.Member) şemadaki sütunlara düzleştir"""
+    for member in _typed(members, member_model.Member):
+        yield (
+            member.member_id,
+            member.username,
+            member.full_name,
+            bool(member.is_active),
+            member.created_at or "",
+            member.registration_date or "",
+            member.last_deposit_date or "",
+            int(member.days_without_deposit or 0),
+            float(member.balance or 0),
+            member.currency or "TRY",
+            float(member.total_deposits or 0),
+            float(member.total_withdrawals or 0),
+            int(member.deposit_count or 0),
+            int(member.withdrawal_count or 0),
+            member.partner_name or "",
+            member.last_kpi_update or "",
+        )
+
+
+def iter_cashback_rows(history: list, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[tuple]:
+    """CashBack geçmişini (dict ya da serializer.CashbackEntry) tarih, müşteri... satırlarına düzleştir"""
+    for entry in _typed(history, serializer.CashbackEntry):
+        date_str = entry.date.split("_")[0]
+        if not _in_range(date_str, start, end):
+            continue
+        for record in entry.data:
+            yield (
+                date_str,
+                record.customer_id,
+                record.customer_name,
+                int(record.count or 0),
+                float(record.amount or 0),
+            )
+
+
+def iter_dataset_rows(dataset: str, start: Optional[date] = None, end: Optional[date] = None,
+                      base_dir: str = ".") -> Iterator[tuple]:
+    """Veri setini kaynak dosyasından okuyup satır satır döndür"""
+    if dataset == "report":
+        daily_data = serializer.load_typed(os.path.join(base_dir, DAILY_DATA_FILE), serializer.DailyData, {})
+        return iter_report_rows(daily_data, start, end)
+    if dataset == "members":
+        return iter_member_rows(serializer.load_typed(os.path.join(base_dir, MEMBERS_FILE), member_model.MemberList, []))
+    if dataset == "cashback":
+        history = serializer.load_typed(os.path.join(base_dir, CASHBACK_FILE), serializer.CashbackHistory, [])
+        return iter_cashback_rows(history, start, end)
+    raise ValueError(f"Bilinmeyen veri seti: {dataset}")
+
+
+def iter_csv_chunks(rows: Iterable[tuple], schema, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Satırları başlık + chunk_size satırlık UTF-8 CSV parçaları olarak üret"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow([name for name, _ in schema])
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    remaining = buffer.getvalue()
+    if remaining:
+        yield remaining.encode("utf-8")
+
+
+def write_csv(rows: Iterable[tuple], schema, target, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """CSV'yi dosya yoluna ya da binary dosya nesnesine parça parça yaz, yazılan byte sayısını döndür"""
+    written = 0
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as f:
+            return write_csv(rows, schema, f, chunk_size)
+    for chunk in iter_csv_chunks(rows, schema, chunk_size):
+        target.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def to_frame(rows: Iterable[tuple], schema):
+    """Satırlardan şemadaki tiplere sahip DataFrame oluştur"""
+    import pandas as pd
+
+    df = pd.DataFrame.from_records(list(rows), columns=[name for name, _ in schema])
+    for name, dtype in schema:
+        if dtype.startswith("datetime"):
+            df[name] = pd.to_datetime(df[name], format="ISO8601", errors="coerce")
+        elif dtype in ("int64", "float64"):
+            df[name] = pd.to_numeric(df[name], errors="coerce").fillna(0).astype(dtype)
+        else:
+            df[name] = df[name].astype(dtype)
+    return df
+
+
+def write_parquet(rows: Iterable[tuple], schema, target):
+    """Satırları tipli Parquet dosyasına yaz (pyarrow ya da fastparquet gerekir)"""
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("Parquet için 'pyarrow' paketi kurulu olmalı.")
+    to_frame(rows, schema).to_parquet(target, index=False)
+
+
+def export_bytes(dataset: str, file_format: str, start: Optional[date] = None, end: Optional[date] = None,
+                 rows: Optional[Iterable[tuple]] = None, base_dir: str = ".") -> bytes:
+    """Veri setini CSV ya da Parquet olarak byte olarak üret (UI indirme butonları için)"""
+    schema = DATASETS[dataset]
+    if rows is None:
+        rows = iter_dataset_rows(dataset, start, end, base_dir)
+
+    output = io.BytesIO()
+    if file_format == "csv":
+        write_csv(rows, schema, output)
+    elif file_format == "parquet":
+        write_parquet(rows, schema, output)
+    else:
+        raise ValueError(f"Desteklenmeyen format: {file_format}")
+    return output.getvalue()
+
+
+def export_file(dataset: str, file_format: str, path: str, start: Optional[date] = None,
+                end: Optional[date] = None, base_dir: str = ".") -> Tuple[str, int]:
+    """Veri setini doğrudan dosyaya yaz, (yol, byte) döndür"""
+    schema = DATASETS[dataset]
+    rows = iter_dataset_rows(dataset, start, end, base_dir)
+    if file_format == "csv":
+        write_csv(rows, schema, path)
+    elif file_format == "parquet":
+        write_parquet(rows, schema, path)
+    else:
+        raise ValueError(f"Desteklenmeyen format: {file_format}")
+    return path, os.path.getsize(path)
+
+
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Ham veriyi CSV/Parquet olarak dışa aktar")
+    parser.add_argument("dataset", choices=sorted(DATASETS))
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--start", type=_parse_date, help="YYYY-MM-DD")
+    parser.add_argument("--end", type=_parse_date, help="YYYY-MM-DD")
+    parser.add_argument("--data-dir", default=".", help="JSON dosyalarının bulunduğu klasör")
+    parser.add_argument("-o", "--output", help="Çıktı dosyası (varsayılan: stdout, sadece CSV)")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        path, size = export_file(args.dataset, args.format, args.output, args.start, args.end, args.data_dir)
+        print(json.dumps({"dataset": args.dataset, "format": args.format, "path": path, "bytes": size}))
+        return 0
+
+    if args.format != "csv":
+        parser.error("Parquet çıktısı için --output gerekli")
+    rows = iter_dataset_rows(args.dataset, args.start, args.end, args.data_dir)
+    write_csv(rows, DATASETS[args.dataset], sys.stdout.buffer)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Events: İş mantığındaki hata / uyarı / ilerleme bildirimleri için geri çağırma katmanı.
+- Reporter: temel sınıf; olayları emit() ile iletir, varsayılanı sessizdir
+- CallbackReporter: her olayı verilen fonksiyona iletir (worker, test, toplama)
+- JsonLinesReporter: her olayı tek satır JSON olarak yazar (CLI / cron)
+- QueueReporter + drain_events: thread / process havuzundaki worker'ların olaylarını
+  kuyruk üzerinden ana sürece (örn. Streamlit) taşır
+Olay biçimi: {"level": "error|warning|info|success|progress", "message": str, ...}
+Streamlit adaptörü streamlit_reporter.py içindedir; bu modül streamlit import etmez.
+"""
+import json
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+
+class Reporter:
+    """Sessiz varsayılan raporlayıcı; alt sınıflar emit() metodunu ezer"""
+
+    def emit(self, event: dict):
+        pass
+
+    def _send(self, level: str, message: str, fields: dict):
+        event = {"level": level, "message": message}
+        event.update(fields)
+        self.emit(event)
+
+    def error(self, message: str, **fields):
+        self._send("error", message, fields)
+
+    def warning(self, message: str, **fields):
+        self._send("warning", message, fields)
+
+    def info(self, message: str, **fields):
+        self._send("info", message, fields)
+
+    def success(self, message: str, **fields):
+        self._send("success", message, fields)
+
+    def progress(self, done: int, total: int, message: str = "", **fields):
+        """İlerleme bildir (done/total)"""
+        fields.update({"done": done, "total": total})
+        self._send("progress", message, fields)
+
+    def progress_done(self):
+        """İlerleme göstergesini kapat"""
+        pass
+
+    @contextmanager
+    def spinner(self, message: str):
+        """Uzun süren bir işlemin başlangıcını ve bitişini bildir"""
+        self.info(message, phase="start")
+        try:
+            yield
+        finally:
+            self.info(message, phase="end")
+
+
+class CallbackReporter(Reporter):
+    """Olayları verilen fonksiyona ileten raporlayıcı"""
+
+    def __init__(self, callback: Callable[[dict], None]):
+        self.callback = callback
+
+    def emit(self, event: dict):
+        self.callback(event)
+
+
+class JsonLinesReporter(Reporter):
+    """Her olayı zaman damgasıyla tek satır JSON olarak yazan raporlayıcı"""
+
+    def __init__(self, stream=None, min_progress_interval: float = 0.0):
+        self.stream = stream or sys.stdout
+        self.min_progress_interval = min_progress_interval
+        self._last_progress = 0.0
+        self._lock = threading.Lock()
+
+    def emit(self, event: dict):
+        payload = {"ts": time.time()}
+        payload.update(event)
+        line = json.dumps(payload, ensure_ascii=False, default=str) + "\n"
+
+        # Birden fazla thread aynı anda yazarsa satırlar karışmasın
+        with self._lock:
+            if event.get("level") == "progress" and self.min_progress_interval:
+                now = time.monotonic()
+                is_last = event.get("done") == event.get("total")
+                if not is_last and now - self._last_progress < self.min_progress_interval:
+                    return
+                self._last_progress = now
+            self.stream.write(line)
+            self.stream.flush()
+
+
+class CollectingReporter(Reporter):
+    """Olayları listede biriktiren raporlayıcı (sonradan toplu gösterim için)"""
+
+    def __init__(self, forward: Optional[Reporter] = None):
+        self.events = []
+        self.forward = forward
+
+    def emit(self, event: dict):
+        self.events.append(event)
+        if self.forward is not None:
+            self.forward.emit(event)
+
+    def messages(self, level: str):
+        return [e["message"] for e in self.events if e.get("level") == level]
+
+
+class QueueReporter(Reporter):
+    """Olayları kuyruğa koyan raporlayıcı.
+
+    queue.Queue ile thread'lerde, multiprocessing.Manager().Queue() ile process
+    havuzunda kullanılabilir (pickle edilebilir). Olaylar ana süreçte
+    drain_events ile asıl raporlayıcıya aktarılır.
+    """
+
+    def __init__(self, event_queue, source: Optional[str] = None):
+        self.queue = event_queue
+        self.source = source
+
+    def emit(self, event: dict):
+        if self.source is not None:
+            event = dict(event, source=self.source)
+        self.queue.put(event)
+
+
+def drain_events(event_queue, reporter: Reporter, timeout: float = 0.0) -> int:
+    """Kuyruktaki olayları raporlayıcıya aktar, aktarılan olay sayısını döndür.
+
+    timeout > 0 ise ilk olay için en fazla timeout saniye beklenir.
+    """
+    count = 0
+    block = timeout > 0
+    while True:
+        try:
+            event = event_queue.get(block=block, timeout=timeout if block else None)
+        except queue.Empty:
+            return count
+        reporter.emit(event)
+        count += 1
+        block = False
+
+
+NULL_REPORTER = Reporter()
@@ -0,0 +1,321 @@
+"""
+ExcelExport: Akış (write-only) modunda biçimli Excel çıktısı üretir.
+- openpyxl write_only çalışma kitabı: satırlar bellekte tutulmadan diske/bellek akışına yazılır
+- Yazı tipi, dolgu, kenarlık, hizalama ve sayı formatı hücre başına değil,
+  bir kez NamedStyle olarak tanımlanır; hücreler çözümlenmiş stili paylaşır
+- CashBack analizi ve tarihsel analiz raporları için hazır şablonlar
+- BTag raporu (Özet / Günlük Detay / Üye Bazında) için pandas tabanlı çıktı
+"""
+from io import BytesIO
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import openpyxl
+from openpyxl.cell import Cell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.worksheet.cell_range import CellRange
+
+CURRENCY_FORMAT = '₺#,##0.00'
+INTEGER_FORMAT = '#,##0'
+
+CENTER = Alignment(horizontal='center', vertical='center')
+
+
+def _fill(color: str) -> PatternFill:
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+def _border(style: str) -> Border:
+    side = Side(style=style)
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
+def _style(name: str, font: Font, fill: Optional[PatternFill] = None, border: Optional[Border] = None,
+           alignment: Alignment = CENTER, number_format: Optional[str] = None) -> NamedStyle:
+    style = NamedStyle(name=name)
+    style.font = font
+    style.alignment = alignment
+    if fill is not None:
+        style.fill = fill
+    if border is not None:
+        style.border = border
+    if number_format:
+        style.number_format = number_format
+    return style
+
+
+class StreamingExcelWriter:
+    """Tek sayfalık write-only çalışma kitabına satır satır yazan yardımcı.
+
+    Sütun genişlikleri ve dondurulan bölme ilk satır yazılmadan önce
+    ayarlanmalıdır (write-only sayfada başlık kısmı ilk satırla birlikte yazılır).
+    """
+
+    def __init__(self, sheet_title: str, styles: Iterable[NamedStyle] = ()):
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(sheet_title)
+        self.row_count = 0
+        # Her NamedStyle bir kez çözümlenir; hücreler aynı stil dizisini paylaşır
+        self._style_arrays = {}
+        for style in styles:
+            self.workbook.add_named_style(style)
+            template = Cell(self.sheet, row=1, column=1)
+            template.style = style.name
+            self._style_arrays[style.name] = template._style
+
+    def set_column_widths(self, widths: Dict[str, float]):
+        """Sütun genişliklerini ayarla (örn: {'A': 15, 'B': 30})"""
+        for column, width in widths.items():
+            self.sheet.column_dimensions[column].width = width
+
+    def freeze(self, cell_ref: str):
+        """Verilen hücrenin üstünü ve solunu dondur"""
+        self.sheet.freeze_panes = cell_ref
+
+    def merge(self, cell_range: str):
+        """Hücre aralığını birleştir"""
+        self.sheet.merged_cells.add(CellRange(cell_range))
+
+    def set_auto_filter(self, cell_range: str):
+        """Aralık için AutoFilter ekle"""
+        self.sheet.auto_filter.ref = cell_range
+
+    def write_row(self, values: Sequence, styles=None):
+        """Bir satır yaz.
+
+        styles: tek bir stil adı (tüm hücrelere) ya da her sütun için stil adı listesi.
+        None olan stil adlarında hücre stilsiz yazılır.
+        """
+        if styles is None:
+            self.sheet.append(list(values))
+        else:
+            if isinstance(styles, str):
+                styles = [styles] * len(values)
+            row = []
+            for value, style_name in zip(values, styles):
+                if style_name is None:
+                    row.append(value)
+                    continue
+                row.append(Cell(self.sheet, row=1, column=1, value=value,
+                                style_array=self._style_arrays[style_name]))
+            self.sheet.append(row)
+        self.row_count += 1
+        return self.row_count
+
+    def write_blank_row(self):
+        """Boş satır yaz"""
+        return self.write_row([])
+
+    def to_bytes(self) -> bytes:
+        """Çalışma kitabını kapatıp içeriğini byte olarak döndür"""
+        output = BytesIO()
+        self.workbook.save(output)
+        return output.getvalue()
+
+
+# CashBack analizi (create_formatted_excel) stilleri
+CASHBACK_HEADER = 'cb_header'
+CASHBACK_ROW_EVEN = 'cb_row_even'
+CASHBACK_ROW_ODD = 'cb_row_odd'
+CASHBACK_MONEY_EVEN = 'cb_money_even'
+CASHBACK_MONEY_ODD = 'cb_money_odd'
+
+CASHBACK_HEADERS = ['Müşteri Kimliği', 'Müşteri Adı', 'İşlem Adedi', 'Toplam Miktar (₺)']
+
+
+def _cashback_styles() -> List[NamedStyle]:
+    border = _border('thin')
+    data_font = Font(color="000000")
+    even_fill = _fill("F2F2F2")
+    odd_fill = _fill("FFFFFF")
+    return [
+        _style(CASHBACK_HEADER, Font(bold=True, color="FFFFFF"), _fill("366092"), border),
+        _style(CASHBACK_ROW_EVEN, data_font, even_fill, border),
+        _style(CASHBACK_ROW_ODD, data_font, odd_fill, border),
+        _style(CASHBACK_MONEY_EVEN, data_font, even_fill, border, number_format=CURRENCY_FORMAT),
+        _style(CASHBACK_MONEY_ODD, data_font, odd_fill, border, number_format=CURRENCY_FORMAT),
+    ]
+
+
+def _cashback_values(row) -> list:
+    customer_id, customer_name, count, amount = row
+    return [int(customer_id), customer_name, int(count), float(amount)]
+
+
+def build_cashback_workbook(df) -> bytes:
+    """CashBack analizi DataFrame'inden formatlı Excel üret.
+
+    df: Müşteri_Kimliği, Müşteri_Adı, Adet, Toplam_Miktar sütunlarını içeren DataFrame
+    """
+    writer = StreamingExcelWriter("CashBack Analizi", _cashback_styles())
+    writer.set_column_widths({'A': 15, 'B': 30, 'C': 15, 'D': 20})
+    writer.freeze("A2")
+
+    writer.write_row(CASHBACK_HEADERS, CASHBACK_HEADER)
+
+    even_styles = [CASHBACK_ROW_EVEN] * 3 + [CASHBACK_MONEY_EVEN]
+    odd_styles = [CASHBACK_ROW_ODD] * 3 + [CASHBACK_MONEY_ODD]
+
+    columns = ['Müşteri_Kimliği', 'Müşteri_Adı', 'Adet', 'Toplam_Miktar']
+    for row in df[columns].itertuples(index=False, name=None):
+        # Excel satır numarası çiftse gri, tekse beyaz
+        next_row = writer.row_count + 1
+        writer.write_row(_cashback_values(row), even_styles if next_row % 2 == 0 else odd_styles)
+
+    writer.set_auto_filter(f"A1:D{len(df) + 1}")
+    return writer.to_bytes()
+
+
+# Tarihsel analiz (create_historical_analysis_excel) stilleri
+HISTORICAL_TITLE = 'hist_title'
+HISTORICAL_SECTION = 'hist_section'
+HISTORICAL_DATA_TITLE = 'hist_data_title'
+HISTORICAL_HEADER = 'hist_header'
+HISTORICAL_STAT_LABEL = 'hist_stat_label'
+HISTORICAL_STAT_VALUE = 'hist_stat_value'
+
+HISTORICAL_HEADERS = ['Sıra', 'Müşteri Kimliği', 'Müşteri Adı', 'İşlem Adedi', 'Toplam Miktar (₺)']
+
+# Sıralamaya göre renk bandı: (üst sınır oranı, dolgu rengi, yazı rengi)
+HISTORICAL_BANDS = [
+    ('top', 0.2, "d5e8d4", "2d5016"),   # En yüksek %20 - açık yeşil
+    ('mid', 0.5, "fff2cc", "7f6000"),   # Orta %30 - açık sarı
+    ('low', None, "f8cecc", "b85450"),  # Alt %50 - açık kırmızı
+]
+
+# Veri sütunlarının sayı formatları (Sıra, Kimlik, Ad, Adet, Miktar)
+HISTORICAL_COLUMN_FORMATS = [
+    ('int', INTEGER_FORMAT),
+    ('int', INTEGER_FORMAT),
+    ('text', None),
+    ('int', INTEGER_FORMAT),
+    ('money', CURRENCY_FORMAT),
+]
+
+
+def _historical_band_style(band: str, kind: str) -> str:
+    return f'hist_{band}_{kind}'
+
+
+def _historical_styles() -> List[NamedStyle]:
+    styles = [
+        _style(HISTORICAL_TITLE, Font(bold=True, size=16, color="FFFFFF"), _fill("1f4e79")),
+        _style(HISTORICAL_SECTION, Font(bold=True, size=12, color="FFFFFF"), _fill("2e75b6")),
+        _style(HISTORICAL_DATA_TITLE, Font(bold=True, size=12, color="FFFFFF"), _fill("70ad47")),
+        _style(HISTORICAL_HEADER, Font(bold=True, color="FFFFFF", size=11), _fill("548235"), _border('medium')),
+        _style(HISTORICAL_STAT_LABEL, Font(bold=True, color="2e75b6"),
+               alignment=Alignment(horizontal='right', vertical='center')),
+        _style(HISTORICAL_STAT_VALUE, Font(bold=True, color="c55a11"),
+               alignment=Alignment(horizontal='left', vertical='center')),
+    ]
+    border = _border('thin')
+    for band, _, fill_color, font_color in HISTORICAL_BANDS:
+        for kind, number_format in {kind: fmt for kind, fmt in HISTORICAL_COLUMN_FORMATS}.items():
+            styles.append(_style(
+                _historical_band_style(band, kind),
+                Font(color=font_color, size=10),
+                _fill(fill_color),
+                border,
+                number_format=number_format
+            ))
+    return styles
+
+
+def _historical_band_styles(total_rows: int) -> List[tuple]:
+    """Her bant için (satır üst sınırı, sütun stilleri) listesi"""
+    result = []
+    for band, ratio, _, _ in HISTORICAL_BANDS:
+        limit = total_rows * ratio if ratio is not None else float('inf')
+        result.append((limit, [_historical_band_style(band, kind) for kind, _ in HISTORICAL_COLUMN_FORMATS]))
+    return result
+
+
+def build_historical_workbook(df, date_range) -> bytes:
+    """Tarihsel analiz DataFrame'inden renkli Excel üret.
+
+    df: Toplam_Miktar'a göre azalan sıralı, Müşteri_Kimliği, Müşteri_Adı, Adet,
+        Toplam_Miktar sütunlarını içeren DataFrame
+    date_range: (başlangıç, bitiş) tarihleri
+    """
+    writer = StreamingExcelWriter("Tarihsel CashBack Analizi", _historical_styles())
+
+    data_start_row = 10
+    header_row = data_start_row + 1
+
+    writer.set_column_widths({'A': 8, 'B': 18, 'C': 35, 'D': 15, 'E': 20})
+    writer.freeze(f"A{header_row + 1}")
+    writer.sheet.page_setup.orientation = 'landscape'
+    writer.sheet.page_setup.fitToWidth = 1
+    writer.sheet.page_setup.fitToHeight = 0
+
+    start_date = date_range[0].strftime('%d.%m.%Y')
+    end_date = date_range[1].strftime('%d.%m.%Y')
+
+    # Ana başlık (A1-E2 birleştir)
+    writer.write_row([f"CashBack Analizi ({start_date} - {end_date})"], [HISTORICAL_TITLE])
+    writer.merge('A1:E2')
+    writer.write_blank_row()
+    writer.write_blank_row()
+
+    # Özet istatistikler (4. satır)
+    writer.write_row(["📊 ÖZET İSTATİSTİKLER"], [HISTORICAL_SECTION])
+    writer.merge('A4:E4')
+
+    total_customers = len(df)
+    total_amount = df['Toplam_Miktar'].sum() if not df.empty else 0
+    total_transactions = df['Adet'].sum() if not df.empty else 0
+    avg_per_customer = total_amount / total_customers if total_customers > 0 else 0
+
+    stats = [
+        ['Toplam Müşteri:', f'{total_customers:,}'],
+        ['Toplam Miktar:', f'₺{total_amount:,.2f}'],
+        ['Toplam İşlem:', f'{total_transactions:,}'],
+        ['Müşteri Başına Ort.:', f'₺{avg_per_customer:,.2f}']
+    ]
+    for label, value in stats:
+        writer.write_row([None, label, value], [None, HISTORICAL_STAT_LABEL, HISTORICAL_STAT_VALUE])
+    writer.write_blank_row()
+
+    # Veri tablosu başlığı
+    writer.write_row(["📋 DETAYLI MÜŞTERI ANALİZİ"], [HISTORICAL_DATA_TITLE])
+    writer.merge(f'A{data_start_row}:E{data_start_row}')
+    writer.write_row(HISTORICAL_HEADERS, HISTORICAL_HEADER)
+
+    # Veri satırları - renk bandı sıralamaya göre seçilir
+    if not df.empty:
+        bands = _historical_band_styles(total_customers)
+        band_index = 0
+        columns = ['Müşteri_Kimliği', 'Müşteri_Adı', 'Adet', 'Toplam_Miktar']
+        for idx, row in enumerate(df[columns].itertuples(index=False, name=None)):
+            while idx >= bands[band_index][0]:
+                band_index += 1
+            writer.write_row([idx + 1] + _cashback_values(row), bands[band_index][1])
+
+        writer.set_auto_filter(f"A{header_row}:E{header_row + total_customers}")
+
+    return writer.to_bytes()
+
+
+def build_report_workbook(report: dict, member_rows: List[dict]) -> bytes:
+    """BTag raporu: Özet, Günlük Detay ve Üye Bazında sayfaları.
+
+    report: analytics.build_report çıktısı
+    member_rows: analytics.member_report_rows çıktısı
+    """
+    import pandas as pd
+
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        summary_data = {
+            'Metrik': ['Toplam Gün', 'Toplam Yatırım', 'Toplam Çekim', 'Net Kar/Zarar'],
+            'Değer': [
+                report['total_days'],
+                f"{report['total_deposits']:,.0f} TL",
+                f"{report['total_withdrawals']:,.0f} TL",
+                f"{report['total_net']:,.0f} TL"
+            ]
+        }
+        pd.DataFrame(summary_data).to_excel(writer, sheet_name='Özet', index=False)
+        pd.DataFrame(report['rows']).to_excel(writer, sheet_name='Günlük Detay', index=False)
+        pd.DataFrame(member_rows).to_excel(writer, sheet_name='Üye Bazında', index=False)
+
+    return output.getvalue()
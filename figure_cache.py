@@ -0,0 +1,139 @@
+"""
+Figure Cache: Grafik oluşturucuların süreç içi önbelleği (rerun'lar ve oturumlar arasında ortak).
+- anahtar: oluşturucu adı + girdilerin (grafik özetleri ve parametreler) kararlı sha1 hash'i;
+  DataFrame'ler pandas satır hash'iyle, diğer değerler anahtarları sıralı JSON ile hash'lenir.
+  Varsayılan değerler anahtara eklenir: f(x) ile f(x, title=<varsayılan>) aynı grafiktir
+- cached(name): grafik oluşturan metotlar için dekoratör (self anahtara girmez; oluşturucular
+  örnek durumuna bağlı olmamalı)
+- boyut: Figure'ün JSON uzunluğu; toplam max_bytes aşılınca en uzun süredir kullanılmayan grafikler
+  atılır (LRU). max_bytes / 4'ten büyük tek grafik saklanmaz
+- None ve izi olmayan Figure'ler (hata / "veri yok" grafikleri) saklanmaz: st.error mesajı her
+  rerun'da yeniden gösterilir
+- Dönen Figure tüm oturumlarca paylaşılır; çağıran değiştirmemeli (gerekirse go.Figure(fig) ile kopyalar)
+- isabet / ıskalar metrics'e (btag_figure_cache_requests_total) yazılır
+"""
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import metrics
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB (Figure JSON uzunluğu)
+
+
+def _feed(digest, value):
+    """value'yu digest'e kararlı biçimde ekle"""
+    import pandas as pd
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        columns = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        digest.update(f"{type(value).__name__}:{len(value)}:".encode("utf-8"))
+        digest.update(json.dumps([str(c) for c in columns], ensure_ascii=False).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        return
+    try:
+        text = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    except TypeError:
+        text = repr(value)  # Karışık tipli sözlük anahtarları sıralanamaz
+    digest.update(text.encode("utf-8"))
+
+
+def make_key(name: str, arguments: dict) -> str:
+    """Oluşturucu adı ve argümanlarından önbellek anahtarı üret"""
+    digest = hashlib.sha1(name.encode("utf-8"))
+    for argument in sorted(arguments):
+        digest.update(f"|{argument}=".encode("utf-8"))
+        _feed(digest, arguments[argument])
+    return f"{name}_{digest.hexdigest()[:24]}"
+
+
+class FigureCache:
+    """Plotly Figure'leri için boyut sınırlı bellek içi LRU önbellek"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # anahtar → (Figure, boyut)
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Önbellekteki Figure'ü döndür, yoksa None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, fig) -> bool:
+        """Figure'ü sakla ve gerekirse en eski grafikleri at; saklanmadıysa False"""
+        if fig is None or not getattr(fig, "data", None):
+            return False
+        try:
+            size = len(fig.to_json())
+        except Exception:
+            return False
+        if size > self.max_bytes // 4:
+            return False
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (fig, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache = FigureCache()
+
+
+def get_cache() -> FigureCache:
+    """Süreç genelindeki önbellek"""
+    return _default_cache
+
+
+def cached(name: str, cache: Optional[FigureCache] = None):
+    """Grafik oluşturan metodu girdilerinin hash'iyle önbelleğe alan dekoratör"""
+
+    def decorator(builder):
+        signature = inspect.signature(builder)
+
+        @functools.wraps(builder)
+        def wrapper(self, *args, **kwargs):
+            store = cache or _default_cache
+            try:
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                arguments = dict(bound.arguments)
+                arguments.pop(next(iter(signature.parameters)))  # self
+                key = make_key(name, arguments)
+            except Exception:
+                return builder(self, *args, **kwargs)  # Hash'lenemeyen girdi: önbelleksiz
+
+            fig = store.get(key)
+            metrics.record_figure_cache(name, fig is not None)
+            if fig is not None:
+                return fig
+            fig = builder(self, *args, **kwargs)
+            store.put(key, fig)
+            return fig
+
+        return wrapper
+
+    return decorator
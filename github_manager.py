@@ -4,20 +4,26 @@ GitHubManager
 - Repo'dan dosya okuma
 - Repo'ya dosya güncelleme / oluşturma
 - Basit bağlantı testi
+- API adresi ENV GITHUB_API_BASE ya da api_base parametresi ile değiştirilebilir
 NOT: Token güvenliği için token'ı doğrudan bu dosyaya koyma. Token'ı
 TokenManager/streamlit st.secrets veya ENV üzerinden geçir.
 """
 import base64
 import json
+import os
 import requests
 from typing import Optional
 
+# Yerel test / benchmark için farklı bir API adresi verilebilir (örn. benchmarks.mock_github)
+GITHUB_API_BASE = os.environ.get("GITHUB_API_BASE", "https://api.github.com")
+
 class GitHubManager:
-    def __init__(self, owner: str, repo: str, token: Optional[str] = None, branch: str = "main"):
+    def __init__(self, owner: str, repo: str, token: Optional[str] = None, branch: str = "main",
+                 api_base: Optional[str] = None):
         self.owner = owner
         self.repo = repo
         self.branch = branch
-        self.api_base = "https://api.github.com"
+        self.api_base = (api_base or GITHUB_API_BASE).rstrip("/")
         self.token = None
         self.headers = {"Accept": "application/vnd.github.v3+json"}
         if token:
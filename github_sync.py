@@ -1,179 +1,175 @@
-import streamlit as st
-import json
-import os
-from datetime import datetime
-
-# GitHub kütüphanesini opsiyonel olarak import et
-try:
-    from github import Github
-    GITHUB_AVAILABLE = True
-except ImportError:
-    GITHUB_AVAILABLE = False
-    # Import sırasında uyarı gösterme - sadece kullanım sırasında göster
-
-class GitHubSync:
-    """GitHub ile otomatik senkronizasyon sınıfı"""
-    
-    def __init__(self):
-        # Token'ı sadece Streamlit secrets'dan al - kodda token yok!
-        try:
-            self.token = st.secrets.get('GITHUB_TOKEN', None)
-        except:
-            self.token = None
-        self.repo_name = "Saxblue/newsoldier"
-        self.branch = "main"
-        
-        if not GITHUB_AVAILABLE:
-            # PyGithub kütüphanesi mevcut değil - sessizce devre dışı bırak
-            self.sync_enabled = False
-            return
-        
-        try:
-            self.github = Github(self.token)
-            self.repo = self.github.get_repo(self.repo_name)
-            self.sync_enabled = True
-        except Exception as e:
-            # GitHub bağlantı hatası - sessizce devre dışı bırak
-            self.sync_enabled = False
-    
-
-    def upload_file(self, file_path, content, commit_message=None):
-        """Dosyayı GitHub'a yükle veya güncelle"""
-        if not self.sync_enabled:
-            return False
-            
-        try:
-            if commit_message is None:
-                commit_message = f"Auto-update {file_path} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            
-            # Dosya içeriğini base64'e çevir
-            if isinstance(content, str):
-                content_bytes = content.encode('utf-8')
-            else:
-                content_bytes = content
-            
-            try:
-                # Dosya varsa güncelle
-                file = self.repo.get_contents(file_path, ref=self.branch)
-                self.repo.update_file(
-                    path=file_path,
-                    message=commit_message,
-                    content=content_bytes,
-                    sha=file.sha,
-                    branch=self.branch
-                )
-                return True
-            except:
-                # Dosya yoksa oluştur
-                self.repo.create_file(
-                    path=file_path,
-                    message=commit_message,
-                    content=content_bytes,
-                    branch=self.branch
-                )
-                return True
-                
-        except Exception as e:
-            st.error(f"GitHub yükleme hatası: {str(e)}")
-            return False
-    
-    def sync_json_file(self, local_file_path, github_file_path=None):
-        """JSON dosyasını GitHub'a senkronize et"""
-        if github_file_path is None:
-            github_file_path = os.path.basename(local_file_path)
-        
-        try:
-            with open(local_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            success = self.upload_file(
-                github_file_path, 
-                content, 
-                f"Update {github_file_path} data"
-            )
-            
-            if success:
-                st.success(f"✅ {github_file_path} GitHub'a yüklendi!")
-                return True
-            else:
-                st.error(f"❌ {github_file_path} yüklenemedi!")
-                return False
-                
-        except Exception as e:
-            st.error(f"Dosya okuma hatası: {str(e)}")
-            return False
-    
-    def sync_python_file(self, local_file_path, github_file_path=None):
-        """Python dosyasını GitHub'a senkronize et"""
-        if github_file_path is None:
-            github_file_path = os.path.basename(local_file_path)
-        
-        try:
-            with open(local_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            success = self.upload_file(
-                github_file_path, 
-                content, 
-                f"Update {github_file_path} application code"
-            )
-            
-            if success:
-                st.success(f"✅ {github_file_path} GitHub'a yüklendi!")
-                return True
-            else:
-                st.error(f"❌ {github_file_path} yüklenemedi!")
-                return False
-                
-        except Exception as e:
-            st.error(f"Dosya okuma hatası: {str(e)}")
-            return False
-    
-    def sync_all_files(self):
-        """Tüm dosyaları GitHub'a senkronize et"""
-        files_to_sync = [
-            ("btag.py", "btag_affiliate_system.py", "python"),
-            ("daily_data.json", "daily_data.json", "json"),
-            ("members.json", "members.json", "json"),
-            ("token.json", "token.json", "json")
-        ]
-        
-        success_count = 0
-        total_files = len(files_to_sync)
-        
-        with st.spinner("GitHub'a senkronize ediliyor..."):
-            for local_file, github_file, file_type in files_to_sync:
-                if os.path.exists(local_file):
-                    if file_type == "python":
-                        if self.sync_python_file(local_file, github_file):
-                            success_count += 1
-                    else:
-                        if self.sync_json_file(local_file, github_file):
-                            success_count += 1
-                else:
-                    st.warning(f"⚠️ {local_file} dosyası bulunamadı!")
-        
-        if success_count == total_files:
-            st.balloons()
-            st.success(f"🎉 Tüm dosyalar ({success_count}/{total_files}) başarıyla GitHub'a yüklendi!")
-        else:
-            st.warning(f"⚠️ {success_count}/{total_files} dosya yüklendi.")
-        
-        return success_count == total_files
-    
-    def get_repo_info(self):
-        """Repository bilgilerini getir"""
-        if not self.sync_enabled:
-            return None
-            
-        try:
-            return {
-                "name": self.repo.name,
-                "full_name": self.repo.full_name,
-                "url": self.repo.html_url,
-                "last_push": self.repo.pushed_at.strftime('%Y-%m-%d %H:%M:%S') if self.repo.pushed_at else "Bilinmiyor",
-                "commits": self.repo.get_commits().totalCount
-            }
-        except Exception as e:
-            st.error(f"Repository bilgisi alınamadı: {str(e)}")
-            return None
+"""
+GitHubSync: Veri ve uygulama dosyalarını GitHub reposuna senkronize eder (PyGithub).
+- Token sırası: parametre → st.secrets (Streamlit yüklüyse) → ENV GITHUB_TOKEN
+- Bildirimler events.Reporter üzerinden yapılır; UI StreamlitReporter verir
+- PyGithub ilk kullanımda import edilir, modülün kendisi hızlı yüklenir
+- API adresi ENV GITHUB_API_BASE ya da api_base parametresi ile değiştirilebilir
+- Yüklemeler perf aşaması "github.upload" olarak ölçülür
+"""
+import importlib.util
+import os
+from datetime import datetime
+
+import perf
+from events import NULL_REPORTER, Reporter
+from token_manager import streamlit_secret
+
+# GitHub kütüphanesi opsiyonel - import sırasında uyarı gösterme, sadece kullanım sırasında
+GITHUB_AVAILABLE = importlib.util.find_spec("github") is not None
+
+# Yerel test / benchmark için farklı bir API adresi verilebilir (örn. benchmarks.mock_github)
+GITHUB_API_BASE = os.environ.get("GITHUB_API_BASE", "https://api.github.com")
+
+SYNC_FILES = [
+    ("btag.py", "btag_affiliate_system.py", "python"),
+    ("daily_data.json", "daily_data.json", "json"),
+    ("members.json", "members.json", "json"),
+    ("token.json", "token.json", "json")
+]
+
+
+class GitHubSync:
+    """GitHub ile otomatik senkronizasyon sınıfı"""
+
+    def __init__(self, token: str = None, repo_name: str = "Saxblue/newsoldier", branch: str = "main",
+                 reporter: Reporter = None, api_base: str = None):
+        # Token kodda tutulmaz - secrets ya da ENV üzerinden gelir
+        self.token = token or streamlit_secret('GITHUB_TOKEN') or os.getenv('GITHUB_TOKEN')
+        self.repo_name = repo_name
+        self.branch = branch
+        self.api_base = (api_base or GITHUB_API_BASE).rstrip("/")
+        self.reporter = reporter or NULL_REPORTER
+
+        if not GITHUB_AVAILABLE:
+            # PyGithub kütüphanesi mevcut değil - sessizce devre dışı bırak
+            self.sync_enabled = False
+            return
+
+        try:
+            from github import Github
+            self.github = Github(self.token, base_url=self.api_base)
+            self.repo = self.github.get_repo(self.repo_name)
+            self.sync_enabled = True
+        except Exception:
+            # GitHub bağlantı hatası - sessizce devre dışı bırak
+            self.sync_enabled = False
+
+
+    def upload_file(self, file_path, content, commit_message=None):
+        """Dosyayı GitHub'a yükle veya güncelle"""
+        if not self.sync_enabled:
+            return False
+
+        try:
+            if commit_message is None:
+                commit_message = f"Auto-update {file_path} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+
+            if isinstance(content, str):
+                content_bytes = content.encode('utf-8')
+            else:
+                content_bytes = content
+
+            with perf.stage("github.upload", len(content_bytes)):
+                return self._put_file(file_path, content_bytes, commit_message)
+
+        except Exception as e:
+            self.reporter.error(f"GitHub yükleme hatası: {str(e)}", path=file_path)
+            return False
+
+    def _put_file(self, file_path, content_bytes, commit_message):
+        try:
+            # Dosya varsa güncelle
+            file = self.repo.get_contents(file_path, ref=self.branch)
+            self.repo.update_file(
+                path=file_path,
+                message=commit_message,
+                content=content_bytes,
+                sha=file.sha,
+                branch=self.branch
+            )
+            return True
+        except Exception:
+            # Dosya yoksa oluştur
+            self.repo.create_file(
+                path=file_path,
+                message=commit_message,
+                content=content_bytes,
+                branch=self.branch
+            )
+            return True
+
+    def _sync_file(self, local_file_path, github_file_path, commit_message):
+        try:
+            with open(local_file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            success = self.upload_file(github_file_path, content, commit_message)
+
+            if success:
+                self.reporter.success(f"✅ {github_file_path} GitHub'a yüklendi!", path=github_file_path)
+                return True
+            else:
+                self.reporter.error(f"❌ {github_file_path} yüklenemedi!", path=github_file_path)
+                return False
+
+        except Exception as e:
+            self.reporter.error(f"Dosya okuma hatası: {str(e)}", path=local_file_path)
+            return False
+
+    def sync_json_file(self, local_file_path, github_file_path=None):
+        """JSON dosyasını GitHub'a senkronize et"""
+        if github_file_path is None:
+            github_file_path = os.path.basename(local_file_path)
+        return self._sync_file(local_file_path, github_file_path, f"Update {github_file_path} data")
+
+    def sync_python_file(self, local_file_path, github_file_path=None):
+        """Python dosyasını GitHub'a senkronize et"""
+        if github_file_path is None:
+            github_file_path = os.path.basename(local_file_path)
+        return self._sync_file(local_file_path, github_file_path, f"Update {github_file_path} application code")
+
+    @perf.timed("github.sync_all")
+    def sync_all_files(self, files_to_sync=None):
+        """Tüm dosyaları GitHub'a senkronize et"""
+        files_to_sync = files_to_sync or SYNC_FILES
+        success_count = 0
+        total_files = len(files_to_sync)
+
+        with self.reporter.spinner("GitHub'a senkronize ediliyor..."):
+            for i, (local_file, github_file, file_type) in enumerate(files_to_sync):
+                if os.path.exists(local_file):
+                    if file_type == "python":
+                        if self.sync_python_file(local_file, github_file):
+                            success_count += 1
+                    else:
+                        if self.sync_json_file(local_file, github_file):
+                            success_count += 1
+                else:
+                    self.reporter.warning(f"⚠️ {local_file} dosyası bulunamadı!", path=local_file)
+                self.reporter.progress(i + 1, total_files, github_file)
+        self.reporter.progress_done()
+
+        if success_count == total_files:
+            self.reporter.success(f"🎉 Tüm dosyalar ({success_count}/{total_files}) başarıyla GitHub'a yüklendi!",
+                                  celebrate=True)
+        else:
+            self.reporter.warning(f"⚠️ {success_count}/{total_files} dosya yüklendi.")
+
+        return success_count == total_files
+
+    def get_repo_info(self):
+        """Repository bilgilerini getir"""
+        if not self.sync_enabled:
+            return None
+
+        try:
+            return {
+                "name": self.repo.name,
+                "full_name": self.repo.full_name,
+                "url": self.repo.html_url,
+                "last_push": self.repo.pushed_at.strftime('%Y-%m-%d %H:%M:%S') if self.repo.pushed_at else "Bilinmiyor",
+                "commits": self.repo.get_commits().totalCount
+            }
+        except Exception as e:
+            self.reporter.error(f"Repository bilgisi alınamadı: {str(e)}")
+            return None
@@ -0,0 +1,81 @@
+"""
+Leaderboard: En iyi N sorguları (tam sıralama yerine yığın ile seçim).
+- top_n: sorted(..., reverse=True)[:n] ile aynı sonuç (eşitlerde giriş sırası korunur), O(k log n)
+- Gün / ay listeleri: daily_stats.DayStats gün başına ölçüt başına en iyi TOP_K üyeyi tutar; ay
+  listeleri (MemberHistoryIndex.month_top, MONTH_TOP_K üye) bunlardan bir kez birleştirilir.
+  range_candidates bir aralığı tam aylar + kenar günleri olarak okur: yıllık aralık ~365 yerine ~12 ay
+  listesi ve en fazla ~60 gün listesi
+- Listeler kesildiği için sonuç yaklaşıktır: gün gün TOP_K'nın hemen altında kalan ama aralık toplamında
+  öne çıkan bir üye hiç aday olmayabilir. Her liste bir "pay" (slack) taşır: listede görünmeyen puanın
+  üst sınırı (gün listesinde kesme değeri, birleştirmede kesilen ilk puan + listelerin payları).
+  Aday olmayan her üyenin aralık toplamı range_candidates'in döndürdüğü paydan büyük olamaz; n. adayın
+  kesin toplamı bu payın altında değilse sıralama kanıtlanmış olarak kesindir (daily_stats)
+"""
+import calendar
+import heapq
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+TOP_K = 200         # Gün başına ölçüt başına saklanan üye
+MONTH_TOP_K = 1000  # Ay listeleri daha uzun: ay içinde az ama düzenli görünen üyeler de aday kalır
+
+Ranked = List[Tuple[float, str]]  # [(puan, member_id)] büyükten küçüğe
+Bounded = Tuple[Ranked, float]     # (liste, listede görünmeyen puan payının üst sınırı)
+
+
+def top_n(items: Iterable, n: int, key: Optional[Callable] = None) -> list:
+    """items içinden key'e göre en büyük n öğe (sorted(items, key=key, reverse=True)[:n] ile aynı)"""
+    return heapq.nlargest(n, items, key=key)
+
+
+def day_list(ranked: Ranked, limit: int = TOP_K) -> Bounded:
+    """Günün en iyi limit listesi ve payı: liste dolu değilse günün tüm üyeleri listededir (pay 0);
+    doluysa listede olmayan üyenin puanı kesme değerini aşamaz (işlem yapmayanınki 0)"""
+    if len(ranked) < limit:
+        return ranked, 0.0
+    return ranked, max(ranked[-1][0], 0.0)
+
+
+def merge_ranked(lists: Iterable[Bounded], limit: int = TOP_K) -> Bounded:
+    """Gün / ay listelerini üye bazında toplayıp en yüksek limit üyeyi döndür.
+
+    Pay: listelerin paylarının toplamı + kesilen ilk (limit + 1.) üyenin puanı; her üyenin gerçek
+    toplamı (listedeki puanı ya da 0) + payı aşamaz
+    """
+    scores: Dict[str, float] = {}
+    get = scores.get
+    slack = 0.0
+    for ranked, list_slack in lists:
+        slack += list_slack
+        for score, member_id in ranked:
+            scores[member_id] = get(member_id, 0) + score
+    best = heapq.nlargest(limit + 1, scores, key=scores.__getitem__)
+    if len(best) > limit:
+        slack += max(scores[best.pop()], 0.0)
+    return [(scores[member_id], member_id) for member_id in best], slack
+
+
+def _split_months(dates: List[str], start: date, end: date) -> Tuple[List[str], List[str]]:
+    """Aralıktaki tarihleri (tam kapsanan aylar, kenar günleri) olarak ayır"""
+    months, edge_days = [], []
+    for date_str in dates:
+        year, month = int(date_str[:4]), int(date_str[5:7])
+        month_start = date(year, month, 1)
+        month_end = date(year, month, calendar.monthrange(year, month)[1])
+        if start <= month_start and month_end <= end:
+            if not months or months[-1] != date_str[:7]:
+                months.append(date_str[:7])
+        else:
+            edge_days.append(date_str)
+    return months, edge_days
+
+
+def range_candidates(history_index, dates: List[str], start: date, end: date, metric: str,
+                     limit: int) -> Tuple[List[str], float]:
+    """Aralıkta metric'e göre en yüksek olması muhtemel limit üye ve pay: aday olmayan hiçbir üyenin
+    aralık toplamı payı aşamaz (kesin toplamlar çağırana ait)"""
+    months, edge_days = _split_months(dates, start, end)
+    lists = [history_index.month_top(month)[metric] for month in months]
+    lists.extend(day_list(history_index.day_stats(date_str).top[metric]) for date_str in edge_days)
+    ranked, slack = merge_ranked(lists, limit)
+    return [member_id for _, member_id in ranked], slack
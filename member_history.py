@@ -0,0 +1,234 @@
+"""
+Member History: daily_data.json için üye bazlı ikincil indeks.
+- member_id → [(tarih, btag, sıra)] girdileri, (tarih, btag) sıralı; her girdi
+  daily_data[tarih][btag][sıra] kaydını gösterir
+- history / totals / activity_range yalnızca o üyenin girdilerini dolaşır (tarih aralığı bisect ile)
+- day_stats: gün başına birleştirilebilir özet (daily_stats); uzun aralıklı istatistikler günlerin
+  özetleri birleştirilerek okunur; month_top: ay başına en iyi üye listeleri (leaderboard)
+- save_daily_data yazdıktan sonra apply_write ile yalnızca yazılan (tarih, btag) dilimi yeniden
+  indekslenir; dosya başka bir oturumca değiştiyse load_index dosyayı yeniden okur
+- Yayımlanan indeks ve daily_data'sı değişmez (copy-on-write): apply_write indeksin sığ kopyasını
+  (copy) günceller ve önbellekte yer değiştirir; eski sürümü okuyan oturumlar kilitsiz dolaşmaya devam eder
+"""
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Dict, List, Optional, Tuple, Union
+
+import perf
+import storage
+import daily_stats
+import leaderboard
+from daily_stats import DayStats
+
+Entry = Tuple[str, str, int]  # (tarih, btag, kayıt sırası)
+DayLike = Union[date, str, None]
+
+_MAX_BTAG = "\uffff"  # Aralık sonu için her btag'den büyük anahtar
+AMOUNT_FIELDS = ('deposit_count', 'total_deposits', 'withdrawal_count', 'total_withdrawals')
+
+
+def _day(value: DayLike) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+class MemberHistoryIndex:
+    """daily_data üzerinde member_id → girdiler indeksi"""
+
+    def __init__(self, daily_data: dict):
+        self.daily_data = daily_data
+        self._entries: Dict[str, List[Entry]] = {}
+        # (tarih, btag) diliminde geçen üyeler: dilim yeniden yazılınca eski girdileri bulmak için
+        self._slots: Dict[Tuple[str, str], set] = {}
+        self._day_stats: Dict[str, DayStats] = {}  # Gün özetleri (daily_stats), ilk ihtiyaçta kurulur
+        self._month_top: Dict[str, dict] = {}  # "YYYY-MM" → ölçüt → (en iyi MONTH_TOP_K, pay) (leaderboard)
+        self._range_stats: Dict[tuple, dict] = {}  # range_statistics sonuçları (bir sonraki yazmaya kadar)
+        self._lock = threading.RLock()
+        for date_str in sorted(daily_data):
+            for btag in sorted(daily_data[date_str]):
+                self._add_slot(date_str, btag, daily_data[date_str][btag], append=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _add_slot(self, date_str: str, btag: str, records: list, append: bool = False):
+        members = set()
+        for offset, record in enumerate(records):
+            member_id = str(record.get('member_id', ''))
+            if append:
+                # Kurulumda dilimler sırayla gelir
+                self._entries.setdefault(member_id, []).append((date_str, btag, offset))
+            else:
+                # Liste önceki indeks sürümüyle paylaşılıyor olabilir: kopyası güncellenir
+                entries = list(self._entries.get(member_id, ()))
+                insort(entries, (date_str, btag, offset))
+                self._entries[member_id] = entries
+            members.add(member_id)
+        self._slots[(date_str, btag)] = members
+
+    def copy(self) -> "MemberHistoryIndex":
+        """Yazma için sığ kopya: sözlükler kopyalanır, üye listeleri ve kayıtlar replace_slot değiştirene
+        kadar paylaşılır; aralık sonuçları kopyaya taşınmaz"""
+        index = MemberHistoryIndex.__new__(MemberHistoryIndex)
+        index.daily_data = dict(self.daily_data)
+        with self._lock:
+            index._entries = dict(self._entries)
+            index._slots = dict(self._slots)
+            index._day_stats = dict(self._day_stats)
+            index._month_top = dict(self._month_top)
+        index._range_stats = {}
+        index._lock = threading.RLock()
+        return index
+
+    def replace_slot(self, date_str: str, btag: str, records: list):
+        """daily_data[date_str][btag] yeniden yazıldı: yalnızca o dilimin üyelerini güncelle.
+
+        Paylaşılan nesneler (gün sözlüğü, üye listeleri) yerinde değiştirilmez; yayımlanmış bir
+        indekste değil, copy() ile alınan kopyada çağrılır.
+        """
+        btag = str(btag)
+        with self._lock:
+            for member_id in self._slots.pop((date_str, btag), ()):
+                entries = [entry for entry in self._entries.get(member_id, ()) if entry[:2] != (date_str, btag)]
+                if entries:
+                    self._entries[member_id] = entries
+                else:
+                    self._entries.pop(member_id, None)
+            day = dict(self.daily_data.get(date_str, {}))
+            day[btag] = records
+            self.daily_data[date_str] = day
+            self._add_slot(date_str, btag, records)
+            # Yazılan günün özeti kayıt sırasında yeniden hesaplanır; diğer günlerinkine dokunulmaz
+            self._day_stats[date_str] = DayStats(self.daily_data[date_str])
+            self._month_top.pop(date_str[:7], None)
+            self._range_stats.clear()
+
+    def day_stats(self, date_str: str) -> DayStats:
+        """date_str gününün birleştirilebilir özeti (daily_stats.range_statistics için)"""
+        with self._lock:
+            stats = self._day_stats.get(date_str)
+            if stats is None:
+                stats = self._day_stats[date_str] = DayStats(self.daily_data.get(date_str, {}))
+            return stats
+
+    def member_ids(self) -> List[str]:
+        return list(self._entries)
+
+    def entries(self, member_id, start_date: DayLike = None, end_date: DayLike = None) -> List[Entry]:
+        """Üyenin girdileri (isteğe bağlı tarih aralığı, uçlar dahil)"""
+        with self._lock:
+            entries = self._entries.get(str(member_id), [])
+            start, end = _day(start_date), _day(end_date)
+            low = bisect_left(entries, (start,)) if start else 0
+            high = bisect_right(entries, (end, _MAX_BTAG)) if end else len(entries)
+            return entries[low:high]
+
+    def record(self, entry: Entry) -> dict:
+        date_str, btag, offset = entry
+        return self.daily_data[date_str][btag][offset]
+
+    @perf.timed("member_history.history")
+    def history(self, member_id, start_date: DayLike = None, end_date: DayLike = None) -> List[dict]:
+        """Üyenin günlük kayıtları (tarih sıralı) — tarih ve btag alanlarıyla"""
+        rows = []
+        for entry in self.entries(member_id, start_date, end_date):
+            row = {'date': entry[0], 'btag': entry[1]}
+            row.update(self.record(entry))
+            rows.append(row)
+        return rows
+
+    def totals(self, member_id, start_date: DayLike = None, end_date: DayLike = None) -> Optional[dict]:
+        """analytics.member_statistics'teki üye satırının aynısı (üyenin kaydı yoksa None)"""
+        entries = self.entries(member_id, start_date, end_date)
+        if not entries:
+            return None
+        first = self.record(entries[0])
+        stats = {
+            'username': first.get('username', ''),
+            'customer_name': first.get('customer_name', ''),
+            'total_deposits': 0,
+            'total_withdrawals': 0,
+            'deposit_count': 0,
+            'withdrawal_count': 0,
+            'net_amount': 0,
+            'days_active': len(entries),
+        }
+        for entry in entries:
+            record = self.record(entry)
+            for field in AMOUNT_FIELDS:
+                stats[field] += record.get(field, 0)
+        stats['net_amount'] = stats['total_deposits'] - stats['total_withdrawals']
+        return stats
+
+    def month_top(self, month: str) -> Dict[str, leaderboard.Bounded]:
+        """Ayın ("YYYY-MM") ölçüt başına en iyi MONTH_TOP_K üyesi ve payı, günlük listelerden bir kez
+        birleştirilir"""
+        with self._lock:
+            top = self._month_top.get(month)
+            if top is None:
+                days = [self.day_stats(date_str) for date_str in self.daily_data if date_str.startswith(month)]
+                top = self._month_top[month] = {
+                    metric: leaderboard.merge_ranked((leaderboard.day_list(day.top[metric]) for day in days),
+                                                     leaderboard.MONTH_TOP_K)
+                    for metric in daily_stats.TOP_METRICS
+                }
+            return top
+
+    def range_statistics(self, start_date: date, end_date: date, n: int = 10) -> dict:
+        """daily_stats.range_statistics; sonuç bir sonraki yazmaya kadar saklanır"""
+        key = (start_date, end_date, n)
+        with self._lock:
+            result = self._range_stats.get(key)
+            if result is None:
+                result = self._range_stats[key] = daily_stats.range_statistics(self, start_date, end_date, n)
+            return result
+
+    def activity_range(self, member_id) -> Tuple[Optional[str], Optional[str]]:
+        """(ilk, son) kayıt tarihi; kaydı yoksa (None, None)"""
+        with self._lock:
+            entries = self._entries.get(str(member_id))
+            if not entries:
+                return None, None
+            return entries[0][0], entries[-1][0]
+
+
+_cache: Dict[str, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def load_index(path: str) -> MemberHistoryIndex:
+    """daily_data.json'un güncel sürümü için indeks (dosya değişmediyse önceki indeks)"""
+    key = os.path.abspath(path)
+    version = storage.file_version(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with perf.stage("json.load.daily_data", perf.file_size(path)):
+        daily_data, version = storage.read_json(path, {})
+    with perf.stage("member_history.build"):
+        index = MemberHistoryIndex(daily_data)
+    with _cache_lock:
+        _cache[key] = (version, index)
+    return index
+
+
+def apply_write(path: str, base_version: Optional[str], version: Optional[str], date_str: str, btag: str,
+                records: list):
+    """save_daily_data'nın yazdığı dilimi önbellekteki indeksin kopyasına uygulayıp kopyayı yayımla
+    (indeks base_version'da değilse dokunulmaz)"""
+    key = os.path.abspath(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is None or base_version is None or cached[0] != base_version:
+            return
+        try:
+            index = cached[1].copy()
+            index.replace_slot(date_str, btag, records)
+        except Exception:
+            _cache.pop(key, None)
+            raise
+        _cache[key] = (version, index)
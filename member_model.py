@@ -0,0 +1,305 @@
+"""
+Member Model: Üye kayıtlarının tipli, normalize edilmiş hâli.
+- Member: serializer.schema ile üretilen şema (msgspec Struct ya da slots dataclass); her bilgi
+  tek yerde durur — api_data'nın kopyası tutulmaz, kpi_data'dan ana alanlara taşınanlar çıkarılır.
+  kpi_data (ham KPI yanıtı) dosyada kalır ama tipli modele çözülmez; bellekte üye başına dict oluşmaz
+- normalize_member / normalize_members: members.json'a yazılmadan önce dict kaydı sadeleştirir
+  (eski api_data'daki eksik alanlar üst seviyeye alınır; bilinmeyen alanlar korunur)
+- MemberTable: üyeler + arama / sıralama için sütun dizileri (array, bytearray); filtre ve sıralama
+  yalnızca indeks listesi üzerinde çalışır, sayfada gösterilen satırlar record() ile dict'e çevrilir.
+  Arama sütunu text_normalize.fold ile bir kez katlanır (Türkçe İ/ı, aksan ve boşluk farkları eşleşir)
+- load_table(path): dosya sürümüne göre önbelleklenen tablo (dosya değişmedikçe yeniden çözülmez);
+  apply_write ile bu süreçteki yazmalar tablonun kopyasına artımlı uygulanır (upsert), dosya yeniden
+  çözülmez. Yayımlanan tablo bir daha değişmez (copy-on-write): diğer oturumlar kilitsiz okur,
+  yazma kopya (ve görünümlerinin kopyaları) hazır olunca önbellekte yer değiştirir
+"""
+import os
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+import perf
+import serializer
+import storage
+from text_normalize import fold
+
+Member = serializer.schema("Member", [
+    ("member_id", str, ""),
+    ("username", str, ""),
+    ("full_name", str, ""),
+    ("is_active", bool, True),
+    ("created_at", Optional[str], None),
+    ("status_updated_at", Optional[str], None),
+    # Profil (backoffice GetClientById)
+    ("email", Optional[str], None),
+    ("phone", Optional[str], None),
+    ("birth_date", Optional[str], None),
+    ("partner_name", Optional[str], None),
+    ("currency", Optional[str], "TRY"),
+    ("status", Optional[int], None),
+    ("registration_date", Optional[str], None),
+    ("last_login_date", Optional[str], None),
+    ("last_api_update", Optional[str], None),
+    # Hareketler
+    ("balance", Optional[float], 0.0),
+    ("last_deposit_date", Optional[str], None),
+    ("last_casino_bet", Optional[str], None),
+    ("days_without_deposit", Optional[int], 0),
+    # KPI (GetClientKpis)
+    ("total_deposits", Optional[float], 0.0),
+    ("total_withdrawals", Optional[float], 0.0),
+    ("deposit_count", Optional[int], 0),
+    ("withdrawal_count", Optional[int], 0),
+    ("last_kpi_update", Optional[str], None),
+], module=__name__)
+
+MemberList = List[Member]
+
+# kpi_data'da ana alanlara zaten taşınmış ya da üye kimliğini tekrar eden anahtarlar
+KPI_DUPLICATE_KEYS = ("ClientId", "Login", "Name", "TotalDeposit", "TotalWithdrawal", "DepositCount",
+                      "WithdrawalCount")
+
+def normalize_member(member: dict) -> dict:
+    """api_data kopyasını kaldır, kpi_data'daki tekrarları çıkar (kayıt yerinde değişir)"""
+    api_data = member.pop("api_data", None)
+    if api_data:
+        for field, value in api_data.items():
+            if field not in member and value not in (None, ""):
+                member[field] = value
+    kpi_data = member.get("kpi_data")
+    if kpi_data:
+        for key in KPI_DUPLICATE_KEYS:
+            kpi_data.pop(key, None)
+    return member
+
+
+def needs_normalize(member: dict) -> bool:
+    """normalize_member kaydı değiştirecek mi"""
+    if "api_data" in member:
+        return True
+    kpi_data = member.get("kpi_data")
+    return bool(kpi_data) and any(key in kpi_data for key in KPI_DUPLICATE_KEYS)
+
+
+def normalize_members(members: list) -> list:
+    for member in members:
+        normalize_member(member)
+    return members
+
+
+def _id_key(member_id: str) -> int:
+    try:
+        return int(member_id)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _search_key(member) -> str:
+    """Katlanmış "isim\\x00kullanıcı adı" (arama anahtarı sütunu)"""
+    return f"{fold(member.full_name)}\x00{fold(member.username)}"
+
+
+def _deposit_day(value: Optional[str]) -> str:
+    # analytics._last_deposit_key ile aynı kural: yalnızca ISO tarih-saat (T içeren) değerler
+    return value.split("T")[0] if value and "T" in value else ""
+
+
+class MemberTable:
+    """Üye listesi; arama / sıralama sütunları ayrı, sıkı dizilerde tutulur"""
+
+    __slots__ = ("members", "_ids", "_names", "_search", "_active", "_deposits", "_last_deposit",
+                 "_positions", "_observers", "text_revision", "lineage")
+
+    def __init__(self, members: Iterable):
+        self.members: List = list(members)
+        self._ids = array("q", (_id_key(m.member_id) for m in self.members))
+        self._names = [m.full_name.lower() for m in self.members]
+        self._search = [_search_key(m) for m in self.members]
+        self._active = bytearray(bool(m.is_active) for m in self.members)
+        self._deposits = array("d", (float(m.total_deposits or 0) for m in self.members))
+        self._last_deposit = [_deposit_day(m.last_deposit_date) for m in self.members]
+        self._positions: Optional[Dict[str, int]] = None
+        self._observers: List = []
+        # İsim / kullanıcı adı / ID değiştikçe artar (arama indeksi buna göre yeniden kurulur)
+        self.text_revision = 0
+        # Dosyadan kurulan tablo ve copy() ile türeyen kopyaları aynı nesneyi paylaşır
+        self.lineage = object()
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def search_key(self, index: int) -> str:
+        """Satırın önceden katlanmış arama anahtarı ("isim\\x00kullanıcı adı")"""
+        return self._search[index]
+
+    def position(self, member_id: str) -> Optional[int]:
+        """member_id'nin satır indeksi (yoksa None)"""
+        if self._positions is None:
+            self._positions = {m.member_id: i for i, m in enumerate(self.members)}
+        return self._positions.get(member_id)
+
+    def observe(self, observer):
+        """Satır değişikliklerinden haberdar edilecek nesne: before_change(i) / after_change(i) / copy(tablo)"""
+        self._observers.append(observer)
+
+    @property
+    def observers(self) -> tuple:
+        return tuple(self._observers)
+
+    def copy(self) -> "MemberTable":
+        """Yazma için kopya: sütunlar ve gözlemciler (observer.copy(yeni tablo)) kopyalanır; bu tablo değişmez"""
+        table = MemberTable.__new__(MemberTable)
+        table.members = list(self.members)
+        table._ids = self._ids[:]
+        table._names = list(self._names)
+        table._search = list(self._search)
+        table._active = self._active[:]
+        table._deposits = self._deposits[:]
+        table._last_deposit = list(self._last_deposit)
+        table._positions = dict(self._positions) if self._positions is not None else None
+        table.text_revision = self.text_revision
+        table.lineage = self.lineage
+        table._observers = [observer.copy(table) for observer in self._observers]
+        return table
+
+    def upsert(self, member):
+        """Üyeyi yerinde güncelle ya da sona ekle; sütunlar ve gözlemciler artımlı güncellenir"""
+        index = self.position(member.member_id)
+        if index is None:
+            index = len(self.members)
+            self.members.append(member)
+            self._positions[member.member_id] = index
+            self._ids.append(_id_key(member.member_id))
+            self._names.append(member.full_name.lower())
+            self._search.append(_search_key(member))
+            self._active.append(bool(member.is_active))
+            self._deposits.append(float(member.total_deposits or 0))
+            self._last_deposit.append(_deposit_day(member.last_deposit_date))
+            self.text_revision += 1
+        else:
+            for observer in self._observers:
+                observer.before_change(index)
+            old = self.members[index]
+            if (old.full_name, old.username) != (member.full_name, member.username):
+                self.text_revision += 1
+            self.members[index] = member
+            self._ids[index] = _id_key(member.member_id)
+            self._names[index] = member.full_name.lower()
+            self._search[index] = _search_key(member)
+            self._active[index] = bool(member.is_active)
+            self._deposits[index] = float(member.total_deposits or 0)
+            self._last_deposit[index] = _deposit_day(member.last_deposit_date)
+        for observer in self._observers:
+            observer.after_change(index)
+        return index
+
+    @perf.timed("members.filter")
+    def filter(self, search_term: str = "", status_filter: str = "Tümü") -> List[int]:
+        """analytics.filter_members ile aynı kurallar; eşleşen satırların indeksleri"""
+        indices = self.by_status(range(len(self.members)), status_filter)
+
+        if search_term:
+            term = fold(search_term)
+            members, search = self.members, self._search
+            indices = [i for i in indices if term in search[i] or search_term in members[i].member_id]
+        return list(indices)
+
+    def by_status(self, indices: Iterable[int], status_filter: str = "Tümü") -> List[int]:
+        """indices içinden "Aktif" / "Pasif" olanlar ("Tümü": hepsi, sıra korunur)"""
+        if status_filter == "Aktif":
+            return [i for i in indices if self._active[i]]
+        if status_filter == "Pasif":
+            return [i for i in indices if not self._active[i]]
+        return list(indices)
+
+    def sort_column(self, sort_by: str):
+        """(sütun, azalan mı) — analytics.sort_members ile aynı anahtarlar; bilinmeyen sıralama için None"""
+        if sort_by == "ID":
+            return self._ids, False
+        if sort_by == "İsim":
+            return self._names, False
+        if sort_by == "Son Yatırım":
+            return self._last_deposit, True
+        if sort_by == "Toplam Yatırım":
+            return self._deposits, True
+        return None
+
+    def is_active(self, index: int) -> bool:
+        return bool(self._active[index])
+
+    @perf.timed("members.sort")
+    def sort(self, indices: List[int], sort_by: str = "ID") -> List[int]:
+        """analytics.sort_members ile aynı sıralama (eşitlerde sıra korunur)"""
+        column = self.sort_column(sort_by)
+        if column is None:
+            return list(indices)
+        values, descending = column
+        return sorted(indices, key=values.__getitem__, reverse=descending)
+
+    def record(self, index: int) -> dict:
+        """Satırı sayfa kodunun beklediği dict'e çevir (boş alanlar atlanır, .get varsayılanı geçerli olur)"""
+        return {key: value for key, value in serializer.to_builtins(self.members[index]).items()
+                if value is not None}
+
+
+_cache: Dict[str, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def load_members(path: str) -> list:
+    """members.json'u Member listesine çöz.
+
+    Henüz normalize edilmemiş (api_data taşıyan) dosyada kayıtlar önce normalize_member'dan geçer:
+    yalnızca api_data'da duran değerler tabloya da bir sonraki yazmanın saklayacağı gibi girer.
+    Normalize edilmiş dosya ara dict oluşmadan doğrudan çözülür.
+    """
+    with perf.stage("json.load.members", perf.file_size(path)):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        if b'"api_data"' not in data:
+            return serializer.decode(data, MemberList)
+        return serializer.convert(normalize_members(serializer.loads(data)), MemberList)
+
+
+def load_table(path: str) -> MemberTable:
+    """Dosya sürümü değişmediyse önceki tabloyu döndür"""
+    key = os.path.abspath(path)
+    version = storage.file_version(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    table = MemberTable(load_members(path))
+    with _cache_lock:
+        _cache[key] = (version, table)
+    return table
+
+
+def invalidate(path: str):
+    """Önbellekteki tabloyu bırak (sonraki load_table dosyayı yeniden okur)"""
+    with _cache_lock:
+        _cache.pop(os.path.abspath(path), None)
+
+
+def apply_write(path: str, base_version: Optional[str], version: Optional[str], records: Iterable[dict]):
+    """Bu süreçteki bir yazmayı (değişen kayıtlar) önbellekteki tablonun kopyasına artımlı uygula.
+
+    Tablo yazmanın üzerine yapıldığı sürümde değilse (başka bir oturum araya girdi) dokunulmaz;
+    sonraki load_table dosyayı yeniden okur. Önceki tabloyu okuyan oturumlar onu değişmeden görür.
+    """
+    key = os.path.abspath(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is None or base_version is None or cached[0] != base_version:
+            return
+        table = cached[1].copy()
+        try:
+            for record in records:
+                table.upsert(serializer.convert(record, Member))
+        except Exception:
+            _cache.pop(key, None)  # Sürümü belirsiz kalan tablo kullanılmasın
+            raise
+        _cache[key] = (version, table)
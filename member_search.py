@@ -0,0 +1,223 @@
+"""
+Member Search: Üye listesi için bellek içi arama indeksi (isim, kullanıcı adı, ID).
+- Sözlük: text_normalize ile katlanmış kelimeler (İ/ı, ş/s ... ayrımı yok) → üye indeksleri (array)
+- Alt dizi / önek: tüm kelimeler sıralı tek bir metinde (blob) tutulur, str.find ile C hızında taranır;
+  eşleşen konumun kelimesi bisect ile bulunur
+- Yazım hatası toleransı: az sonuç veren kelimeler için kelime trigramlarından aday üretilir ve
+  sınırlı Levenshtein mesafesiyle doğrulanır (4-6 harf: 1, 7+ harf: 2 hata; rakam içeren kelimelerde
+  yapılmaz); trigram indeksi ilk ihtiyaçta kurulur
+- 1-2 harflik kelimeler sözlüğün büyük kısmına uyduğundan üye başına tutulan katlanmış metinde aranır
+- Sıralama: tam kelime > önek > alt dizi > yakın eşleşme; çok kelimeli sorguda her kelime eşleşmeli,
+  puanlar toplanır; eşit puanda dosya sırası korunur
+- load_index(path): indeks üye dosyasının sürümü başına bir kez kurulur (member_model.load_table ile aynı önbellek);
+  tabloya artımlı yazılan değişiklik isim / kullanıcı adını etkilediyse yeniden kurulur, etkilemediyse
+  indeks yazmanın ürettiği tablo kopyasına bağlanır (rebind)
+"""
+import copy
+import os
+import threading
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, chain
+from typing import Dict, List, Optional
+
+import member_model
+import perf
+from text_normalize import split_words, tokens
+
+EXACT, PREFIX, SUBSTRING = 3.0, 2.0, 1.0
+FUZZY = 0.5                # Yakın eşleşme puanı (mesafe arttıkça azalır)
+FUZZY_MIN_LENGTH = 4
+FUZZY_MAX_MATCHES = 20     # Kelime bundan az sözlük kelimesiyle eşleşiyorsa yakın eşleşme de aranır
+SHORT_WORD = 3             # Bundan kısa kelimeler sözlük yerine üye metinlerinde aranır
+_SEPARATOR = "\x00"
+
+
+def _max_distance(word: str) -> int:
+    return 1 if len(word) <= 6 else 2
+
+
+def _trigrams(word: str) -> set:
+    padded = f" {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def levenshtein(a: str, b: str, limit: int) -> int:
+    """a ile b arasındaki düzenleme mesafesi; limit aşılırsa limit + 1"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class MemberSearchIndex:
+    """MemberTable üzerinde kelime sözlüğü + alt dizi / önek / yakın eşleşme araması"""
+
+    def __init__(self, table: member_model.MemberTable):
+        self.table = table
+        self.text_revision = table.text_revision
+        vocabulary: Dict[str, List[int]] = {}
+        self._texts: List[str] = []
+        for index, member in enumerate(table.members):
+            # Tablonun önceden katlanmış arama sütunu; isimler burada yeniden katlanmaz
+            full_name, _, username = table.search_key(index).partition(_SEPARATOR)
+            self._texts.append(f"{full_name}{_SEPARATOR}{username}{_SEPARATOR}{member.member_id}")
+            words = set(split_words(full_name))
+            words.update(split_words(username))
+            words.add(username.replace(" ", ""))
+            words.add(member.member_id)
+            words.discard("")
+            for word in words:
+                postings = vocabulary.get(word)
+                if postings is None:
+                    vocabulary[word] = [index]
+                else:
+                    postings.append(index)
+
+        self.words = sorted(vocabulary)
+        # Kelime başına ayrı dizi yerine tek dizi + başlangıç konumları (CSR)
+        self._postings = array("i", chain.from_iterable(map(vocabulary.__getitem__, self.words)))
+        self._offsets = array("q", accumulate(map(len, map(vocabulary.__getitem__, self.words)), initial=0))
+        self._starts = array("q", accumulate((len(word) + 1 for word in self.words), initial=0))
+        self._blob = _SEPARATOR.join(self.words)
+        self._trigram_index: Optional[Dict[str, array]] = None
+        self._lock = threading.Lock()
+
+    def rebind(self, table: member_model.MemberTable) -> "MemberSearchIndex":
+        """Aynı metinli (text_revision eşit) tablo kopyası için indeks; sözlük ve diziler paylaşılır"""
+        index = copy.copy(self)
+        index.table = table
+        return index
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def postings(self, word_index: int) -> array:
+        """words[word_index] kelimesini içeren üye indeksleri"""
+        return self._postings[self._offsets[word_index]:self._offsets[word_index + 1]]
+
+    def _substring_matches(self, word: str) -> Dict[int, float]:
+        """word'ü içeren sözlük kelimeleri → puan (tam / önek / alt dizi)"""
+        blob, starts, words = self._blob, self._starts, self.words
+        matches = {}
+        position = blob.find(word)
+        while position != -1:
+            word_index = bisect_right(starts, position) - 1
+            if position == starts[word_index]:
+                matches[word_index] = EXACT if words[word_index] == word else PREFIX
+            else:
+                matches[word_index] = SUBSTRING
+            # Aynı kelimedeki sonraki eşleşmeler puanı değiştirmez; sonraki kelimeden devam et
+            next_word = word_index + 1
+            if next_word >= len(words):
+                break
+            position = blob.find(word, starts[next_word])
+        return matches
+
+    def _trigrams_index(self) -> Dict[str, array]:
+        with self._lock:
+            if self._trigram_index is None:
+                index: Dict[str, List[int]] = {}
+                for word_index, word in enumerate(self.words):
+                    if len(word) < FUZZY_MIN_LENGTH - 1 or not word.isalpha():
+                        continue
+                    for trigram in _trigrams(word):
+                        index.setdefault(trigram, []).append(word_index)
+                self._trigram_index = {trigram: array("i", items) for trigram, items in index.items()}
+            return self._trigram_index
+
+    def _fuzzy_matches(self, word: str) -> Dict[int, float]:
+        limit = _max_distance(word)
+        query = _trigrams(word)
+        counts = Counter()
+        index = self._trigrams_index()
+        for trigram in query:
+            postings = index.get(trigram)
+            if postings is not None:
+                counts.update(postings)
+
+        # Her düzenleme en fazla 3 trigramı bozar
+        needed = max(1, len(query) - 3 * limit)
+        matches = {}
+        for word_index, shared in counts.items():
+            if shared < needed:
+                continue
+            distance = levenshtein(word, self.words[word_index], limit)
+            if distance <= limit:
+                matches[word_index] = FUZZY / distance if distance else EXACT
+        return matches
+
+    def _word_scores(self, word: str, fuzzy: bool) -> Dict[int, float]:
+        if len(word) < SHORT_WORD:
+            # 1-2 harf sözlüğün büyük kısmına uyar; üye metinlerini doğrudan taramak daha ucuz
+            return dict.fromkeys((i for i, text in enumerate(self._texts) if word in text), SUBSTRING)
+        matches = self._substring_matches(word)
+        if fuzzy and len(word) >= FUZZY_MIN_LENGTH and word.isalpha() and len(matches) < FUZZY_MAX_MATCHES:
+            for word_index, score in self._fuzzy_matches(word).items():
+                if score > matches.get(word_index, 0):
+                    matches[word_index] = score
+
+        # Düşük puandan yükseğe: üyenin en iyi eşleşmesi sona yazılır (döngüler C tarafında)
+        by_score: Dict[float, list] = {}
+        for word_index, score in matches.items():
+            by_score.setdefault(score, []).append(self.postings(word_index))
+        scores: Dict[int, float] = {}
+        for score in sorted(by_score):
+            scores.update(dict.fromkeys(chain.from_iterable(by_score[score]), score))
+        return scores
+
+    @perf.timed("members.search")
+    def search(self, query: str, status_filter: str = "Tümü", fuzzy: bool = True,
+               limit: Optional[int] = None) -> List[int]:
+        """Sorguya uyan üye indeksleri, en iyi eşleşme başta"""
+        words = tokens(query)
+        if not words:
+            return self.table.by_status(range(len(self.table)), status_filter)
+
+        totals: Optional[Dict[int, float]] = None
+        # Seçici kelimelerden başla: kesişim küçük kalır
+        for word in sorted(set(words), key=len, reverse=True):
+            scores = self._word_scores(word, fuzzy)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {index: total + scores[index] for index, total in totals.items() if index in scores}
+            if not totals:
+                return []
+
+        # Önce dosya sırası, sonra (kararlı) puan sırası
+        ranked = sorted(sorted(totals), key=totals.__getitem__, reverse=True)
+        ranked = self.table.by_status(ranked, status_filter)
+        return ranked[:limit] if limit is not None else ranked
+
+
+_cache: Dict[str, MemberSearchIndex] = {}
+_cache_lock = threading.Lock()
+
+
+def load_index(path: str, table: Optional[member_model.MemberTable] = None) -> MemberSearchIndex:
+    """Üye dosyasının güncel sürümü (ya da verilen tablo) için indeks (tablo değişmediyse önceki indeks)"""
+    key = os.path.abspath(path)
+    table = table if table is not None else member_model.load_table(path)
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None and index.text_revision == table.text_revision:
+            if index.table is table:
+                return index
+            if index.table.lineage is table.lineage:
+                # Aynı tablonun yazma kopyası, metinler değişmedi: satır indeksleri aynı
+                index = _cache[key] = index.rebind(table)
+                return index
+    with perf.stage("members.search_index"):
+        index = MemberSearchIndex(table)
+    with _cache_lock:
+        _cache[key] = index
+    return index
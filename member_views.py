@@ -0,0 +1,129 @@
+"""
+Member Views: Üye listesinin önceden sıralanmış görünümleri (sunucu tarafı sayfalama).
+- Her sıralama (ID, İsim, Son Yatırım, Toplam Yatırım) × durum (Tümü, Aktif, Pasif) için üye indeksleri
+  sıralı bir array'de tutulur; "sıralama s, filtre f, sayfa k" tek bir dilimdir (sayfa boyutunda iş)
+- Sıralama analytics.sort_members ile aynıdır: eşit anahtarlarda dosya sırası korunur. Azalan
+  sıralamalar artan tutulur ve sondan okunur
+- Tabloya yapılan yazmalar (MemberTable.upsert) görünümlere bisect ile artımlı uygulanır. member_model
+  yazmayı tablonun kopyasına uygular; görünümler de kopyalanır (copy), yayımlanmış görünümler değişmez
+  ve kilitsiz okunur. Dosya başka bir oturumca değiştiyse tablo yeniden yüklenir ve görünümler yeniden kurulur
+- Arama sonucu verilirse (member_search) yalnızca eşleşenler sıralanır; sayfa için heapq ile
+  ilk (k + 1) * sayfa boyutu kadarı seçilir
+"""
+import heapq
+import os
+import threading
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import member_model
+import perf
+
+SORT_KEYS = ("ID", "İsim", "Son Yatırım", "Toplam Yatırım")
+STATUS_FILTERS = ("Tümü", "Aktif", "Pasif")
+
+
+class MemberViews:
+    """MemberTable üzerinde sıralama × durum görünümleri"""
+
+    def __init__(self, table: member_model.MemberTable):
+        self.table = table
+        self._views: Dict[Tuple[str, str], array] = {}
+        everyone = range(len(table))
+        for sort_by in SORT_KEYS:
+            order = sorted(everyone, key=self._key_function(sort_by))
+            self._views[(sort_by, "Tümü")] = array("i", order)
+            self._views[(sort_by, "Aktif")] = array("i", (i for i in order if table.is_active(i)))
+            self._views[(sort_by, "Pasif")] = array("i", (i for i in order if not table.is_active(i)))
+        table.observe(self)
+
+    def _key_function(self, sort_by: str):
+        """Görünüm dizilerinin artan sıralama anahtarı: (değer, ±indeks)"""
+        values, descending = self.table.sort_column(sort_by)
+        if descending:
+            # Sondan okununca değer azalan, eşitlerde indeks artan olur
+            return lambda i: (values[i], -i)
+        return lambda i: (values[i], i)
+
+    def _status_views(self, index: int):
+        status = "Aktif" if self.table.is_active(index) else "Pasif"
+        for sort_by in SORT_KEYS:
+            yield sort_by, self._views[(sort_by, "Tümü")]
+            yield sort_by, self._views[(sort_by, status)]
+
+    # MemberTable gözlemcisi (yalnızca henüz yayımlanmamış kopya tabloda çağrılır)
+    def copy(self, table: member_model.MemberTable) -> "MemberViews":
+        views = MemberViews.__new__(MemberViews)
+        views.table = table
+        views._views = {key: view[:] for key, view in self._views.items()}
+        return views
+
+    def before_change(self, index: int):
+        for sort_by, view in self._status_views(index):
+            key = self._key_function(sort_by)
+            position = bisect_left(view, key(index), key=key)
+            if position < len(view) and view[position] == index:
+                del view[position]
+
+    def after_change(self, index: int):
+        for sort_by, view in self._status_views(index):
+            insort(view, index, key=self._key_function(sort_by))
+
+    def count(self, status_filter: str = "Tümü") -> int:
+        return len(self._views[("ID", _status(status_filter))])
+
+    @perf.timed("members.page")
+    def page(self, sort_by: str, status_filter: str = "Tümü", page: int = 0, per_page: int = 10,
+             matches: Optional[Sequence[int]] = None) -> Tuple[List[int], int]:
+        """(sayfadaki üye indeksleri, toplam eşleşen); page 0'dan başlar.
+
+        matches verilirse (arama sonucu, durum filtresi uygulanmış) yalnızca onlar sıralanır;
+        sort_by bilinmiyorsa (örn. "Eşleşme") matches'in kendi sırası kullanılır.
+        """
+        start = max(page, 0) * per_page
+        end = start + per_page
+        known = sort_by in SORT_KEYS
+        if matches is not None:
+            if not known:
+                return list(matches[start:end]), len(matches)
+            _, descending = self.table.sort_column(sort_by)
+            key = self._key_function(sort_by)
+            select = heapq.nlargest if descending else heapq.nsmallest
+            return select(end, matches, key=key)[start:], len(matches)
+
+        view = self._views[(sort_by if known else "ID", _status(status_filter))]
+        total = len(view)
+        if known and self.table.sort_column(sort_by)[1]:
+            # Azalan görünüm: sondan oku
+            rows = view[max(total - end, 0):max(total - start, 0)]
+            return list(reversed(rows)), total
+        return list(view[start:end]), total
+
+
+def _status(status_filter: str) -> str:
+    return status_filter if status_filter in STATUS_FILTERS else "Tümü"
+
+
+_cache: Dict[str, MemberViews] = {}
+_cache_lock = threading.Lock()
+
+
+def load_views(path: str) -> MemberViews:
+    """Üye dosyasının güncel tablosu için görünümler (tablo aynıysa önceki görünümler)"""
+    key = os.path.abspath(path)
+    table = member_model.load_table(path)
+    with _cache_lock:
+        views = _cache.get(key)
+        if views is not None and views.table is table:
+            return views
+        # apply_write'ın kopyaladığı tablo görünümlerin kopyasını da taşır
+        copied = next((observer for observer in table.observers if isinstance(observer, MemberViews)), None)
+        if copied is not None:
+            _cache[key] = copied
+            return copied
+    with perf.stage("members.views"):
+        views = MemberViews(table)
+    with _cache_lock:
+        _cache[key] = views
+    return views
@@ -0,0 +1,312 @@
+"""
+Metrics: Operasyon izleme için sayaç / histogram kayıt defteri (Prometheus metin biçimi).
+- Backoffice API çağrıları: uç nokta ve durum kodu bazında adet ve süre
+- GitHub senkronizasyonu: işlem, durum, süre ve aktarılan bayt
+- Excel içe aktarımı ve JSON dosya okuma / yazma: adet, süre, bayt; BTag bazında kayıt sayısı
+- Rapor ve grafik önbelleği isabet / ıskalama sayıları
+Ölçümler perf aşamalarından (perf.add_listener), report_cache'ten ve figure_cache'ten beslenir.
+Dışa aktarım: start_http_server(port) → /metrics, start_file_writer(path, interval);
+start_from_env() ENV BTAG_METRICS_PORT / BTAG_METRICS_FILE ile ikisini de açar.
+"""
+import abc
+import bisect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import perf
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_FILE_INTERVAL = 15.0
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric(abc.ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: beklenen etiketler {self.labelnames}, gelen {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render_samples(items))
+        return lines
+
+    @abc.abstractmethod
+    def _render_samples(self, items) -> List[str]:
+        """(etiket değerleri, durum) çiftlerinden örnek satırları"""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError("Sayaç azaltılamaz")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _render_samples(self, items):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            state["counts"][bisect.bisect_left(self.buckets, value)] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state["count"] if state else 0
+
+    def _render_samples(self, items):
+        lines = []
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state["counts"]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metriklerin kayıt defteri; render() Prometheus metin biçimini üretir"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing  # Streamlit rerun'ları modülü yeniden yükleyebilir
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+BACKOFFICE_REQUESTS = REGISTRY.counter(
+    "btag_backoffice_requests_total", "Backoffice API çağrıları", ("endpoint", "status"))
+BACKOFFICE_SECONDS = REGISTRY.histogram(
+    "btag_backoffice_request_seconds", "Backoffice API çağrı süresi", ("endpoint",))
+GITHUB_OPERATIONS = REGISTRY.counter(
+    "btag_github_sync_operations_total", "GitHub senkronizasyon işlemleri", ("operation", "status"))
+GITHUB_SECONDS = REGISTRY.histogram(
+    "btag_github_sync_seconds", "GitHub senkronizasyon süresi", ("operation",))
+GITHUB_BYTES = REGISTRY.counter(
+    "btag_github_sync_bytes_total", "GitHub'a yüklenen bayt", ("operation",))
+EXCEL_INGEST = REGISTRY.counter(
+    "btag_excel_ingest_total", "Excel okuma / işleme / dışa aktarma işlemleri", ("stage", "status"))
+EXCEL_SECONDS = REGISTRY.histogram(
+    "btag_excel_ingest_seconds", "Excel işlem süresi", ("stage",))
+JSON_FILE_OPERATIONS = REGISTRY.counter(
+    "btag_json_file_operations_total", "JSON dosya okuma / yazma", ("file", "operation", "status"))
+JSON_FILE_SECONDS = REGISTRY.histogram(
+    "btag_json_file_seconds", "JSON dosya okuma / yazma süresi", ("file", "operation"))
+JSON_FILE_BYTES = REGISTRY.counter(
+    "btag_json_file_bytes_total", "JSON dosya okuma / yazma baytı", ("file", "operation"))
+DAILY_RECORDS = REGISTRY.counter(
+    "btag_daily_records_saved_total", "daily_data.json'a kaydedilen günlük kayıt", ("btag",))
+REPORT_CACHE = REGISTRY.counter(
+    "btag_report_cache_requests_total", "Rapor önbelleği istekleri", ("report", "result"))
+FIGURE_CACHE = REGISTRY.counter(
+    "btag_figure_cache_requests_total", "Grafik önbelleği istekleri", ("chart", "result"))
+
+# perf aşama adı → backoffice uç noktası
+BACKOFFICE_ENDPOINTS = {"client": "GetClientById", "kpi": "GetClientKpis"}
+
+
+def _status(info: dict) -> str:
+    return str(info.get("status", "ok"))
+
+
+def _on_stage(name: str, seconds: float, info: dict):
+    """perf aşamalarını metriklere çevir"""
+    group, _, rest = name.partition(".")
+    if group == "api":
+        endpoint = BACKOFFICE_ENDPOINTS.get(rest, rest)
+        BACKOFFICE_REQUESTS.inc(endpoint=endpoint, status=_status(info))
+        BACKOFFICE_SECONDS.observe(seconds, endpoint=endpoint)
+    elif group == "github":
+        GITHUB_OPERATIONS.inc(operation=rest, status=_status(info))
+        GITHUB_SECONDS.observe(seconds, operation=rest)
+        if info.get("bytes"):
+            GITHUB_BYTES.inc(info["bytes"], operation=rest)
+    elif group == "excel":
+        EXCEL_INGEST.inc(stage=rest, status=_status(info))
+        EXCEL_SECONDS.observe(seconds, stage=rest)
+    elif group == "json":
+        operation, _, file = rest.partition(".")
+        JSON_FILE_OPERATIONS.inc(file=file, operation=operation, status=_status(info))
+        JSON_FILE_SECONDS.observe(seconds, file=file, operation=operation)
+        if info.get("bytes"):
+            JSON_FILE_BYTES.inc(info["bytes"], file=file, operation=operation)
+        if info.get("btag") is not None and info.get("status") is None:
+            DAILY_RECORDS.inc(info.get("records", 0), btag=info["btag"])
+
+
+perf.add_listener(_on_stage)
+
+
+def record_cache(report: str, hit: bool):
+    REPORT_CACHE.inc(report=report, result="hit" if hit else "miss")
+
+
+def record_figure_cache(chart: str, hit: bool):
+    FIGURE_CACHE.inc(chart=chart, result="hit" if hit else "miss")
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+def write_file(path: str):
+    """Metrikleri dosyaya atomik olarak yaz (node_exporter textfile collector ile uyumlu)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp_path, path)
+
+
+_started = {}
+_start_lock = threading.Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):  # sessiz
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        payload = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def start_http_server(port: int, host: str = "0.0.0.0") -> Optional[ThreadingHTTPServer]:
+    """/metrics uç noktasını arka plan thread'inde başlat (süreç başına bir kez)"""
+    with _start_lock:
+        if "http" in _started:
+            return _started["http"]
+        try:
+            server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError:
+            return None  # Port başka bir süreçte açık (örn. ikinci Streamlit süreci)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True, name="metrics-http").start()
+        _started["http"] = server
+        return server
+
+
+def start_file_writer(path: str, interval: float = DEFAULT_FILE_INTERVAL) -> threading.Thread:
+    """Metrikleri interval saniyede bir path dosyasına yazan arka plan thread'i"""
+    with _start_lock:
+        if "file" in _started:
+            return _started["file"]
+
+        def loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    write_file(path)
+                except OSError:
+                    pass
+
+        thread = threading.Thread(target=loop, daemon=True, name="metrics-file")
+        thread.start()
+        _started["file"] = thread
+        return thread
+
+
+def start_from_env():
+    """ENV BTAG_METRICS_PORT ve / veya BTAG_METRICS_FILE tanımlıysa dışa aktarımı başlat"""
+    port = os.environ.get("BTAG_METRICS_PORT")
+    if port:
+        start_http_server(int(port))
+    path = os.environ.get("BTAG_METRICS_FILE")
+    if path:
+        start_file_writer(path, float(os.environ.get("BTAG_METRICS_INTERVAL", DEFAULT_FILE_INTERVAL)))
@@ -0,0 +1,197 @@
+"""
+Perf: Sıcak yollar için hafif süre / adet / bayt ölçümü.
+- stage(name): with bloğunun süresini kaydeder; bloğa verilen sözlükteki "bytes" alanı
+  okunan / yazılan / aktarılan bayt sayısı olarak eklenir
+- timed(name): aynı ölçümü fonksiyonun tamamı için yapan dekoratör
+- rerun(page) / begin_rerun / end_rerun: Streamlit sayfa çalıştırması (rerun) bazında döküm
+- summary(): aşama bazında toplam adet, süre, bayt ve son ölçümlerden p50 / p90 / p99
+- add_listener(fn): her ölçüm fn(name, seconds, info) ile bildirilir (metrics.py bunu kullanır);
+  info sözlüğüne çağıran "status", "btag" gibi etiketler ekleyebilir, istisnada status="error"
+Kayıtlar süreç belleğinde tutulur (tüm oturumlar ortak). Aşamalar iç içe olabilir;
+süreler kapsayıcıdır. ENV BTAG_PERF=0 ile bellek içi ölçüm kapatılır (dinleyiciler çalışmaya devam eder).
+"""
+import functools
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+ENABLED = os.environ.get("BTAG_PERF", "1") != "0"
+SAMPLE_SIZE = 500     # Yüzdelikler için aşama başına saklanan son ölçüm sayısı
+RERUN_HISTORY = 50    # Saklanan son rerun dökümü sayısı
+
+_lock = threading.Lock()
+_local = threading.local()
+_stats: Dict[str, dict] = {}
+_reruns = deque(maxlen=RERUN_HISTORY)
+_listeners: List[Callable] = []
+
+
+def add_listener(listener: Callable):
+    """listener(name, seconds, info) her ölçümde çağrılır (aynı fonksiyon bir kez eklenir)"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def _active() -> bool:
+    return ENABLED or bool(_listeners)
+
+
+def _record(name: str, seconds: float, info: dict):
+    for listener in _listeners:
+        try:
+            listener(name, seconds, info)
+        except Exception:
+            pass  # Ölçüm hiçbir zaman asıl işi bozmamalı
+
+    if not ENABLED:
+        return
+
+    nbytes = info.get("bytes") or 0
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = {"count": 0, "seconds": 0.0, "bytes": 0, "samples": deque(maxlen=SAMPLE_SIZE)}
+        stat["count"] += 1
+        stat["seconds"] += seconds
+        stat["bytes"] += nbytes
+        stat["samples"].append(seconds)
+
+    rerun = getattr(_local, "rerun", None)
+    if rerun is not None:
+        entry = rerun["stages"].setdefault(name, {"count": 0, "seconds": 0.0, "bytes": 0})
+        entry["count"] += 1
+        entry["seconds"] += seconds
+        entry["bytes"] += nbytes
+
+
+@contextmanager
+def stage(name: str, nbytes: int = 0):
+    """Bloğun süresini name aşamasına yaz.
+
+    with perf.stage("json.load.members") as s:
+        ...
+        s["bytes"] = os.path.getsize(path)
+    """
+    info = {"bytes": nbytes}
+    if not _active():
+        yield info
+        return
+    start = time.perf_counter()
+    try:
+        yield info
+    except BaseException:
+        info.setdefault("status", "error")
+        raise
+    finally:
+        _record(name, time.perf_counter() - start, info)
+
+
+def timed(name: Optional[str] = None):
+    """Fonksiyon çağrılarını ölçen dekoratör (ad verilmezse modül.fonksiyon)"""
+    def decorator(func):
+        stage_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _active():
+                return func(*args, **kwargs)
+            info = {"bytes": 0}
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                info["status"] = "error"
+                raise
+            finally:
+                _record(stage_name, time.perf_counter() - start, info)
+        return wrapper
+    return decorator
+
+
+def file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def begin_rerun(page: str):
+    """Bu thread'deki sayfa çalıştırmasını başlat (yarım kalan önceki çalıştırma kapatılır)"""
+    if getattr(_local, "rerun", None) is not None:
+        end_rerun(interrupted=True)
+    _local.rerun = {"page": page, "started_at": time.time(), "_start": time.perf_counter(), "stages": {}}
+
+
+def end_rerun(interrupted: bool = False):
+    """Çalıştırmayı kapat ve geçmişe ekle (st.rerun / st.stop ile kesilenler işaretlenir)"""
+    rerun = getattr(_local, "rerun", None)
+    if rerun is None:
+        return None
+    _local.rerun = None
+    rerun["seconds"] = time.perf_counter() - rerun.pop("_start")
+    rerun["interrupted"] = interrupted
+    with _lock:
+        _reruns.append(rerun)
+    return rerun
+
+
+@contextmanager
+def rerun(page: str):
+    """begin_rerun / end_rerun çifti; istisna ile kesilen çalıştırma işaretlenir"""
+    begin_rerun(page)
+    try:
+        yield
+    except BaseException:
+        # st.rerun / st.stop çalıştırmayı istisna ile keser
+        end_rerun(interrupted=True)
+        raise
+    end_rerun()
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """En yakın sıra yöntemiyle yüzdelik (q: 0-100)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered), math.ceil(q / 100 * len(ordered))) - 1)
+    return ordered[index]
+
+
+def summary() -> List[dict]:
+    """Aşama bazında toplamlar ve kayan yüzdelikler (toplam süreye göre azalan)"""
+    with _lock:
+        items = [(name, dict(stat, samples=list(stat["samples"]))) for name, stat in _stats.items()]
+
+    rows = []
+    for name, stat in items:
+        samples = stat["samples"]
+        rows.append({
+            "stage": name,
+            "count": stat["count"],
+            "total_ms": stat["seconds"] * 1000,
+            "bytes": stat["bytes"],
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p90_ms": percentile(samples, 90) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+        })
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def recent_reruns(page: Optional[str] = None) -> List[dict]:
+    """Son rerun dökümleri (en yenisi başta)"""
+    with _lock:
+        reruns = list(_reruns)
+    if page is not None:
+        reruns = [r for r in reruns if r["page"] == page]
+    return list(reversed(reruns))
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+        _reruns.clear()
@@ -0,0 +1,205 @@
+"""
+Profiling: Seçilen sayfanın sonraki N çalıştırmasını cProfile (ve isteğe bağlı tracemalloc) ile profiller.
+- arm(page, runs, memory): profillemeyi kur (Ayarlar → Profilleme ya da ENV BTAG_PROFILE)
+- profile_page(page): sayfa fonksiyonunu saran context manager; kurulu değilse maliyeti yok
+- Çıktılar .profiles/ altında zaman damgalı: <zaman>_<sayfa>.prof (pstats) ve .json özet
+  (en pahalı fonksiyonlar, en çok bellek ayıran satırlar, tepe bellek)
+- list_profiles / load_summary: özetleri uygulamada göstermek için
+
+ENV örneği: BTAG_PROFILE="statistics:3:mem" → İstatistikler sayfasının sonraki 3 çalıştırması,
+bellek ayırma noktalarıyla birlikte. Aynı anda yalnızca bir profil alınır.
+"""
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+DEFAULT_PROFILE_DIR = os.environ.get("BTAG_PROFILE_DIR", ".profiles")
+MAX_PROFILES = 50        # Bu sayının üzerindeki eski profiller silinir
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 20
+
+_lock = threading.Lock()
+_busy = threading.Lock()
+_armed: Dict[str, dict] = {}
+
+
+def arm(page: str, runs: int = 1, memory: bool = False):
+    """page sayfasının sonraki runs çalıştırmasını profille"""
+    with _lock:
+        if runs <= 0:
+            _armed.pop(page, None)
+        else:
+            _armed[page] = {"remaining": int(runs), "memory": bool(memory)}
+
+
+def disarm(page: Optional[str] = None):
+    with _lock:
+        if page is None:
+            _armed.clear()
+        else:
+            _armed.pop(page, None)
+
+
+def armed() -> Dict[str, dict]:
+    with _lock:
+        return {page: dict(state) for page, state in _armed.items()}
+
+
+def arm_from_env(value: Optional[str] = None):
+    """BTAG_PROFILE="sayfa:adet[:mem]" biçimindeki ayarı uygula"""
+    value = value if value is not None else os.environ.get("BTAG_PROFILE", "")
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        parts = item.split(":")
+        runs = int(parts[1]) if len(parts) > 1 and parts[1] else 1
+        arm(parts[0], runs, memory=len(parts) > 2 and parts[2] == "mem")
+
+
+def _take(page: str) -> Optional[dict]:
+    with _lock:
+        state = _armed.get(page)
+        if state is None:
+            return None
+        state["remaining"] -= 1
+        if state["remaining"] <= 0:
+            del _armed[page]
+        return {"memory": state["memory"]}
+
+
+def _function_rows(profiler: cProfile.Profile) -> List[dict]:
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, name), (primitive_calls, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            "function": name,
+            "location": f"{os.path.basename(filename)}:{line}" if line else filename,
+            "ncalls": calls,
+            "primitive_calls": primitive_calls,
+            "tottime": tottime,
+            "cumtime": cumtime,
+        })
+    rows.sort(key=lambda row: row["cumtime"], reverse=True)
+    return rows
+
+
+def _allocation_rows(snapshot) -> List[dict]:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    rows = []
+    for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+        frame = stat.traceback[0]
+        rows.append({
+            "location": f"{frame.filename}:{frame.lineno}",
+            "size_kb": stat.size / 1024,
+            "count": stat.count,
+        })
+    return rows
+
+
+def _prune(profile_dir: str):
+    summaries = sorted(name for name in os.listdir(profile_dir) if name.endswith(".json"))
+    for name in summaries[:-MAX_PROFILES]:
+        for ext in (".json", ".prof"):
+            try:
+                os.remove(os.path.join(profile_dir, name[:-5] + ext))
+            except OSError:
+                pass
+
+
+def _save(page: str, profiler: cProfile.Profile, seconds: float, allocations, peak_bytes,
+          profile_dir: str) -> str:
+    os.makedirs(profile_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    base = os.path.join(profile_dir, f"{stamp}_{page}")
+
+    profiler.dump_stats(base + ".prof")
+    functions = _function_rows(profiler)
+    summary = {
+        "page": page,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "seconds": seconds,
+        "total_calls": sum(row["ncalls"] for row in functions),
+        "by_cumulative": functions[:TOP_FUNCTIONS],
+        "by_tottime": sorted(functions, key=lambda row: row["tottime"], reverse=True)[:TOP_FUNCTIONS],
+        "allocations": allocations,
+        "peak_bytes": peak_bytes,
+        "prof_file": os.path.basename(base + ".prof"),
+    }
+    with open(base + ".json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    _prune(profile_dir)
+    return base + ".json"
+
+
+@contextmanager
+def profile_page(page: str, profile_dir: str = DEFAULT_PROFILE_DIR):
+    """Sayfa kuruluysa bloğu profille; değilse hiçbir şey yapma"""
+    if page not in _armed:
+        yield
+        return
+    if not _busy.acquire(blocking=False):
+        # Başka bir oturum şu an profil alıyor; bu çalıştırma sayılmaz
+        yield
+        return
+
+    try:
+        options = _take(page)
+        if options is None:
+            yield
+            return
+
+        memory = options["memory"]
+        started_tracing = memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(10)
+        if memory:
+            tracemalloc.reset_peak()
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            seconds = time.perf_counter() - start
+            allocations, peak_bytes = [], None
+            if memory:
+                allocations = _allocation_rows(tracemalloc.take_snapshot())
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+            try:
+                _save(page, profiler, seconds, allocations, peak_bytes, profile_dir)
+            except OSError:
+                pass
+    finally:
+        _busy.release()
+
+
+def list_profiles(profile_dir: str = DEFAULT_PROFILE_DIR, page: Optional[str] = None) -> List[str]:
+    """Kayıtlı profil özetlerinin yolları (en yenisi başta)"""
+    if not os.path.isdir(profile_dir):
+        return []
+    names = sorted((name for name in os.listdir(profile_dir) if name.endswith(".json")), reverse=True)
+    if page is not None:
+        names = [name for name in names if name.split("_", 1)[-1] == f"{page}.json"]
+    return [os.path.join(profile_dir, name) for name in names]
+
+
+def load_summary(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+arm_from_env()
@@ -0,0 +1,170 @@
+"""
+ReportCache: Üretilen rapor dosyalarını (XLSX/CSV/JSON) diskte saklar.
+- anahtar: (rapor türü, parametreler/tarih aralığı, veri sürümü)
+- veri sürümü kaynak dosyaların boyut + değişiklik zamanından ya da
+  DataFrame içeriğinin hash'inden üretilir; veri değişince anahtar da değişir
+- get_or_create isabet / ıskalamaları metrics'e (btag_report_cache_requests_total) yazılır
+- toplam boyut sınırı aşılınca en uzun süredir kullanılmayan dosyalar silinir (LRU)
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Optional
+
+import metrics
+
+DEFAULT_CACHE_DIR = ".report_cache"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200 MB
+
+
+def data_version(*paths: str) -> str:
+    """Dosyaların boyut ve değişiklik zamanından kısa bir sürüm hash'i üret"""
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+        except OSError:
+            digest.update(f"{path}:missing;".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def frame_version(df) -> str:
+    """DataFrame içeriğinden (sütunlar + değerler) sürüm hash'i üret"""
+    import pandas as pd
+
+    digest = hashlib.sha1()
+    digest.update(json.dumps([str(c) for c in df.columns], ensure_ascii=False).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+class ReportCache:
+    """Rapor çıktıları için boyut sınırlı disk önbelleği"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, report_type: str, params, version: str) -> str:
+        """Rapor türü, parametreler ve veri sürümünden dosya anahtarı üret"""
+        params_str = json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)
+        digest = hashlib.sha1(f"{report_type}|{params_str}|{version}".encode("utf-8")).hexdigest()
+        return f"{report_type}_{digest[:24]}"
+
+    def _path(self, key: str, ext: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{ext.lstrip('.')}")
+
+    def get(self, report_type: str, params, version: str, ext: str) -> Optional[bytes]:
+        """Önbellekteki raporu döndür, yoksa None"""
+        path = self._path(self.make_key(report_type, params, version), ext)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        # LRU için son kullanım zamanını güncelle
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return content
+
+    def put(self, report_type: str, params, version: str, ext: str, content: bytes) -> str:
+        """Raporu önbelleğe yaz ve gerekirse eski dosyaları temizle"""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        path = self._path(self.make_key(report_type, params, version), ext)
+
+        # Yarım yazılmış dosya okunmasın diye geçici dosyaya yazıp taşı
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+        return path
+
+    def get_or_create(self, report_type: str, params, version: str, ext: str,
+                      builder: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        """Önbellekte varsa döndür, yoksa builder ile üretip önbelleğe al.
+
+        builder None döndürürse (üretim hatası) sonuç önbelleğe yazılmaz.
+        """
+        content = self.get(report_type, params, version, ext)
+        metrics.record_cache(report_type, content is not None)
+        if content is not None:
+            return content
+
+        content = builder()
+        if content is None:
+            return None
+
+        try:
+            self.put(report_type, params, version, ext, content)
+        except OSError:
+            # Önbellek yazılamazsa rapor yine de döndürülür
+            pass
+        return content.encode("utf-8") if isinstance(content, str) else content
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """Toplam boyut sınırı aşıldıysa en eski kullanılan dosyaları sil"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                continue
+
+        return removed
+
+    def clear(self) -> int:
+        """Tüm önbelleği temizle"""
+        removed = 0
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def stats(self) -> dict:
+        """Önbellek dosya sayısı ve toplam boyutu"""
+        entries = self._entries()
+        return {
+            "files": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "oldest": time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(min(e[0] for e in entries))) if entries else None
+        }
@@ -0,0 +1,220 @@
+"""
+Serializer: JSON kodlama / çözme katmanı.
+- Kodlayıcı sırası: orjson → msgspec → stdlib json (BACKEND hangisinin kullanıldığını söyler)
+- dumps(obj): diskte kompakt UTF-8 (boşluksuz); pretty=True yalnızca dışa aktarım / insan okuması için
+- loads(data): hızlı kodlayıcının reddettiği eski içerik (örn. NaN) stdlib json ile okunur
+- Şemalar: DailyRecord, CashbackRecord, CashbackEntry (üye şeması member_model.Member) —
+  schema() msgspec varsa Struct, yoksa __slots__'lu dataclass üretir; decode / convert / load_typed
+  ile doğrudan bu tiplere çözülür (bilinmeyen alanlar atlanır, eksik alanlar varsayılan değeri alır)
+"""
+import dataclasses
+import importlib.util
+import json
+import math
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
+
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+else:
+    orjson = None
+
+if importlib.util.find_spec("msgspec") is not None:
+    import msgspec
+else:
+    msgspec = None
+
+BACKEND = "orjson" if orjson else "msgspec" if msgspec else "json"
+
+if msgspec is not None:
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=lambda obj: _default(obj))
+    _msgspec_decoder = msgspec.json.Decoder()
+
+
+def _default(obj):
+    """Kodlayıcının tanımadığı değerler: numpy / pandas sayıları, tarihler, şema nesneleri"""
+    if msgspec is not None and isinstance(obj, msgspec.Struct):
+        return msgspec.to_builtins(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return to_builtins(obj)
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "item"):
+        value = obj.item()
+        return None if isinstance(value, float) and math.isnan(value) else value
+    raise TypeError(f"JSON'a çevrilemeyen tip: {type(obj).__name__}")
+
+
+def _key(key) -> str:
+    """Sözlük anahtarını orjson OPT_NON_STR_KEYS ile aynı metne çevir"""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, bool) or key is None:
+        return json.dumps(key)
+    if hasattr(key, "isoformat"):
+        return key.isoformat()
+    return str(key)
+
+
+def _str_keys(obj):
+    """İç içe sözlüklerin anahtarlarını metne çevir (msgspec / stdlib json yedeği için)"""
+    if isinstance(obj, dict):
+        return {_key(key): _str_keys(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_str_keys(value) for value in obj]
+    return obj
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """obj'yi UTF-8 JSON'a çevir (kompakt; pretty=True → 2 boşluk girintili).
+    Metin olmayan sözlük anahtarları (int, tarih ...) her kodlayıcıda aynı biçimde metne çevrilir."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    try:
+        return _dumps_fallback(obj, pretty)
+    except TypeError:
+        return _dumps_fallback(_str_keys(obj), pretty)
+
+
+def _dumps_fallback(obj, pretty: bool) -> bytes:
+    if msgspec is not None:
+        payload = _msgspec_encoder.encode(obj)
+        return msgspec.json.format(payload, indent=2) if pretty else payload
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_default).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN / Infinity içeren eski dosyalar
+    elif msgspec is not None:
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_file(path: str):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+# --- Şemalar -------------------------------------------------------------------------------------
+
+def schema(name: str, fields, rename: Optional[Dict[str, str]] = None, module: str = __name__):
+    """(alan, tip, varsayılan) listesinden msgspec Struct ya da slots dataclass üret"""
+    rename = rename or {}
+    if msgspec is not None:
+        cls = msgspec.defstruct(name, fields, rename=rename or None, module=module)
+    else:
+        spec = [(field, tp, dataclasses.field(default_factory=type(default))
+                 if isinstance(default, (list, dict)) else default)
+                for field, tp, default in fields]
+        cls = dataclasses.make_dataclass(name, spec, slots=True)
+        cls.__module__ = module
+    cls.__json_names__ = {field: rename.get(field, field) for field, _, _ in fields}
+    return cls
+
+
+DailyRecord = schema("DailyRecord", [
+    ("member_id", str, ""),
+    ("username", str, ""),
+    ("customer_name", str, ""),
+    ("deposit_count", Optional[int], 0),
+    ("total_deposits", Optional[float], 0.0),
+    ("withdrawal_count", Optional[int], 0),
+    ("total_withdrawals", Optional[float], 0.0),
+])
+
+CashbackRecord = schema("CashbackRecord", [
+    ("customer_id", Optional[int], None),
+    ("customer_name", str, ""),
+    ("count", Optional[int], 0),
+    ("amount", Optional[float], 0.0),
+], rename={"customer_id": "Müşteri_Kimliği", "customer_name": "Müşteri_Adı",
+           "count": "Adet", "amount": "Toplam_Miktar"})
+
+CashbackEntry = schema("CashbackEntry", [
+    ("date", str, ""),
+    ("timestamp", str, ""),
+    ("data", List[CashbackRecord], []),
+])
+
+# Dosya içerikleri
+DailyData = Dict[str, Dict[str, List[DailyRecord]]]
+CashbackHistory = List[CashbackEntry]
+
+
+def _is_schema(tp) -> bool:
+    return isinstance(tp, type) and hasattr(tp, "__json_names__")
+
+
+def _build(value, tp):
+    """convert'in msgspec olmadan çalışan karşılığı"""
+    origin = get_origin(tp)
+    if origin in (list, List):
+        (item_type,) = get_args(tp)
+        return [_build(item, item_type) for item in value or []]
+    if origin in (dict, Dict):
+        _, value_type = get_args(tp)
+        return {key: _build(item, value_type) for key, item in (value or {}).items()}
+    if origin is Union:
+        inner = [arg for arg in get_args(tp) if arg is not type(None)]
+        return None if value is None else _build(value, inner[0])
+    if _is_schema(tp):
+        field_types = {field.name: field.type for field in dataclasses.fields(tp)}
+        kwargs = {}
+        for field, json_name in tp.__json_names__.items():
+            if json_name in value:
+                kwargs[field] = _build(value[json_name], field_types[field])
+        return tp(**kwargs)
+    if tp is int and isinstance(value, float) and value.is_integer():
+        return int(value)
+    if tp is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def convert(obj, tp):
+    """Ayrıştırılmış JSON'u (dict / list) tp şemasına çevir"""
+    if msgspec is not None:
+        return msgspec.convert(obj, tp, strict=False)
+    return _build(obj, tp)
+
+
+def decode(data: Union[bytes, str], tp):
+    """JSON metnini doğrudan tp şemasına çöz (msgspec varsa ara dict oluşmaz)"""
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(data, type=tp, strict=False)
+        except msgspec.DecodeError:
+            pass  # NaN içeren eski dosyalar
+    return convert(loads(data), tp)
+
+
+def load_typed(path: str, tp, default=None):
+    try:
+        with open(path, "rb") as f:
+            return decode(f.read(), tp)
+    except FileNotFoundError:
+        return default
+
+
+def to_builtins(obj) -> Any:
+    """Şema nesnelerini (iç içe) dict / list'e çevir; JSON alan adları korunur"""
+    if msgspec is not None:
+        return msgspec.to_builtins(obj)
+    if isinstance(obj, list):
+        return [to_builtins(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: to_builtins(item) for key, item in obj.items()}
+    if _is_schema(type(obj)):
+        return {json_name: to_builtins(getattr(obj, field)) for field, json_name in type(obj).__json_names__.items()}
+    return obj
@@ -0,0 +1,150 @@
+"""
+Sketches: Sabit boyutlu, birleştirilebilir özetler (gösterge panelinin sabit süreli okumaları için).
+- HyperLogLog: tekil eleman sayısı tahmini; 2^p kayıt (p=12: 4 KB, ~%1.6 standart hata). Günlük
+  özetler kayıt bazında maksimum alınarak birleştirilir (tüm dizi tek tamsayı işlemiyle), yani N günün
+  tekil müşterisi günlerin müşteri kümeleri dolaşılmadan hesaplanır. Küçük sayılarda doğrusal sayım
+  kullanılır (pratikte tam sonuç)
+- QuantileSketch: DDSketch tarzı log kovalı dağılım özeti (%1 göreli hata); yüzdelik ve histogram
+  okunur, günlük özetler kova sayıları toplanarak birleştirilir
+- Hash: blake2b (8 bayt) ile oturumdan bağımsız; Python'un hash()'i int'lerde dağılmaz ve
+  str'lerde süreç başına değişir
+"""
+import hashlib
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+HLL_PRECISION = 12
+QUANTILE_ACCURACY = 0.01
+_INVERSE_POWERS = [2.0 ** -rank for rank in range(65)]
+
+
+def hash64(value) -> int:
+    return int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _bytewise_max(a: bytes, b: bytes) -> bytes:
+    """Bayt bazında max; kayıtlar < 128 olduğundan dizi tek bir büyük tamsayı işlemiyle karşılaştırılır"""
+    high = int.from_bytes(b"\x80" * len(a), "little")
+    x, y = int.from_bytes(a, "little"), int.from_bytes(b, "little")
+    # Her baytta (x | 0x80) - y >= 1 olduğundan ödünç komşu bayta geçmez; 0x80 biti x >= y demektir
+    mask = (((x | high) - y) & high) >> 7
+    mask *= 0xFF
+    return ((x & mask) | (y & ~mask)).to_bytes(len(a), "little")
+
+
+class HyperLogLog:
+    """Tekil eleman sayısı tahmini"""
+
+    __slots__ = ("p", "registers")
+
+    def __init__(self, p: int = HLL_PRECISION, values: Iterable = ()):
+        self.p = p
+        self.registers = bytearray(1 << p)
+        for value in values:
+            self.add(value)
+
+    def add(self, value):
+        h = hash64(value)
+        index = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1  # İlk 1 bitinin konumu
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, other: "HyperLogLog"):
+        """Başka bir özeti bununla birleştir (aynı p olmalı)"""
+        if other.p != self.p:
+            raise ValueError(f"HyperLogLog hassasiyetleri farklı: {self.p} != {other.p}")
+        self.registers = bytearray(_bytewise_max(self.registers, other.registers))
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / math.fsum(map(_INVERSE_POWERS.__getitem__, self.registers))
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # Doğrusal sayım
+        return int(round(estimate))
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+class QuantileSketch:
+    """Göreli hata garantili dağılım özeti (DDSketch): değerler log ölçekli kovalarda sayılır.
+
+    Her kova [gamma^(k-1), gamma^k) aralığıdır; kovadan okunan değerin göreli hatası en fazla
+    relative_accuracy'dir. Özetler kova bazında toplanarak birleştirilir (sıra ve gün sayısından bağımsız).
+    """
+
+    __slots__ = ("relative_accuracy", "_log_gamma", "buckets", "zeros", "count", "min", "max")
+
+    def __init__(self, relative_accuracy: float = QUANTILE_ACCURACY, values: Iterable = ()):
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.buckets: Dict[int, int] = {}
+        self.zeros = 0  # Pozitif olmayan değerler (tutarlar için 0) ayrı sayılır
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        for value in values:
+            self.add(value)
+
+    def add(self, value: float, weight: int = 1):
+        if value > 0:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + weight
+        else:
+            self.zeros += weight
+        self.count += weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def update(self, other: "QuantileSketch"):
+        """Başka bir özeti bununla birleştir (aynı relative_accuracy olmalı)"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(f"QuantileSketch hassasiyetleri farklı: {self.relative_accuracy} != "
+                             f"{other.relative_accuracy}")
+        buckets = self.buckets
+        for key, weight in other.buckets.items():
+            buckets[key] = buckets.get(key, 0) + weight
+        self.zeros += other.zeros
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def _value(self, key: int) -> float:
+        """Kovanın temsil değeri (göreli hatayı en aza indiren nokta)"""
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma ** key / (gamma + 1)
+
+    def _weighted_values(self) -> List[Tuple[float, int]]:
+        values = [(0.0, self.zeros)] if self.zeros else []
+        values.extend((self._value(key), self.buckets[key]) for key in sorted(self.buckets))
+        return values
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q (0-1) yüzdeliğindeki değer; özet boşsa None"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, weight in self._weighted_values():
+            seen += weight
+            if seen > rank:
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def histogram(self, nbins: int = 20) -> List[Tuple[float, float, int]]:
+        """[min, max] aralığında eşit genişlikli nbins kutu: (alt sınır, üst sınır, adet)"""
+        if not self.count:
+            return []
+        low, high = self.min, self.max
+        width = (high - low) / nbins or 1.0
+        counts = [0] * nbins
+        for value, weight in self._weighted_values():
+            position = int((min(max(value, low), high) - low) / width)
+            counts[min(position, nbins - 1)] += weight
+        return [(low + i * width, low + (i + 1) * width, counts[i]) for i in range(nbins)]
@@ -0,0 +1,238 @@
+"""
+Storage: JSON veri dosyaları için çökmeye dayanıklı, eşzamanlı oturumlara güvenli kayıt.
+- atomic_write: içerik aynı dizinde geçici dosyaya yazılır, fsync edilir ve os.replace ile
+  hedefin yerine konur; okuyucular ya eski ya yeni dosyayı eksiksiz görür, yarım dosya oluşmaz
+- file_lock: <dosya>.lock üzerinde danışma kilidi (POSIX fcntl.flock, Windows msvcrt);
+  ikisi de yoksa yalnızca süreç içi kilit
+- file_version: dosyanın sürüm damgası (inode + değişiklik zamanı + boyut)
+- write_json(expected_version=...): iyimser kontrol; dosya okunduğundan beri değiştiyse ConflictError
+- İçerik serializer ile kompakt kodlanır (pretty=True yalnızca insan okuması gereken dosyalar için)
+- update_json(path, mutate): oku → değiştir → yaz. Okuma ve değişiklik kilitsiz yapılır, kilit yalnızca
+  sürüm kontrolü ve yeniden adlandırma süresince tutulur; araya başka bir yazma girdiyse
+  değişiklik güncel veriye yeniden uygulanır (kayıp güncelleme olmaz); on_write ile yazılan sürüm bildirilir
+Kilitler dosya bazındadır; farklı dosyalara yazan oturumlar birbirini beklemez.
+"""
+import copy
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional, Tuple
+
+import serializer
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+DEFAULT_LOCK_TIMEOUT = 10.0   # Kilit için en fazla bekleme (saniye)
+DEFAULT_RETRIES = 5           # update_json'da kilitsiz deneme sayısı; sonra kilit altında yapılır
+LOCK_POLL_INTERVAL = 0.01
+
+_local_locks = {}
+_local_locks_guard = threading.Lock()
+
+
+class ConflictError(Exception):
+    """Dosya, okunduğu sürümden bu yana başka bir oturum tarafından değiştirildi"""
+
+    def __init__(self, path: str, expected: Optional[str], actual: Optional[str]):
+        super().__init__(f"{path} başka bir oturum tarafından değiştirildi (beklenen {expected}, mevcut {actual})")
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+
+
+def _local_lock(path: str) -> threading.Lock:
+    key = os.path.abspath(path)
+    with _local_locks_guard:
+        lock = _local_locks.get(key)
+        if lock is None:
+            lock = _local_locks[key] = threading.Lock()
+        return lock
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fd: int):
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+
+
+@contextmanager
+def file_lock(path: str, timeout: float = DEFAULT_LOCK_TIMEOUT):
+    """path için özel (exclusive) danışma kilidi; timeout aşılırsa TimeoutError"""
+    deadline = time.monotonic() + timeout
+    local = _local_lock(path)
+    if not local.acquire(timeout=timeout):
+        raise TimeoutError(f"{path} kilidi alınamadı")
+    try:
+        fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while not _try_lock(fd):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{path} kilidi alınamadı")
+                time.sleep(LOCK_POLL_INTERVAL)
+            try:
+                yield
+            finally:
+                _unlock(fd)
+        finally:
+            os.close(fd)
+    finally:
+        local.release()
+
+
+def file_version(path: str) -> Optional[str]:
+    """Dosyanın sürüm damgası; dosya yoksa None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _fsync_dir(directory: str):
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows'ta dizin fsync'i yok
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: str, data: bytes) -> int:
+    """data'yı path'e atomik olarak yaz (geçici dosya + fsync + os.replace); yazılan bayt sayısı"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            try:
+                os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+            except OSError:
+                pass
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+    return len(data)
+
+
+def encode_json(data, pretty: bool = False) -> bytes:
+    return serializer.dumps(data, pretty=pretty)
+
+
+def read_json(path: str, default=None) -> Tuple[object, Optional[str]]:
+    """(içerik, sürüm); dosya yoksa (default, None)"""
+    while True:
+        version = file_version(path)
+        if version is None:
+            return copy.deepcopy(default), None
+        try:
+            with open(path, "rb") as f:
+                data = serializer.loads(f.read())
+        except FileNotFoundError:
+            continue
+        # Okuma sırasında dosya değiştiyse sürüm içerikle eşleşmez; yeniden oku
+        if file_version(path) == version:
+            return data, version
+
+
+def write_json(path: str, data, expected_version: Optional[str] = None, pretty: bool = False,
+               check: bool = False) -> Tuple[int, Optional[str]]:
+    """data'yı atomik olarak yaz; (bayt, yeni sürüm).
+
+    check=True (ya da expected_version verilmişse) dosyanın sürümü expected_version değilse
+    ConflictError yükselir; expected_version=None + check=True "dosya henüz yok" demektir.
+    """
+    payload = encode_json(data, pretty)
+    with file_lock(path):
+        if check or expected_version is not None:
+            actual = file_version(path)
+            if actual != expected_version:
+                raise ConflictError(path, expected_version, actual)
+        nbytes = atomic_write(path, payload)
+        return nbytes, file_version(path)
+
+
+def ensure_json(path: str, default):
+    """Dosya yoksa default içerikle oluştur (aynı anda oluşturan oturumlar birbirini ezmez)"""
+    if os.path.exists(path):
+        return
+    try:
+        write_json(path, default, check=True)
+    except ConflictError:
+        pass  # Bu arada başka bir oturum oluşturdu
+
+
+def update_json(path: str, mutate: Callable, default=None, pretty: bool = False,
+                retries: int = DEFAULT_RETRIES, on_write: Optional[Callable] = None) -> Optional[int]:
+    """Okuma-değiştirme-yazma; yazılan bayt sayısı, mutate None döndürdüyse (yazma yok) None.
+
+    mutate(data) yeni içeriği döndürür. Araya başka bir yazma girerse mutate güncel veriyle
+    yeniden çağrılır; bu yüzden yan etkisiz olmalıdır.
+    on_write(new_data, base_version, new_version): yazma başarılı olunca çağrılır; base_version
+    değişikliğin uygulandığı sürümdür (bellek içi önbellekleri artımlı güncellemek için).
+    """
+    for _ in range(retries):
+        data, version = read_json(path, default)
+        new_data = mutate(data)
+        if new_data is None:
+            return None
+        try:
+            nbytes, new_version = write_json(path, new_data, expected_version=version, pretty=pretty, check=True)
+        except ConflictError:
+            continue
+        if on_write is not None:
+            on_write(new_data, version, new_version)
+        return nbytes
+
+    # Yoğun çekişme: son deneme baştan sona kilit altında
+    with file_lock(path):
+        data, version = read_json(path, default)
+        new_data = mutate(data)
+        if new_data is None:
+            return None
+        nbytes = atomic_write(path, encode_json(new_data, pretty))
+        new_version = file_version(path)
+    if on_write is not None:
+        on_write(new_data, version, new_version)
+    return nbytes
@@ -0,0 +1,66 @@
+"""
+StreamlitReporter: events.Reporter olaylarını Streamlit bileşenlerine çevirir.
+- error / warning / info / success → st.error / st.warning / st.info / st.success
+- progress → st.progress + durum metni (ilk çağrıda oluşturulur)
+- spinner → st.spinner
+- success olayında celebrate=True ise st.balloons
+Worker thread'lerinde doğrudan kullanılamaz; orada events.QueueReporter kullanılır.
+"""
+from contextlib import contextmanager
+
+import streamlit as st
+
+from events import Reporter
+
+
+class StreamlitReporter(Reporter):
+    """UI sınıflarının çekirdek katmana verdiği raporlayıcı"""
+
+    def __init__(self):
+        self._progress_bar = None
+        self._status_text = None
+
+    def emit(self, event: dict):
+        level = event.get("level")
+        message = event.get("message", "")
+
+        if level == "progress":
+            self._show_progress(event)
+            return
+
+        show = {
+            "error": st.error,
+            "warning": st.warning,
+            "info": st.info,
+            "success": st.success,
+        }.get(level)
+        if show is None:
+            return
+        if message:
+            show(message)
+        if level == "success" and event.get("celebrate"):
+            st.balloons()
+        if level == "error" and event.get("detail"):
+            st.error(f"📋 Hata detayı: {event['detail']}")
+
+    def _show_progress(self, event: dict):
+        if self._progress_bar is None:
+            self._progress_bar = st.progress(0)
+            self._status_text = st.empty()
+
+        total = event.get("total") or 1
+        self._progress_bar.progress(min(1.0, event.get("done", 0) / total))
+        if event.get("message"):
+            self._status_text.text(event["message"])
+
+    def progress_done(self):
+        if self._progress_bar is not None:
+            self._progress_bar.empty()
+            self._status_text.empty()
+        self._progress_bar = None
+        self._status_text = None
+
+    @contextmanager
+    def spinner(self, message: str):
+        with st.spinner(message):
+            yield
@@ -0,0 +1,157 @@
+"""
+Artımlı önbellek testleri: yazma sonrası önbellekteki indeksler dosyadan yeniden kurulanlarla aynı olmalı.
+- MemberService yazmaları → member_model / member_views / member_search
+- DailyDataStore.save_daily_data → member_history
+- CashbackStore.save_to_json → cashback_index
+- MemberViews.page, analytics.filter_members + sort_members ile aynı sırayı vermeli
+"""
+import os
+import shutil
+from datetime import date
+
+import pytest
+
+import analytics
+import cashback_index
+import member_history
+import member_model
+import member_search
+import member_views
+import serializer
+from btag_core import DailyDataStore, MemberService, TokenStore
+from cashback_core import CashbackStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name in ("members.json", "daily_data.json", "CashBack.json"):
+        shutil.copy(os.path.join(ROOT, name), tmp_path / name)
+    for module in (member_model, member_views, member_search, member_history, cashback_index):
+        module._cache.clear()
+    yield tmp_path
+    for module in (member_model, member_views, member_search, member_history, cashback_index):
+        module._cache.clear()
+
+
+@pytest.fixture
+def service(data_dir):
+    members_file = str(data_dir / "members.json")
+    return MemberService(members_file=members_file, token_manager=TokenStore(token_file=str(data_dir / "token.json")),
+                         data_processor=DailyDataStore(daily_data_file=str(data_dir / "daily_data.json"),
+                                                       members_file=members_file))
+
+
+def _member_state(path):
+    """Tablo, görünüm sayfaları ve arama sonuçları (üye ID'leriyle)"""
+    table = member_model.load_table(path)
+    views = member_views.load_views(path)
+    index = member_search.load_index(path, table)
+    ids = [m.member_id for m in table.members]
+    pages = {(sort_by, status): [ids[i] for i in views.page(sort_by, status, 0, len(table))[0]]
+             for sort_by in member_views.SORT_KEYS for status in member_views.STATUS_FILTERS}
+    queries = [table.members[0].full_name, table.members[-1].username, "ali", "yeni uye"]
+    searches = {query: [ids[i] for i in index.search(query)] for query in queries}
+    return serializer.to_builtins(table.members), pages, searches
+
+
+def _fresh_member_state(path):
+    for module in (member_model, member_views, member_search):
+        module._cache.clear()
+    return _member_state(path)
+
+
+def _assert_pages_match_analytics(path):
+    table = member_model.load_table(path)
+    views = member_views.load_views(path)
+    members = serializer.to_builtins(table.members)
+    for sort_by in member_views.SORT_KEYS:
+        for status in member_views.STATUS_FILTERS:
+            expected = analytics.sort_members(analytics.filter_members(list(members), "", status), sort_by)
+            indices, total = views.page(sort_by, status, 0, len(table))
+            assert total == len(expected)
+            assert [table.members[i].member_id for i in indices] == [m["member_id"] for m in expected], \
+                (sort_by, status)
+
+
+def test_member_writes_match_fresh_load(service, monkeypatch):
+    path = service.members_file
+    key = os.path.abspath(path)
+    # API / KPI çağrıları ağa çıkar
+    monkeypatch.setattr(service, "fetch_member_api_data", lambda member_id: None)
+    monkeypatch.setattr(service, "update_member_kpis", lambda member_id: None)
+    member_ids = [m.member_id for m in member_model.load_table(path).members]
+    _member_state(path)
+
+    # İlk yazma normalize edilmemiş kayıtları da yeniden yazar: önbellek bırakılmalı
+    assert service.toggle_member_status(member_ids[0])
+    assert key not in member_model._cache
+    assert _member_state(path) == _fresh_member_state(path)
+
+    # Sonraki yazmalar artımlı uygulanır
+    writes = [
+        lambda: service.toggle_member_status(member_ids[1]),
+        lambda: service.update_member_api_data(member_ids[2], {"total_deposits": 1e9,
+                                                               "last_deposit_date": "2099-01-01T00:00:00"}),
+        lambda: service.add_member("999999999", "yeniuye", "Yeni Üye"),
+    ]
+    for write in writes:
+        table = member_model.load_table(path)
+        _member_state(path)
+        assert write()
+        assert member_model._cache[key][1] is not table
+        assert _member_state(path) == _fresh_member_state(path)
+    _assert_pages_match_analytics(path)
+
+
+def test_views_page_matches_analytics(data_dir):
+    _assert_pages_match_analytics(str(data_dir / "members.json"))
+
+
+def _history_state(index):
+    member_ids = sorted(index.member_ids())
+    stats = dict(index.range_statistics(date(2025, 8, 1), date(2025, 9, 30)))
+    for name in ("deposits", "withdrawals"):  # QuantileSketch: dağılımı karşılaştır
+        stats[name] = stats[name].histogram()
+    return (member_ids, {m: index.entries(m) for m in member_ids}, {m: index.totals(m) for m in member_ids}, stats)
+
+
+def test_daily_data_write_matches_fresh_load(data_dir):
+    path = str(data_dir / "daily_data.json")
+    store = DailyDataStore(daily_data_file=path, members_file=str(data_dir / "members.json"))
+    index = member_history.load_index(path)
+    date_str = sorted(index.daily_data)[-1]
+    btag = next(iter(index.daily_data[date_str]))
+    records = index.daily_data[date_str][btag]
+    new_record = dict(records[0], member_id="999999999", total_deposits=123.0)
+
+    assert store.save_daily_data(records[1:] + [new_record], btag, date_str)
+    assert store.save_daily_data([new_record], "1234567", date(2025, 9, 20))
+    cached = member_history._cache[os.path.abspath(path)][1]  # apply_write'ın yayımladığı kopya
+    assert cached is not index
+    assert member_history.load_index(path) is cached
+    member_history._cache.clear()
+    assert _history_state(cached) == _history_state(member_history.load_index(path))
+
+
+def _cashback_state(index):
+    customers = sorted(index.customers(), key=str)
+    return (customers, {c: index.totals(c) for c in customers}, index.summary(), index.day_totals(),
+            index.summary("2025-09-01", "2025-09-30"))
+
+
+def test_cashback_write_matches_fresh_load(data_dir):
+    store = CashbackStore(json_file=str(data_dir / "CashBack.json"))
+    index = store.get_customer_index()
+    history = serializer.load_file(store.json_file)
+    day = str(history[0]["date"]).split("_")[0]
+    records = history[0]["data"]
+    new_record = {"Müşteri_Kimliği": 999999999, "Müşteri_Adı": "Yeni Müşteri", "Adet": 2, "Toplam_Miktar": 750}
+
+    assert store.save_to_json(records[1:] + [new_record], date.fromisoformat(day))
+    assert store.save_to_json([new_record], date(2025, 10, 1))
+    cached = store.get_customer_index()
+    assert cached is index
+    cashback_index._cache.clear()
+    assert _cashback_state(cached) == _cashback_state(store.get_customer_index())
@@ -0,0 +1,62 @@
+"""
+Text Normalize: Türkçe kurallarına uygun metin anahtarları (arama ve eşleştirme için).
+- turkish_lower: İ → i, I → ı (str.lower "İ"yi "i̇" yapar, "I"yı "i" yapar; ikisi de Türkçe için yanlış)
+- fold: küçük harf + aksan katlama (ı/i, ş/s, ğ/g, ü/u, ö/o, ç/c aynı sayılır) + boşlukları tekleştirme;
+  "IŞIK", "Işık" ve "isik" aynı anahtara düşer. Sonuçlar önbelleklenir (aynı isimler tekrar tekrar
+  katlanmaz); gruplama / arama anahtarı sütunları bununla bir kez hesaplanır
+- clean: gösterim için yalnızca boşluk düzeltme ("Özlem  Ali " → "Özlem Ali"), harfler korunur
+- tokens: katlanmış metnin kelimeleri (harf / rakam dışındaki karakterlerden ve _ işaretinden bölünür)
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, List
+
+FOLD_CACHE_SIZE = 200_000   # Üye / müşteri isimleri için yeterli; aşılırsa en eski anahtarlar düşer
+
+_TURKISH_UPPER = str.maketrans({"İ": "i", "I": "ı"})
+_TURKISH_FOLD = str.maketrans({"ı": "i", "ş": "s", "ğ": "g", "ü": "u", "ö": "o", "ç": "c",
+                               "â": "a", "î": "i", "û": "u"})
+_WHITESPACE = re.compile(r"\s+")
+_TOKEN_SPLIT = re.compile(r"[\W_]+")
+
+
+def turkish_lower(text: str) -> str:
+    return text.translate(_TURKISH_UPPER).lower()
+
+
+@lru_cache(maxsize=FOLD_CACHE_SIZE)
+def _fold(text: str) -> str:
+    folded = turkish_lower(text).translate(_TURKISH_FOLD)
+    if not folded.isascii():
+        # Diğer aksanlı harfler (é, ñ ...): ayrıştırıp birleşik işaretleri at
+        folded = "".join(ch for ch in unicodedata.normalize("NFKD", folded) if not unicodedata.combining(ch))
+    return _WHITESPACE.sub(" ", folded).strip()
+
+
+def fold(text) -> str:
+    """Arama anahtarı: Türkçe küçük harf, aksansız, tek boşluklu, baş / son boşluksuz"""
+    if not text or text != text:  # None, "" ve NaN
+        return ""
+    return _fold(text if isinstance(text, str) else str(text))
+
+
+def fold_all(values: Iterable) -> List[str]:
+    """Değerlerin anahtar sütunu (kayıtların yanında tutulmak üzere)"""
+    return [fold(value) for value in values]
+
+
+def clean(text) -> str:
+    """Gösterim metni: boşluklar tekleştirilir ve kırpılır"""
+    if not text or text != text:
+        return ""
+    return _WHITESPACE.sub(" ", str(text)).strip()
+
+
+def split_words(folded: str) -> List[str]:
+    """Zaten katlanmış metni kelimelere böl"""
+    return [token for token in _TOKEN_SPLIT.split(folded) if token]
+
+
+def tokens(text) -> List[str]:
+    return split_words(fold(text))
@@ -8,11 +8,21 @@ Kullanım: from token_manager import TokenManager
 token = TokenManager.get_github_token()
 """
 import os
-try:
-    import streamlit as st
-    _HAS_STREAMLIT = True
-except Exception:
-    _HAS_STREAMLIT = False
+import sys
+
+
+def streamlit_secret(name: str):
+    """Streamlit zaten yüklüyse st.secrets'tan oku.
+
+    Streamlit burada import edilmez; CLI ve worker süreçlerinde sadece ENV kullanılır.
+    """
+    st = sys.modules.get("streamlit")
+    if st is None:
+        return None
+    try:
+        return st.secrets.get(name)
+    except Exception:
+        return None
 
 class TokenManager:
     @staticmethod
@@ -20,12 +30,7 @@ class TokenManager:
         """
         Öncelikle st.secrets, sonra ENV, sonra fallback.
         """
-        token = None
-        if _HAS_STREAMLIT:
-            try:
-                token = st.secrets.get("GITHUB_TOKEN")
-            except Exception:
-                token = None
+        token = streamlit_secret("GITHUB_TOKEN")
 
         if not token:
             token = os.getenv("GITHUB_TOKEN")
@@ -5,6 +5,8 @@ import pandas as pd
 from datetime import datetime, timedelta
 import io
 import base64
+from report_cache import ReportCache, frame_version
+import activity_log
 
 class Utils:
     """Yardımcı fonksiyonlar sınıfı"""
@@ -194,25 +196,40 @@ class Utils:
             return default
     
     @staticmethod
-    def create_download_link(df, filename, file_format="xlsx"):
+    def _frame_to_bytes(df, file_format):
+        """DataFrame'i istenen formatta byte olarak üret"""
+        if file_format == "xlsx":
+            output = io.BytesIO()
+            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+                df.to_excel(writer, index=False, sheet_name='Data')
+            return output.getvalue()
+        
+        csv = df.to_csv(index=False, encoding='utf-8-sig')
+        return csv.encode()
+    
+    @staticmethod
+    def create_download_link(df, filename, file_format="xlsx", cache=None):
         """DataFrame için download linki oluştur"""
         try:
-            if file_format.lower() == "xlsx":
-                output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                    df.to_excel(writer, index=False, sheet_name='Data')
-                excel_data = output.getvalue()
-                
-                b64 = base64.b64encode(excel_data).decode()
+            file_format = file_format.lower()
+            if file_format not in ("xlsx", "csv"):
+                return "Desteklenmeyen format"
+            
+            # Aynı içerik için dosya tekrar üretilmez, önbellekten okunur
+            report_cache = cache or ReportCache()
+            data = report_cache.get_or_create(
+                "download",
+                {},
+                frame_version(df),
+                file_format,
+                lambda: Utils._frame_to_bytes(df, file_format)
+            )
+            b64 = base64.b64encode(data).decode()
+            
+            if file_format == "xlsx":
                 href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}.xlsx">📥 {filename}.xlsx İndir</a>'
-                
-            elif file_format.lower() == "csv":
-                csv = df.to_csv(index=False, encoding='utf-8-sig')
-                b64 = base64.b64encode(csv.encode()).decode()
-                href = f'<a href="data:file/csv;base64,{b64}" download="{filename}.csv">📥 {filename}.csv İndir</a>'
-                
             else:
-                return "Desteklenmeyen format"
+                href = f'<a href="data:file/csv;base64,{b64}" download="{filename}.csv">📥 {filename}.csv İndir</a>'
             
             return href
         except Exception as e:
@@ -441,39 +458,21 @@ class Utils:
     
     @staticmethod
     def log_activity(activity_type, description, user_id=None):
-        """Aktivite logla"""
+        """Aktivite logla (activity_log.jsonl'e tamponlu, yalnızca sona ekleyerek)"""
         try:
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "type": activity_type,
-                "description": description,
-                "user_id": user_id or "system"
-            }
-            
-            log_file = "activity_log.json"
-            
-            # Mevcut logları yükle
-            if os.path.exists(log_file):
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    logs = json.load(f)
-            else:
-                logs = []
-            
-            # Yeni log ekle
-            logs.append(log_entry)
-            
-            # Son 1000 kaydı tut
-            if len(logs) > 1000:
-                logs = logs[-1000:]
-            
-            # Logları kaydet
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, ensure_ascii=False, indent=2)
-            
-            return True
+            return activity_log.log_activity(activity_type, description, user_id)
         except:
             return False
     
+    @staticmethod
+    def get_activity_logs(activity_type=None, user_id=None, start=None, end=None, limit=100):
+        """Aktivite kayıtlarını tür, kullanıcı ve zaman aralığına göre getir (en yenisi başta)"""
+        try:
+            return activity_log.query_activity(activity_type=activity_type, user_id=user_id,
+                                               start=start, end=end, limit=limit)
+        except:
+            return []
+    
     @staticmethod
     def get_system_health():
         """Sistem sağlığını kontrol et"""
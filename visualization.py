@@ -4,6 +4,9 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import streamlit as st
 from datetime import datetime, timedelta
+import chart_data as chart_data_utils
+import figure_cache
+import leaderboard
 
 class Visualization:
     """Veri görselleştirme sınıfı"""
@@ -39,76 +42,60 @@ class Visualization:
             if not chart_data:
                 return self.create_empty_chart("Veri bulunamadı")
             
-            df = pd.DataFrame(chart_data)
-            
-            # Alt grafikler oluştur
-            fig = make_subplots(
-                rows=2, cols=2,
-                subplot_titles=('Günlük Yatırımlar', 'Günlük Çekimler', 'Üye Sayısı', 'Net Tutar'),
-                specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                       [{"secondary_y": False}, {"secondary_y": False}]]
-            )
-            
-            # Yatırımlar grafiği
-            fig.add_trace(
-                go.Scatter(
-                    x=df['date'], 
-                    y=df['total_deposits'],
-                    mode='lines+markers',
-                    name='Yatırımlar',
-                    line=dict(color='green')
-                ),
-                row=1, col=1
-            )
-            
-            # Çekimler grafiği
-            fig.add_trace(
-                go.Scatter(
-                    x=df['date'], 
-                    y=df['total_withdrawals'],
-                    mode='lines+markers',
-                    name='Çekimler',
-                    line=dict(color='red')
-                ),
-                row=1, col=2
-            )
-            
-            # Üye sayısı grafiği
-            fig.add_trace(
-                go.Scatter(
-                    x=df['date'], 
-                    y=df['member_count'],
-                    mode='lines+markers',
-                    name='Üye Sayısı',
-                    line=dict(color='blue')
-                ),
-                row=2, col=1
-            )
-            
-            # Net tutar grafiği
-            fig.add_trace(
-                go.Scatter(
-                    x=df['date'], 
-                    y=df['net_amount'],
-                    mode='lines+markers',
-                    name='Net Tutar',
-                    line=dict(color='purple')
-                ),
-                row=2, col=2
-            )
-            
-            fig.update_layout(
-                height=600,
-                title_text="Günlük Performans Analizi",
-                showlegend=False
-            )
-            
-            return fig
+            return self._daily_performance_figure(pd.DataFrame(chart_data))
             
         except Exception as e:
             st.error(f"Grafik oluşturma hatası: {str(e)}")
             return self.create_empty_chart("Grafik oluşturulamadı")
     
+    @figure_cache.cached("daily_performance")
+    def _daily_performance_figure(self, df):
+        """(tarih, btag) satırlarından performans grafiği (girdinin hash'iyle önbelleğe alınır)"""
+        # Tarih başına toplam (BTag'ler birleşik); uzun aralıklarda hafta / ay çözünürlüğü
+        freq = chart_data_utils.resolution(df['date'])
+        df = chart_data_utils.aggregate(df, 'date', freq,
+                                        sums=['total_deposits', 'total_withdrawals', 'net_amount'],
+                                        means=['member_count'])
+        period = chart_data_utils.RESOLUTIONS[freq]
+        
+        # Alt grafikler oluştur
+        fig = make_subplots(
+            rows=2, cols=2,
+            subplot_titles=(f'{period} Yatırımlar', f'{period} Çekimler', 'Üye Sayısı (günlük ort.)',
+                            'Net Tutar'),
+            specs=[[{"secondary_y": False}, {"secondary_y": False}],
+                   [{"secondary_y": False}, {"secondary_y": False}]]
+        )
+        
+        panels = [
+            ('total_deposits', 'Yatırımlar', 'green', 1, 1),
+            ('total_withdrawals', 'Çekimler', 'red', 1, 2),
+            ('member_count', 'Üye Sayısı', 'blue', 2, 1),
+            ('net_amount', 'Net Tutar', 'purple', 2, 2),
+        ]
+        trace = chart_data_utils.scatter_trace(len(df) * len(panels))
+        for column, name, color, row, col in panels:
+            x, y = chart_data_utils.lttb(df['date'], df[column])
+            fig.add_trace(
+                trace(
+                    x=x,
+                    y=y,
+                    mode=chart_data_utils.line_mode(len(x)),
+                    name=name,
+                    line=dict(color=color)
+                ),
+                row=row, col=col
+            )
+        
+        fig.update_layout(
+            height=600,
+            title_text=f"{period} Performans Analizi",
+            showlegend=False
+        )
+        
+        return fig
+    
+    @figure_cache.cached("member_distribution")
     def create_member_distribution_charts(self, members):
         """Üye dağılım grafikleri oluştur"""
         try:
@@ -246,52 +233,58 @@ class Visualization:
             if not comparison_data:
                 return self.create_empty_chart("Karşılaştırma verisi bulunamadı")
             
-            df = pd.DataFrame(comparison_data)
-            
-            # BTag'lere göre renk ataması
-            unique_btags = df['btag'].unique()
-            colors = self.default_colors[:len(unique_btags)]
-            
-            fig = go.Figure()
-            
-            for i, btag in enumerate(unique_btags):
-                btag_data = df[df['btag'] == btag]
-                
-                fig.add_trace(
-                    go.Scatter(
-                        x=btag_data['date'],
-                        y=btag_data['total_deposits'],
-                        mode='lines+markers',
-                        name=f'BTag {btag}',
-                        line=dict(color=colors[i % len(colors)])
-                    )
-                )
-            
-            fig.update_layout(
-                title='BTag Karşılaştırma - Günlük Yatırımlar',
-                xaxis_title='Tarih',
-                yaxis_title='Toplam Yatırım (TRY)',
-                height=400
-            )
-            
-            return fig
+            return self._btag_comparison_figure(pd.DataFrame(comparison_data))
             
         except Exception as e:
             st.error(f"BTag karşılaştırma grafiği hatası: {str(e)}")
             return self.create_empty_chart("Grafik oluşturulamadı")
     
+    @figure_cache.cached("btag_comparison")
+    def _btag_comparison_figure(self, df):
+        """(tarih, btag) satırlarından karşılaştırma grafiği (girdinin hash'iyle önbelleğe alınır)"""
+        # BTag × dönem toplamları; uzun aralıklarda hafta / ay çözünürlüğü
+        freq = chart_data_utils.resolution(df['date'])
+        df = chart_data_utils.aggregate(df, 'date', freq, sums=['total_deposits'], by='btag')
+        
+        # BTag'lere göre renk ataması
+        unique_btags = df['btag'].unique()
+        colors = self.default_colors[:len(unique_btags)]
+        
+        fig = go.Figure()
+        trace = chart_data_utils.scatter_trace(len(df))
+        # Çok BTag'de toplam nokta bütçesi izlere bölünür
+        per_trace = max(chart_data_utils.MAX_POINTS * 4 // max(len(unique_btags), 1), 20)
+        
+        for i, (btag, btag_data) in enumerate(df.groupby('btag', sort=False)):
+            x, y = chart_data_utils.lttb(btag_data['date'], btag_data['total_deposits'], per_trace)
+            fig.add_trace(
+                trace(
+                    x=x,
+                    y=y,
+                    mode=chart_data_utils.line_mode(len(x)),
+                    name=f'BTag {btag}',
+                    line=dict(color=colors[i % len(colors)])
+                )
+            )
+        
+        fig.update_layout(
+            title=f'BTag Karşılaştırma - {chart_data_utils.RESOLUTIONS[freq]} Yatırımlar',
+            xaxis_title='Tarih',
+            yaxis_title='Toplam Yatırım (TRY)',
+            height=400
+        )
+        
+        return fig
+    
+    @figure_cache.cached("top_members")
     def create_top_members_chart(self, members, metric='total_deposits', top_n=10):
         """En iyi üyeler grafiği"""
         try:
             if not members:
                 return self.create_empty_chart("Üye verisi bulunamadı")
             
-            # Metrik değerlerine göre sırala
-            sorted_members = sorted(
-                members, 
-                key=lambda x: x.get(metric, 0), 
-                reverse=True
-            )[:top_n]
+            # Metrik değerlerine göre en iyi top_n üye (tam sıralama yapılmaz)
+            sorted_members = leaderboard.top_n(members, top_n, key=lambda x: x.get(metric, 0))
             
             names = [m.get('username', 'N/A') for m in sorted_members]
             values = [m.get(metric, 0) for m in sorted_members]
@@ -329,6 +322,7 @@ class Visualization:
             st.error(f"En iyi üyeler grafiği hatası: {str(e)}")
             return self.create_empty_chart("Grafik oluşturulamadı")
     
+    @figure_cache.cached("trend")
     def create_trend_chart(self, data, date_column, value_column, title="Trend Analizi"):
         """Trend grafiği oluştur"""
         try:
@@ -345,12 +339,13 @@ class Visualization:
             
             fig = go.Figure()
             
-            # Ana trend çizgisi
+            # Ana trend çizgisi (nokta bütçesini aşarsa LTTB ile şekli korunarak küçültülür)
+            x, y = chart_data_utils.lttb(df[date_column], df[value_column])
             fig.add_trace(
-                go.Scatter(
-                    x=df[date_column],
-                    y=df[value_column],
-                    mode='lines+markers',
+                chart_data_utils.scatter_trace(len(x))(
+                    x=x,
+                    y=y,
+                    mode=chart_data_utils.line_mode(len(x)),
                     name='Trend',
                     line=dict(color='blue', width=2)
                 )
@@ -362,11 +357,13 @@ class Visualization:
                 x_numeric = pd.to_numeric(pd.to_datetime(df[date_column]))
                 slope, intercept, r_value, p_value, std_err = stats.linregress(x_numeric, df[value_column])
                 
-                trend_line = slope * x_numeric + intercept
+                # Doğru iki uç noktayla çizilir (regresyon tüm veriyle hesaplanır)
+                ends = [x_numeric.iloc[0], x_numeric.iloc[-1]]
+                trend_line = [slope * value + intercept for value in ends]
                 
                 fig.add_trace(
                     go.Scatter(
-                        x=df[date_column],
+                        x=[df[date_column].iloc[0], df[date_column].iloc[-1]],
                         y=trend_line,
                         mode='lines',
                         name=f'Trend Çizgisi (R²={r_value**2:.3f})',
@@ -387,6 +384,7 @@ class Visualization:
             st.error(f"Trend grafiği hatası: {str(e)}")
             return self.create_empty_chart("Grafik oluşturulamadı")
     
+    @figure_cache.cached("heatmap")
     def create_heatmap(self, data, x_column, y_column, value_column, title="Isı Haritası"):
         """Isı haritası oluştur"""
         try:
@@ -431,6 +429,7 @@ class Visualization:
             st.error(f"Isı haritası hatası: {str(e)}")
             return self.create_empty_chart("Grafik oluşturulamadı")
     
+    @figure_cache.cached("gauge")
     def create_gauge_chart(self, value, max_value, title="Gösterge", unit=""):
         """Gösterge grafiği oluştur"""
         try: